@@ -0,0 +1,4 @@
+"""Performance benchmarks of the data providers.
+
+Run them with ``python -m benchmarks`` or ``pytest benchmarks``.
+"""
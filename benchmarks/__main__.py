@@ -0,0 +1,122 @@
+"""Command line interface of the benchmark suite.
+
+Usage::
+
+    python -m benchmarks --locales en,ru --save baseline.json
+    python -m benchmarks --locales en,ru --compare baseline.json
+"""
+
+import argparse
+import sys
+import typing as t
+
+from benchmarks.suite import (
+    Case,
+    compare,
+    discover,
+    load_baseline,
+    run,
+    save_baseline,
+)
+from mimesis.locales import Locale
+
+
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark every public method of the mimesis providers.",
+    )
+    parser.add_argument(
+        "--locales",
+        help="Comma-separated locales of locale-dependent providers (default: all).",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        dest="pattern",
+        help="Only run the cases which names contain this substring.",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=0.05,
+        help="Minimum timing duration of each case, in seconds (default: 0.05).",
+    )
+    parser.add_argument(
+        "--save",
+        metavar="PATH",
+        help="Save the results as a baseline.",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare the results with a baseline and fail on regressions.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown which is considered a regression (default: 0.2).",
+    )
+    parser.add_argument(
+        "--no-import",
+        action="store_true",
+        help="Do not measure the import time.",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not print the results."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    locales = None
+    if args.locales:
+        locales = [Locale(code.strip()) for code in args.locales.split(",")]
+
+    cases = discover(locales, args.pattern)
+    total = len(cases)
+    counter = iter(range(1, total + 1))
+
+    def progress(case: Case) -> None:
+        if not args.quiet:
+            print(f"[{next(counter)}/{total}] {case.name}", file=sys.stderr)
+
+    report = run(
+        cases,
+        duration=args.duration,
+        import_time=not args.no_import,
+        progress=progress,
+    )
+
+    if not args.quiet:
+        if report.import_time is not None:
+            print(f"import mimesis: {report.import_time * 1000:.1f} ms")
+        for key, (first, again) in report.instantiation.items():
+            print(f"{key}(): {first * 1000:.3f} ms, then {again * 1000:.3f} ms")
+        for name, result in report.results.items():
+            print(
+                f"{name}: {result.ops:,.0f} ops/sec, "
+                f"{result.allocated:,.0f} B allocated, "
+                f"{result.blocks:.2f} blocks retained"
+            )
+    for name, error in report.errors.items():
+        print(f"{name}: {error}", file=sys.stderr)
+
+    if args.save:
+        save_baseline(report, args.save)
+
+    status = 1 if report.errors else 0
+    if args.compare:
+        regressions = compare(report, load_baseline(args.compare), args.threshold)
+        for name, ratio in regressions:
+            print(f"REGRESSION {name}: {ratio:.2f}x slower", file=sys.stderr)
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+import typing as t
+
+import pytest
+
+from benchmarks.suite import (
+    Report,
+    discover,
+    load_baseline,
+    measure_import,
+    save_baseline,
+)
+from mimesis.locales import Locale
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks", "mimesis benchmarks")
+    group.addoption(
+        "--bench-locales",
+        help="Comma-separated locales of locale-dependent providers (default: all).",
+    )
+    group.addoption(
+        "--bench-duration",
+        type=float,
+        default=0.05,
+        help="Minimum timing duration of each case, in seconds (default: 0.05).",
+    )
+    group.addoption("--bench-save", metavar="PATH", help="Save a baseline.")
+    group.addoption(
+        "--bench-compare",
+        metavar="PATH",
+        help="Fail the cases which regressed compared to a baseline.",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown which is considered a regression (default: 0.2).",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "case" in metafunc.fixturenames:
+        option = metafunc.config.getoption("--bench-locales")
+        locales = None
+        if option:
+            locales = [Locale(code.strip()) for code in option.split(",")]
+        cases = discover(locales)
+        metafunc.parametrize("case", cases, ids=[case.name for case in cases])
+
+
+@pytest.fixture(scope="session")
+def report(request: pytest.FixtureRequest) -> t.Iterator[Report]:
+    report = Report()
+    yield report
+    path = request.config.getoption("--bench-save")
+    if path:
+        save_baseline(report, path)
+
+
+@pytest.fixture(scope="session")
+def baseline(request: pytest.FixtureRequest) -> Report | None:
+    path = request.config.getoption("--bench-compare")
+    return load_baseline(path) if path else None
+
+
+@pytest.fixture(scope="session")
+def import_time(report: Report) -> float:
+    report.import_time = measure_import()
+    return report.import_time
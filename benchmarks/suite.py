@@ -0,0 +1,414 @@
+"""Benchmark suite which covers every public method of the data providers.
+
+Cases are discovered automatically: every public method of every provider
+listed in :data:`~mimesis.providers.generic.DEFAULT_PROVIDERS` and of every
+builtin provider is benchmarked. Locale-dependent providers are benchmarked
+for all the supported locales.
+
+Everything runs offline and uses only the standard library.
+"""
+
+import datetime
+import gc
+import inspect
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+import typing as t
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from mimesis import builtins, providers
+from mimesis.enums import VideoFile
+from mimesis.locales import Locale
+from mimesis.providers.base import BaseDataProvider, BaseProvider, BatchMethod
+from mimesis.providers.generic import DEFAULT_PROVIDERS
+
+__all__ = [
+    "Case",
+    "Result",
+    "Report",
+    "discover",
+    "measure",
+    "measure_import",
+    "run",
+    "compare",
+    "load_baseline",
+    "save_baseline",
+]
+
+#: Seed which is used for all the benchmarked providers.
+SEED: t.Final[int] = 0xF00D
+
+#: Format version of the saved baselines.
+BASELINE_VERSION: t.Final[int] = 1
+
+#: Names of the methods which are a part of the provider API
+#: and do not generate any data.
+_API_METHODS: t.Final[frozenset[str]] = frozenset(
+    name for name in dir(BaseDataProvider) if not name.startswith("_")
+)
+
+#: Arguments for the methods which cannot be called without them.
+_ARGUMENTS: t.Final[dict[str, tuple[tuple[t.Any, ...], dict[str, t.Any]]]] = {
+    "BinaryFile.stream": ((), {"file_type": VideoFile.MP4}),
+    "BinaryFile.view": ((), {"file_type": VideoFile.MP4}),
+    "Choice.choice": ((["a", "b", "c"],), {}),
+    "Datetime.bulk_create_datetimes": (
+        (datetime.datetime(2000, 1, 1), datetime.datetime(2000, 1, 2)),
+        {"hours": 1},
+    ),
+    "Datetime.bulk_create_datetime64": (
+        (datetime.datetime(2000, 1, 1), datetime.datetime(2000, 1, 2)),
+        {"hours": 1},
+    ),
+    "Datetime.datetime64": ((100,), {}),
+    "Datetime.iter_datetimes": (
+        (datetime.datetime(2000, 1, 1), datetime.datetime(2000, 1, 2)),
+        {"hours": 1},
+    ),
+}
+
+#: Methods which return iterators, so they are consumed in the benchmark.
+_ITERATORS: t.Final[frozenset[str]] = frozenset({"Datetime.iter_datetimes"})
+
+
+@dataclass(frozen=True)
+class Case:
+    """A single benchmark case: a method of a provider for a locale."""
+
+    provider: type[BaseProvider]
+    method: str
+    locale: Locale | None = None
+    args: tuple[t.Any, ...] = ()
+    kwargs: dict[str, t.Any] = field(default_factory=dict)
+
+    @property
+    def instance(self) -> str:
+        """Name of the benchmarked instance, e.g. ``Person[en]``."""
+        name = self.provider.__name__
+        if self.locale is not None:
+            name += f"[{self.locale.value}]"
+        return name
+
+    @property
+    def name(self) -> str:
+        """Unique name of the case, e.g. ``Person.name[en]``."""
+        name = f"{self.provider.__name__}.{self.method}"
+        if self.locale is not None:
+            name += f"[{self.locale.value}]"
+        return name
+
+    def instantiate(self) -> BaseProvider:
+        """Create a seeded instance of the provider."""
+        if self.locale is not None:
+            return self.provider(locale=self.locale, seed=SEED)  # type: ignore
+        return self.provider(seed=SEED)
+
+    def bind(self) -> t.Callable[[], t.Any]:
+        """Get the benchmarked callable which takes no arguments."""
+        method = getattr(self.instantiate(), self.method)
+        args, kwargs = self.args, self.kwargs
+        if f"{self.provider.__name__}.{self.method}" in _ITERATORS:
+            return lambda: list(method(*args, **kwargs))
+        if not args and not kwargs:
+            return t.cast(t.Callable[[], t.Any], method)
+        return lambda: method(*args, **kwargs)
+
+
+@dataclass
+class Result:
+    """Measurements of a single case.
+
+    :param ops: Calls per second.
+    :param allocated: Peak of memory allocated by a single call, in bytes.
+    :param blocks: Memory blocks which are still allocated after a call.
+    """
+
+    ops: float
+    allocated: float
+    blocks: float
+
+
+@dataclass
+class Report:
+    """Results of a benchmark run."""
+
+    results: dict[str, Result] = field(default_factory=dict)
+    #: Time of ``import mimesis`` in a fresh interpreter, in seconds.
+    import_time: float | None = None
+    #: Time of the first and subsequent instantiation of the providers
+    #: (keyed by ``Provider[locale]``), in seconds.
+    instantiation: dict[str, tuple[float, float]] = field(default_factory=dict)
+    #: Cases which raised an exception, with the error message.
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, t.Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        return {
+            "version": BASELINE_VERSION,
+            "python": sys.version.split()[0],
+            "import_time": self.import_time,
+            "instantiation": {k: list(v) for k, v in self.instantiation.items()},
+            "results": {k: asdict(v) for k, v in self.results.items()},
+            "errors": self.errors,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, t.Any]) -> "Report":
+        """Create a report from the output of :meth:`as_dict`."""
+        if data.get("version") != BASELINE_VERSION:
+            raise ValueError("Unsupported version of the baseline.")
+        return cls(
+            results={k: Result(**v) for k, v in data["results"].items()},
+            import_time=data["import_time"],
+            instantiation={k: tuple(v) for k, v in data["instantiation"].items()},
+            errors=data["errors"],
+        )
+
+
+def _public_methods(provider: type[BaseProvider]) -> list[str]:
+    """Get the names of public methods of the provider which generate data."""
+    names = []
+    for name in dir(provider):
+        if name.startswith("_") or name in _API_METHODS:
+            continue
+        attribute = inspect.getattr_static(provider, name)
+        if isinstance(attribute, BatchMethod) or callable(attribute):
+            names.append(name)
+    return names
+
+
+def _provider_classes() -> list[type[BaseProvider]]:
+    """Get the default providers and the builtin providers."""
+    classes: list[type[BaseProvider]] = []
+    for name in DEFAULT_PROVIDERS:
+        classes.append(getattr(providers, name))
+    for name in builtins.__all__:
+        classes.append(getattr(builtins, name))
+    return classes
+
+
+def _accepts_locale(provider: type[BaseProvider]) -> bool:
+    """Check whether the locale of the provider can be changed."""
+    if not issubclass(provider, BaseDataProvider):
+        return False
+    for parameter in inspect.signature(provider).parameters.values():
+        if parameter.name == "locale" or parameter.kind is parameter.VAR_KEYWORD:
+            return True
+    return False
+
+
+def discover(
+    locales: t.Iterable[Locale] | None = None,
+    pattern: str | None = None,
+) -> list[Case]:
+    """Discover the benchmark cases.
+
+    :param locales: Locales of the locale-dependent providers,
+        all the supported locales by default.
+    :param pattern: Only the cases which names contain this substring.
+    :return: List of cases.
+    """
+    selected = list(Locale) if locales is None else list(locales)
+    cases = []
+    for provider in _provider_classes():
+        variants: list[Locale | None] = [None]
+        if _accepts_locale(provider):
+            variants = list(selected)
+        for method in _public_methods(provider):
+            args, kwargs = _ARGUMENTS.get(f"{provider.__name__}.{method}", ((), {}))
+            for locale in variants:
+                case = Case(provider, method, locale, args, kwargs)
+                if pattern is None or pattern in case.name:
+                    cases.append(case)
+    return cases
+
+
+def _timeit(func: t.Callable[[], t.Any], number: int) -> float:
+    """Call the function a number of times with disabled GC.
+
+    :return: Elapsed time in seconds.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(
+    case: Case,
+    duration: float = 0.05,
+    repeat: int = 5,
+    samples: int = 20,
+) -> Result:
+    """Measure the case.
+
+    :param case: Benchmark case.
+    :param duration: Minimum duration of the timing, in seconds.
+    :param repeat: Number of timing loops, the best one is used.
+    :param samples: Number of calls traced to count the allocations.
+    :return: Measurements.
+    """
+    func = case.bind()
+    # Warm up caches (datasets, compiled patterns and so on).
+    func()
+
+    # Calibrate the number of calls in a loop, then take the best of
+    # several loops to reduce the noise, just like :py:mod:`timeit` does.
+    number = 1
+    while True:
+        elapsed = _timeit(func, number)
+        if elapsed >= duration / repeat:
+            break
+        number *= 2
+    for _ in range(repeat - 1):
+        elapsed = min(elapsed, _timeit(func, number))
+
+    blocks = sys.getallocatedblocks()
+    for _ in range(samples):
+        func()
+    blocks = sys.getallocatedblocks() - blocks
+
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - current
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        ops=number / elapsed,
+        allocated=allocated / samples,
+        blocks=max(blocks, 0) / samples,
+    )
+
+
+def measure_import(repeat: int = 5) -> float:
+    """Measure the time of ``import mimesis`` in a fresh interpreter.
+
+    :param repeat: Number of measurements, the best one is returned.
+    :return: Import time in seconds.
+    """
+    code = (
+        "import time; started = time.perf_counter(); import mimesis; "
+        "print(time.perf_counter() - started)"
+    )
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(float(output.stdout))
+    return min(timings)
+
+
+def measure_instantiation(case: Case) -> tuple[float, float]:
+    """Measure the instantiation time of the provider of the case.
+
+    :param case: Benchmark case.
+    :return: Time of the first and of a subsequent instantiation, in seconds.
+    """
+    started = time.perf_counter()
+    case.instantiate()
+    first = time.perf_counter() - started
+
+    started = time.perf_counter()
+    case.instantiate()
+    return first, time.perf_counter() - started
+
+
+def run(
+    cases: t.Iterable[Case],
+    duration: float = 0.05,
+    import_time: bool = True,
+    progress: t.Callable[[Case], None] | None = None,
+) -> Report:
+    """Run the benchmarks.
+
+    :param cases: Benchmark cases.
+    :param duration: Minimum duration of the timing of each case, in seconds.
+    :param import_time: Measure the import time.
+    :param progress: Called before each case is measured.
+    :return: Report.
+    """
+    report = Report()
+    if import_time:
+        report.import_time = measure_import()
+
+    for case in cases:
+        if progress is not None:
+            progress(case)
+        if case.instance not in report.instantiation:
+            report.instantiation[case.instance] = measure_instantiation(case)
+        try:
+            report.results[case.name] = measure(case, duration)
+        except Exception as e:
+            report.errors[case.name] = f"{type(e).__name__}: {e}"
+    return report
+
+
+def save_baseline(report: Report, path: str | Path) -> None:
+    """Save the report as a baseline.
+
+    :param report: Report.
+    :param path: Path of the JSON file.
+    """
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(report.as_dict(), fp, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str | Path) -> Report:
+    """Load a baseline saved by :func:`save_baseline`.
+
+    :param path: Path of the JSON file.
+    :return: Report.
+    """
+    with open(path, encoding="utf-8") as fp:
+        return Report.from_dict(json.load(fp))
+
+
+def compare(
+    report: Report,
+    baseline: Report,
+    threshold: float = 0.2,
+) -> list[tuple[str, float]]:
+    """Find the regressions of the report compared to the baseline.
+
+    Only the cases which are present in both reports are compared.
+
+    :param report: Current report.
+    :param baseline: Baseline report.
+    :param threshold: Relative slowdown which is considered a regression.
+    :return: Names of regressed cases (``import`` for the import time)
+        with the ratio of the current time to the baseline time.
+    """
+    regressions = []
+    if report.import_time is not None and baseline.import_time is not None:
+        ratio = report.import_time / baseline.import_time
+        if ratio > 1 + threshold:
+            regressions.append(("import", ratio))
+
+    for name, result in report.results.items():
+        if name not in baseline.results:
+            continue
+        ratio = baseline.results[name].ops / result.ops
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return sorted(regressions, key=lambda item: item[1], reverse=True)
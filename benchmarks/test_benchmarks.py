@@ -0,0 +1,36 @@
+import pytest
+
+from benchmarks.suite import Case, Report, measure, measure_instantiation
+
+
+def _check(name: str, ratio: float, threshold: float) -> None:
+    if ratio > 1 + threshold:
+        pytest.fail(f"{name} is {ratio:.2f}x slower than the baseline")
+
+
+def test_import(
+    import_time: float,
+    baseline: Report | None,
+    pytestconfig: pytest.Config,
+) -> None:
+    if baseline is not None and baseline.import_time is not None:
+        threshold = pytestconfig.getoption("--bench-threshold")
+        _check("import", import_time / baseline.import_time, threshold)
+
+
+def test_method(
+    case: Case,
+    report: Report,
+    baseline: Report | None,
+    pytestconfig: pytest.Config,
+) -> None:
+    if case.instance not in report.instantiation:
+        report.instantiation[case.instance] = measure_instantiation(case)
+
+    duration = pytestconfig.getoption("--bench-duration")
+    result = report.results[case.name] = measure(case, duration)
+
+    if baseline is not None and case.name in baseline.results:
+        threshold = pytestconfig.getoption("--bench-threshold")
+        ratio = baseline.results[case.name].ops / result.ops
+        _check(case.name, ratio, threshold)
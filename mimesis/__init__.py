@@ -37,6 +37,7 @@ from .enums import (
     VideoFile,
 )
 from .exceptions import (
+    FieldAmbiguityWarning,
     FieldArityError,
     FieldError,
     FieldNameError,
@@ -137,6 +138,7 @@ __all__ = [
     "SchemaError",
     "NonEnumerableError",
     "FieldError",
+    "FieldAmbiguityWarning",
     "FieldsetError",
     "FieldArityError",
     "FieldNameError",
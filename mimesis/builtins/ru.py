@@ -1,10 +1,12 @@
 """Specific data provider for Russia (ru)."""
 
+import typing as t
 from datetime import datetime
 
 from mimesis.enums import Gender
 from mimesis.locales import Locale
 from mimesis.providers import BaseDataProvider
+from mimesis.providers.base import choice_method
 from mimesis.types import MissingSeed, Seed
 
 __all__ = ["RussiaSpecProvider"]
@@ -35,6 +37,12 @@ class RussiaSpecProvider(BaseDataProvider):
         ]
         return " ".join(sentence)
 
+    def _patronymics(self, gender: Gender | None = None) -> t.Sequence[str]:
+        gender = self.validate_enum(gender, Gender)
+        patronymics: list[str] = self._extract(["patronymic", str(gender)])
+        return patronymics
+
+    @choice_method(_patronymics, gender=Gender)
     def patronymic(self, gender: Gender | None = None) -> str:
         """Generate random patronymic name.
 
@@ -44,9 +52,7 @@ class RussiaSpecProvider(BaseDataProvider):
         :Example:
             Алексеевна.
         """
-        gender = self.validate_enum(gender, Gender)
-        patronymics: list[str] = self._extract(["patronymic", str(gender)])
-        return self.random.choice(patronymics)
+        return self.random.choice(self._patronymics(gender))
 
     def passport_series(self, year: int | None = None) -> str:
         """Generate random series of passport.
@@ -1,8 +1,11 @@
 """Specific data provider for Ukraine (uk)."""
 
+import typing as t
+
 from mimesis.enums import Gender
 from mimesis.locales import Locale
 from mimesis.providers import BaseDataProvider
+from mimesis.providers.base import choice_method
 from mimesis.types import MissingSeed, Seed
 
 __all__ = ["UkraineSpecProvider"]
@@ -19,6 +22,12 @@ class UkraineSpecProvider(BaseDataProvider):
         name = "ukraine_provider"
         datafile = "builtin.json"
 
+    def _patronymics(self, gender: Gender | None = None) -> t.Sequence[str]:
+        gender = self.validate_enum(gender, Gender)
+        patronymics: list[str] = self._extract(["patronymic", str(gender)])
+        return patronymics
+
+    @choice_method(_patronymics, gender=Gender)
     def patronymic(self, gender: Gender | None = None) -> str:
         """Generate random patronymic name.
 
@@ -26,6 +35,4 @@ class UkraineSpecProvider(BaseDataProvider):
         :type gender: str or int
         :return: Patronymic name.
         """
-        gender = self.validate_enum(gender, Gender)
-        patronymics: list[str] = self._extract(["patronymic", str(gender)])
-        return self.random.choice(patronymics)
+        return self.random.choice(self._patronymics(gender))
@@ -1,6 +1,32 @@
 """Import optional dependencies only when needed."""
 
+import importlib
+import typing as t
+
 try:
     import pytz
 except ImportError:
     pytz = None  # type: ignore
+
+#: Optional dependencies which take a while to import, so they are
+#: imported on first access, e.g. ``compat.numpy``. The value is
+#: ``None`` if the dependency is not installed.
+_LAZY_MODULES: t.Final[dict[str, tuple[str, ...]]] = {
+    "numpy": ("numpy",),
+    "pyarrow": ("pyarrow", "pyarrow.parquet"),
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        modules = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = [importlib.import_module(module) for module in modules][0]
+    except ImportError:
+        module = None
+
+    globals()[name] = module
+    return module
@@ -1,15 +1,43 @@
-from .int.address import *
-from .int.code import *
-from .int.common import *
-from .int.datetime import *
-from .int.development import *
-from .int.file import *
-from .int.finance import *
-from .int.hardware import *
-from .int.internet import *
-from .int.path import *
-from .int.payment import *
-from .int.person import *
-from .int.scientific import *
-from .int.text import *
-from .int.transport import *
+"""Datasets which are used by the data providers.
+
+The locale-independent datasets (see :mod:`mimesis.datasets.int`) are
+loaded lazily, on the first access to them.
+"""
+
+import typing as t
+
+from mimesis.datasets import int as _int
+
+if t.TYPE_CHECKING:
+    from mimesis.datasets.int.address import *
+    from mimesis.datasets.int.code import *
+    from mimesis.datasets.int.common import *
+    from mimesis.datasets.int.cryptographic import *
+    from mimesis.datasets.int.datetime import *
+    from mimesis.datasets.int.development import *
+    from mimesis.datasets.int.file import *
+    from mimesis.datasets.int.finance import *
+    from mimesis.datasets.int.hardware import *
+    from mimesis.datasets.int.internet import *
+    from mimesis.datasets.int.path import *
+    from mimesis.datasets.int.payment import *
+    from mimesis.datasets.int.person import *
+    from mimesis.datasets.int.scientific import *
+    from mimesis.datasets.int.text import *
+    from mimesis.datasets.int.transport import *
+
+__all__ = list(_int._DATASETS)
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _int._DATASETS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_int, name)
+    # Cache the value, so the next access does not call this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_int._DATASETS})
@@ -0,0 +1,19 @@
+"""Compiles JSON datasets, see :mod:`mimesis.datasets.compiler`."""
+
+import argparse
+from pathlib import Path
+
+from mimesis.constants import DATADIR
+from mimesis.datasets.compiler import compile_datasets
+
+if __name__ == "__main__":  # pragma: no cover
+    parser = argparse.ArgumentParser(prog="python -m mimesis.datasets")
+    parser.add_argument("datadir", nargs="?", type=Path, default=DATADIR)
+    parser.add_argument(
+        "--release",
+        action="store_true",
+        help="trust the compiled datasets regardless of modification times",
+    )
+    args = parser.parse_args()
+    for path in compile_datasets(args.datadir, release=args.release):
+        print(path.relative_to(args.datadir))
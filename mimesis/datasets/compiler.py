@@ -0,0 +1,213 @@
+"""Compiles JSON datasets into a binary format with lazy per-key loading.
+
+JSON files remain the source of truth. A compiled dataset is stored next to
+its source (``en/text.json`` -> ``en/text.bin``) and consists of a header,
+an index of top-level keys and the values of these keys, each encoded as
+a separate JSON document. The file is memory-mapped, so only the keys which
+are actually used are decoded. The format doesn't depend on the version
+of Python, so the same files are used by every interpreter.
+
+The header stores the size, the modification time and the digest of the
+source. A compiled dataset is used only while the size matches. If the
+modification time differs, the source is hashed and compared with the digest.
+Release builds compile the datasets with ``release=True``. Their sources
+are not edited after installation, so the digest stored at build time is
+trusted without hashing the source again, even though installing
+the package changes modification times.
+
+To compile the datasets run::
+
+    python -m mimesis.datasets [--release] [datadir]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import typing as t
+from pathlib import Path
+
+from mimesis.constants import DATADIR
+
+__all__ = [
+    "CompiledDataset",
+    "compile_dataset",
+    "compile_datasets",
+    "read_dataset",
+]
+
+_MAGIC: t.Final[bytes] = b"MMDS"
+_FORMAT_VERSION: t.Final[int] = 3
+
+#: Flag of the datasets compiled for a release.
+_RELEASE: t.Final[int] = 1
+
+#: Magic, format version, flags, size, mtime and digest
+#: of the source file and the size of the index.
+_HEADER: t.Final[struct.Struct] = struct.Struct("<4sBBQQ16sI")
+
+_SUFFIX: t.Final[str] = ".bin"
+
+
+class CompiledDataset(t.Mapping[str, t.Any]):
+    """A read-only mapping over a memory-mapped compiled dataset.
+
+    Values are decoded on first access and then kept in memory.
+    """
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+        index: dict[str, tuple[int, int]],
+        offset: int,
+    ) -> None:
+        """Initialize attributes.
+
+        :param buffer: Memory-mapped file.
+        :param index: Offsets and sizes of values by keys.
+        :param offset: Offset of the first value in the file.
+        """
+        self._buffer = buffer
+        self._index = index
+        self._offset = offset
+        self._values: dict[str, t.Any] = {}
+
+    def __getitem__(self, key: str) -> t.Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            start, size = self._index[key]
+            start += self._offset
+            value = json.loads(self._buffer[start : start + size])
+            return self._values.setdefault(key, value)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # Memory maps cannot be pickled or copied, so we use a plain dict.
+        return dict, (dict(self),)
+
+
+def _compiled_path(source: Path) -> Path:
+    return source.with_suffix(_SUFFIX)
+
+
+def _digest(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _encode(value: t.Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def compile_dataset(source: Path, release: bool = False) -> Path:
+    """Compiles a JSON dataset and saves it next to the source.
+
+    :param source: Path to the JSON file.
+    :param release: Trust the compiled dataset while the size of
+        the source matches, regardless of its modification time.
+    :return: Path to the compiled dataset.
+    :raises TypeError: If the top-level object of the file is not a dict.
+    """
+    content = source.read_bytes()
+    data = json.loads(content.decode("utf8"))
+
+    if not isinstance(data, dict):
+        raise TypeError("The top-level object of the dataset must be a dict.")
+
+    index: dict[str, tuple[int, int]] = {}
+    values = []
+    offset = 0
+    for key, value in data.items():
+        chunk = _encode(value)
+        index[key] = (offset, len(chunk))
+        values.append(chunk)
+        offset += len(chunk)
+
+    raw_index = _encode(index)
+    stat = source.stat()
+    header = _HEADER.pack(
+        _MAGIC,
+        _FORMAT_VERSION,
+        _RELEASE if release else 0,
+        stat.st_size,
+        stat.st_mtime_ns,
+        _digest(content),
+        len(raw_index),
+    )
+
+    target = _compiled_path(source)
+    # Write to a temporary file first, so readers never see a partial file.
+    temp = target.with_suffix(_SUFFIX + ".tmp")
+    temp.write_bytes(b"".join([header, raw_index, *values]))
+    os.replace(temp, target)
+    return target
+
+
+def compile_datasets(datadir: Path = DATADIR, release: bool = False) -> list[Path]:
+    """Compiles all JSON datasets of all locales in the given directory.
+
+    :param datadir: Directory with locales.
+    :param release: See :func:`compile_dataset`.
+    :return: Paths to the compiled datasets.
+    """
+    sources = sorted(datadir.glob("*/*.json"))
+    return [compile_dataset(source, release) for source in sources]
+
+
+def _open_compiled(source: Path) -> CompiledDataset | None:
+    stat = source.stat()
+
+    try:
+        with open(_compiled_path(source), "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < _HEADER.size:
+        buffer.close()
+        return None
+
+    magic, version, flags, size, mtime, digest, index_size = _HEADER.unpack_from(buffer)
+
+    if (
+        magic != _MAGIC
+        or version != _FORMAT_VERSION
+        or size != stat.st_size
+        or (
+            not flags & _RELEASE
+            and mtime != stat.st_mtime_ns
+            and digest != _digest(source.read_bytes())
+        )
+    ):
+        # The compiled dataset is outdated or broken.
+        buffer.close()
+        return None
+
+    offset = _HEADER.size + index_size
+    index = json.loads(buffer[_HEADER.size : offset])
+    return CompiledDataset(buffer, index, offset)
+
+
+def read_dataset(source: Path) -> t.Mapping[str, t.Any]:
+    """Reads a dataset, preferring its compiled version if it is up-to-date.
+
+    :param source: Path to the JSON file.
+    :return: Dataset.
+    :raises FileNotFoundError: If the JSON file was not found.
+    """
+    compiled = _open_compiled(source)
+    if compiled is not None:
+        return compiled
+
+    with open(source, encoding="utf8") as f:
+        data: dict[str, t.Any] = json.load(f)
+    return data
@@ -1,17 +1,121 @@
-"""Here you can see data that used in all locales."""
-
-from .address import *
-from .code import *
-from .common import *
-from .datetime import *
-from .development import *
-from .file import *
-from .finance import *
-from .hardware import *
-from .internet import *
-from .path import *
-from .payment import *
-from .person import *
-from .scientific import *
-from .text import *
-from .transport import *
+"""Here you can see data that used in all locales.
+
+The datasets are defined in the submodules of this package. A submodule is
+imported on the first access to any of its datasets, so ``import mimesis``
+does not pay for the datasets which are never used.
+"""
+
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .address import *
+    from .code import *
+    from .common import *
+    from .cryptographic import *
+    from .datetime import *
+    from .development import *
+    from .file import *
+    from .finance import *
+    from .hardware import *
+    from .internet import *
+    from .path import *
+    from .payment import *
+    from .person import *
+    from .scientific import *
+    from .text import *
+    from .transport import *
+
+#: Names of the datasets mapped to the submodules which define them.
+_DATASETS: t.Final[dict[str, str]] = {
+    "COUNTRY_CODES": "address",
+    "SHORTENED_ADDRESS_FMT": "address",
+    "CONTINENT_CODES": "address",
+    "CALLING_CODES": "address",
+    "IATA_CODES": "address",
+    "ICAO_CODES": "address",
+    "IMEI_TACS": "code",
+    "ISBN_GROUPS": "code",
+    "ISBN_MASKS": "code",
+    "EAN_MASKS": "code",
+    "LOCALE_CODES": "code",
+    "COMMON_LETTERS": "common",
+    "ROMANIZATION_DICT": "common",
+    "WORDLIST": "cryptographic",
+    "ROMAN_NUMS": "datetime",
+    "TIMEZONES": "datetime",
+    "GMT_OFFSETS": "datetime",
+    "DATETIME_LOCALES": "datetime",
+    "LICENSES": "development",
+    "PROGRAMMING_LANGS": "development",
+    "OS": "development",
+    "FOLDERS": "development",
+    "PROJECT_NAMES": "development",
+    "SYSTEM_QUALITY_ATTRIBUTES": "development",
+    "STAGES": "development",
+    "EXTENSIONS": "file",
+    "MIME_TYPES": "file",
+    "FILENAMES": "file",
+    "CURRENCY_ISO_CODES": "finance",
+    "CRYPTOCURRENCY_ISO_CODES": "finance",
+    "CURRENCY_SYMBOLS": "finance",
+    "CRYPTOCURRENCY_SYMBOLS": "finance",
+    "STOCK_EXCHANGES": "finance",
+    "STOCK_TICKERS": "finance",
+    "STOCK_NAMES": "finance",
+    "RESOLUTIONS": "hardware",
+    "SCREEN_SIZES": "hardware",
+    "CPU": "hardware",
+    "RAM_TYPES": "hardware",
+    "RAM_SIZES": "hardware",
+    "GENERATION": "hardware",
+    "CPU_CODENAMES": "hardware",
+    "HDD_SSD_MANUFACTURERS": "hardware",
+    "HDD_SSD": "hardware",
+    "GRAPHICS": "hardware",
+    "MANUFACTURERS": "hardware",
+    "PHONE_MODELS": "hardware",
+    "HTTP_METHODS": "internet",
+    "HTTP_STATUS_CODES": "internet",
+    "HTTP_STATUS_MSGS": "internet",
+    "TLD": "internet",
+    "EMAIL_DOMAINS": "internet",
+    "USER_AGENTS": "internet",
+    "PUBLIC_DNS": "internet",
+    "CONTENT_ENCODING_DIRECTIVES": "internet",
+    "CORS_RESOURCE_POLICIES": "internet",
+    "CORS_OPENER_POLICIES": "internet",
+    "HTTP_SERVERS": "internet",
+    "PLATFORMS": "path",
+    "CREDIT_CARD_NETWORKS": "payment",
+    "BLOOD_GROUPS": "person",
+    "GENDER_SYMBOLS": "person",
+    "GENDER_CODES": "person",
+    "USERNAMES": "person",
+    "SI_PREFIXES": "scientific",
+    "SI_PREFIXES_SYM": "scientific",
+    "SAFE_COLORS": "text",
+    "CARS": "transport",
+    "AIRPLANES": "transport",
+    "VR_CODES": "transport",
+    "VRC_BY_LOCALES": "transport",
+    "AUTO_MANUFACTURERS": "transport",
+}
+
+__all__ = list(_DATASETS)
+
+
+def __getattr__(name: str) -> t.Any:
+    try:
+        module = _DATASETS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache the value, so the next access does not call this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_DATASETS})
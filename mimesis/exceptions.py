@@ -67,6 +67,10 @@ class FieldError(ValueError):
         return self.message.format(self.name)
 
 
+class FieldAmbiguityWarning(UserWarning):
+    """Issued when a field name matches methods of several providers."""
+
+
 class FieldsetError(ValueError):
     """Raised when a resulting fieldset is empty."""
 
@@ -7,7 +7,7 @@ field is returned to the caller.
 
 from typing import Any, Callable
 
-from mimesis.datasets import COMMON_LETTERS, ROMANIZATION_DICT
+from mimesis import datasets
 from mimesis.locales import Locale, validate_locale
 from mimesis.random import Random
 
@@ -31,7 +31,9 @@ def romanize(locale: Locale) -> Callable[[str], str]:
     if locale not in (Locale.RU, Locale.UK, Locale.KK):
         raise ValueError(f"Romanization is not available for: {locale}")
 
-    table = str.maketrans({**ROMANIZATION_DICT[locale.value], **COMMON_LETTERS})
+    table = str.maketrans(
+        {**datasets.ROMANIZATION_DICT[locale.value], **datasets.COMMON_LETTERS}
+    )
 
     def key(string: str) -> str:
         """Romanize a given string in the specified locale.
@@ -55,14 +57,15 @@ def maybe(value: Any, probability: float = 0.5) -> Callable[[Any, Random], Any]:
     :return: A closure that takes two arguments.
     """
 
+    value_weight = 1 - probability
+    # The same as random.choices([result, value], [value_weight, probability]),
+    # but without preparing the weights for each value.
+    total = value_weight + probability
+
     def key(result: Any, random: Random) -> Any:
         if 0 < probability <= 1:
-            value_weight = 1 - probability
-            (result,) = random.choices(
-                population=[result, value],
-                weights=[value_weight, probability],
-                k=1,
-            )
+            if random.random() * total >= value_weight:
+                return value
         return result
 
     return key
@@ -6,16 +6,9 @@ data related to location, such as street name, city etc.
 
 import typing as t
 
-from mimesis.datasets import (
-    CALLING_CODES,
-    CONTINENT_CODES,
-    COUNTRY_CODES,
-    IATA_CODES,
-    ICAO_CODES,
-    SHORTENED_ADDRESS_FMT,
-)
+from mimesis import datasets
 from mimesis.enums import CountryCode
-from mimesis.providers.base import BaseDataProvider
+from mimesis.providers.base import BaseDataProvider, choice_method
 
 __all__ = ["Address"]
 
@@ -62,21 +55,29 @@ class Address(BaseDataProvider):
         """
         return str(self.random.randint(1, maximum))
 
+    def _street_names(self) -> t.Sequence[str]:
+        street_names: list[str] = self._extract(["street", "name"])
+        return street_names
+
+    @choice_method(_street_names)
     def street_name(self) -> str:
         """Generates a random street name.
 
         :return: Street name.
         """
-        street_names: list[str] = self._extract(["street", "name"])
-        return self.random.choice(street_names)
+        return self.random.choice(self._street_names())
+
+    def _street_suffixes(self) -> t.Sequence[str]:
+        suffixes: list[str] = self._extract(["street", "suffix"])
+        return suffixes
 
+    @choice_method(_street_suffixes)
     def street_suffix(self) -> str:
         """Generates a random street suffix.
 
         :return: Street suffix.
         """
-        suffixes: list[str] = self._extract(["street", "suffix"])
-        return self.random.choice(suffixes)
+        return self.random.choice(self._street_suffixes())
 
     def address(self) -> str:
         """Generates a random full address.
@@ -88,7 +89,7 @@ class Address(BaseDataProvider):
         st_num = self.street_number()
         st_name = self.street_name()
 
-        if self.locale in SHORTENED_ADDRESS_FMT:
+        if self.locale in datasets.SHORTENED_ADDRESS_FMT:
             return fmt.format(
                 st_num=st_num,
                 st_name=st_name,
@@ -108,15 +109,19 @@ class Address(BaseDataProvider):
             st_sfx=self.street_suffix(),
         )
 
+    def _states(self, abbr: bool = False) -> t.Sequence[str]:
+        key = "abbr" if abbr else "name"
+        states: list[str] = self._extract(["state", key])
+        return states
+
+    @choice_method(_states)
     def state(self, abbr: bool = False) -> str:
         """Generates a random administrative district of the country.
 
         :param abbr: Return ISO 3166-2 code.
         :return: Administrative district.
         """
-        key = "abbr" if abbr else "name"
-        states: list[str] = self._extract(["state", key])
-        return self.random.choice(states)
+        return self.random.choice(self._states(abbr))
 
     def region(self, *args: t.Any, **kwargs: t.Any) -> str:
         """Generates a random region.
@@ -162,6 +167,13 @@ class Address(BaseDataProvider):
         """
         return self.postal_code()
 
+    def _country_codes(
+        self, code: CountryCode | None = CountryCode.A2
+    ) -> t.Sequence[str]:
+        key = self.validate_enum(code, CountryCode)
+        return datasets.COUNTRY_CODES[key]
+
+    @choice_method(_country_codes, code=CountryCode)
     def country_code(self, code: CountryCode | None = CountryCode.A2) -> str:
         """Generates a random code of country.
 
@@ -172,8 +184,7 @@ class Address(BaseDataProvider):
         :return: Country code in selected format.
         :raises KeyError: if fmt is not supported.
         """
-        key = self.validate_enum(code, CountryCode)
-        return self.random.choice(COUNTRY_CODES[key])
+        return self.random.choice(self._country_codes(code))
 
     def country_emoji_flag(self) -> str:
         """Generates a randomly chosen country emoji flag.
@@ -200,21 +211,29 @@ class Address(BaseDataProvider):
         country: str = self._extract(["country", "current_locale"])
         return country
 
+    def _countries(self) -> t.Sequence[str]:
+        countries: list[str] = self._extract(["country", "name"])
+        return countries
+
+    @choice_method(_countries)
     def country(self) -> str:
         """Generates a random country.
 
         :return: The Country.
         """
-        countries: list[str] = self._extract(["country", "name"])
-        return self.random.choice(countries)
+        return self.random.choice(self._countries())
+
+    def _cities(self) -> t.Sequence[str]:
+        cities: list[str] = self._extract(["city"])
+        return cities
 
+    @choice_method(_cities)
     def city(self) -> str:
         """Generates a random city.
 
         :return: City name.
         """
-        cities: list[str] = self._extract(["city"])
-        return self.random.choice(cities)
+        return self.random.choice(self._cities())
 
     def _get_fs(self, key: str, dms: bool = False) -> str | float:
         """Get float number.
@@ -259,25 +278,33 @@ class Address(BaseDataProvider):
             "latitude": self._get_fs("lt", dms),
         }
 
+    def _continents(self, code: bool = False) -> t.Sequence[str]:
+        codes: list[str] = self._extract(["continent"])
+
+        if code:
+            codes = datasets.CONTINENT_CODES
+
+        return codes
+
+    @choice_method(_continents)
     def continent(self, code: bool = False) -> str:
         """Returns a random continent name or continent code.
 
         :param code: Return code of a continent.
         :return: Continent name.
         """
-        codes: list[str] = self._extract(["continent"])
+        return self.random.choice(self._continents(code))
 
-        if code:
-            codes = CONTINENT_CODES
-
-        return self.random.choice(codes)
+    def _calling_codes(self) -> t.Sequence[str]:
+        return datasets.CALLING_CODES
 
+    @choice_method(_calling_codes)
     def calling_code(self) -> str:
         """Generates a random calling code of random country.
 
         :return: Calling code.
         """
-        return self.random.choice(CALLING_CODES)
+        return self.random.choice(self._calling_codes())
 
     def isd_code(self) -> str:
         """Generates a random ISD code.
@@ -286,16 +313,24 @@ class Address(BaseDataProvider):
         """
         return self.calling_code()
 
+    def _iata_codes(self) -> t.Sequence[str]:
+        return datasets.IATA_CODES
+
+    @choice_method(_iata_codes)
     def iata_code(self) -> str:
         """Generates a random IATA code.
 
         :return: IATA code.
         """
-        return self.random.choice(IATA_CODES)
+        return self.random.choice(self._iata_codes())
+
+    def _icao_codes(self) -> t.Sequence[str]:
+        return datasets.ICAO_CODES
 
+    @choice_method(_icao_codes)
     def icao_code(self) -> str:
         """Generates a random ICAO code.
 
         :return: ICAO code.
         """
-        return self.random.choice(ICAO_CODES)
+        return self.random.choice(self._icao_codes())
@@ -1,18 +1,304 @@
 """Base data provider."""
 
 import contextlib
+import copy
+import functools
+import inspect
 import json
 import operator
 import typing as t
 from functools import reduce
+from pathlib import Path
 
 from mimesis import random as _random
 from mimesis.constants import DATADIR, LOCALE_SEP
+from mimesis.datasets.compiler import read_dataset
 from mimesis.exceptions import NonEnumerableError
 from mimesis.locales import Locale, validate_locale
-from mimesis.types import JSON, MissingSeed, Seed
+from mimesis.types import JSON, Categorical, MissingSeed, Seed
 
-__all__ = ["BaseDataProvider", "BaseProvider"]
+__all__ = [
+    "BaseDataProvider",
+    "BaseProvider",
+    "BatchMethod",
+    "BoundBatchMethod",
+    "batch_method",
+    "choice_method",
+]
+
+P = t.ParamSpec("P")
+T = t.TypeVar("T")
+ProviderT = t.TypeVar("ProviderT", bound="BaseProvider")
+
+#: Parsed datasets shared by all data providers of the process,
+#: keyed by ``(datadir, locale, datafile)``. These dicts are shared
+#: between instances, so they must never be updated in place.
+_DATASETS: dict[tuple[Path, str, str], t.Mapping[str, t.Any]] = {}
+
+
+def _copy_attributes(target: t.Any, source: t.Callable[..., t.Any]) -> None:
+    # Unlike functools.update_wrapper(), this doesn't set ``__wrapped__``,
+    # otherwise inspect.signature() would also include ``self``.
+    for attr in functools.WRAPPER_ASSIGNMENTS:
+        setattr(target, attr, getattr(source, attr))
+
+
+class BoundBatchMethod(functools.partial[T], t.Generic[P, T]):
+    """A :class:`BatchMethod` bound to a provider."""
+
+    __name__: str
+    batch: t.Callable[t.Concatenate[int, P], list[T]]
+    codes: t.Callable[t.Concatenate[int, P], Categorical] | None
+
+    if t.TYPE_CHECKING:
+
+        def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+            ...
+
+    def __reduce__(self) -> tuple[t.Any, ...]:
+        # Bound methods are pickled by reference to the provider.
+        provider = self.args[0]
+        return getattr, (provider, self.__name__)
+
+
+class BatchMethod(t.Generic[P, T]):
+    """A provider method which can also generate values in bulk.
+
+    It works like a regular method, but also provides a method
+    ``batch(n, *args, **kwargs)``, which generates ``n`` values at once:
+
+        >>> from mimesis import Person
+        >>> from mimesis.enums import Gender
+        >>> person = Person()
+        >>> person.name.batch(3, gender=Gender.MALE)
+        ['Colby', 'Efren', 'Tod']
+
+    Methods which choose values from a fixed list also provide a method
+    ``codes(n, *args, **kwargs)``, which generates the same values
+    dictionary-encoded, as :class:`~mimesis.types.Categorical`:
+
+        >>> person.blood_type.codes(3)
+        Categorical(codes=[4, 0, 4], categories=['O+', 'A+', ...])
+
+    Otherwise, ``codes`` is ``None``.
+
+    Bound methods are cached in the instance, so accessing
+    them costs about the same as accessing regular methods.
+    They aren't cached when a subclass overrides the method,
+    so calling it with :func:`super` doesn't hide the override.
+    """
+
+    def __init__(
+        self,
+        method: t.Callable[t.Concatenate[t.Any, P], T],
+        batch: t.Callable[t.Concatenate[t.Any, int, P], list[T]],
+        codes: t.Callable[t.Concatenate[t.Any, int, P], Categorical] | None = None,
+    ) -> None:
+        """Initialize attributes.
+
+        :param method: Function which generates a single value.
+        :param batch: Function which generates a list of ``n`` values.
+        :param codes: Function which generates ``n`` dictionary-encoded
+            values, if values are chosen from a fixed list.
+        """
+        self._method = method
+        self._batch = batch
+        self._codes = codes
+        self._name = method.__name__
+        _copy_attributes(self, method)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __call__(self, instance: t.Any, *args: P.args, **kwargs: P.kwargs) -> T:
+        # Allows calling the method on the class, e.g. ``Person.name(person)``.
+        return self._method(instance, *args, **kwargs)
+
+    @property
+    def __signature__(self) -> inspect.Signature:
+        return inspect.signature(self._method)
+
+    @t.overload
+    def __get__(self, instance: None, owner: type | None = None) -> "BatchMethod[P, T]":
+        ...
+
+    @t.overload
+    def __get__(
+        self, instance: t.Any, owner: type | None = None
+    ) -> BoundBatchMethod[P, T]:
+        ...
+
+    def __get__(
+        self, instance: t.Any, owner: type | None = None
+    ) -> "BatchMethod[P, T] | BoundBatchMethod[P, T]":
+        if instance is None:
+            return self
+
+        bound: BoundBatchMethod[P, T] = BoundBatchMethod(self._method, instance)
+        bound.batch = functools.partial(self._batch, instance)
+        bound.codes = None
+        if self._codes is not None:
+            bound.codes = functools.partial(self._codes, instance)
+        _copy_attributes(bound, self._method)
+        if inspect.getattr_static(type(instance), self._name, None) is self:
+            # It is a non-data descriptor, so the instance
+            # attribute takes precedence from now on.
+            instance.__dict__[self._name] = bound
+        return bound
+
+
+@functools.cache
+def _enum_values(enum: t.Any) -> tuple[t.Any, ...]:
+    """Get the values of the members of an enum, in the order of the members."""
+    return tuple(member.value for member in _random._enum_members(enum))
+
+
+def _choice_method(
+    population: t.Callable[t.Concatenate[t.Any, P], t.Sequence[T]],
+    method: t.Callable[t.Concatenate[t.Any, P], T],
+    enums: dict[str, t.Any],
+) -> BatchMethod[P, T]:
+    signature = inspect.signature(method)
+
+    def groups(
+        self: "BaseProvider", n: int, *args: P.args, **kwargs: P.kwargs
+    ) -> list[tuple[t.Sequence[T], list[int] | None]]:
+        # Returns populations and positions of values chosen from them.
+        if not enums:
+            return [(population(self, *args, **kwargs), None)]
+
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        # The members of enums which are not passed
+        # explicitly are chosen for each value separately.
+        params = [name for name in enums if arguments.arguments[name] is None]
+        if not params:
+            return [(population(*arguments.args, **arguments.kwargs), None)]
+
+        members = zip(
+            *[
+                self.random.choice_batch(_random._enum_members(enums[p]), n)
+                for p in params
+            ]
+        )
+        positions: dict[tuple[t.Any, ...], list[int]] = {}
+        for position, group in enumerate(members):
+            positions.setdefault(group, []).append(position)
+
+        result: list[tuple[t.Sequence[T], list[int] | None]] = []
+        for group, group_positions in positions.items():
+            arguments.arguments.update(zip(params, group))
+            group_population = population(*arguments.args, **arguments.kwargs)
+            result.append((group_population, group_positions))
+        return result
+
+    def batch(
+        self: "BaseProvider", n: int, *args: P.args, **kwargs: P.kwargs
+    ) -> list[T]:
+        result: list[t.Any] = [None] * n
+        for group_population, positions in groups(self, n, *args, **kwargs):
+            if positions is None:
+                return self.random.choice_batch(group_population, n)
+            values = self.random.choice_batch(group_population, len(positions))
+            for position, value in zip(positions, values):
+                result[position] = value
+        return result
+
+    def codes(
+        self: "BaseProvider", n: int, *args: P.args, **kwargs: P.kwargs
+    ) -> Categorical:
+        # Draws the same values as batch(), but returns them encoded.
+        categories: dict[t.Any, int] = {}
+        result = [0] * n
+        for group_population, positions in groups(self, n, *args, **kwargs):
+            mapping = [
+                categories.setdefault(value, len(categories))
+                for value in group_population
+            ]
+            indices = self.random.index_batch(
+                len(group_population), n if positions is None else len(positions)
+            )
+            if positions is None and len(categories) == len(mapping):
+                # There are no duplicates, so indices are the codes.
+                result = indices
+            elif positions is None:
+                result = [mapping[i] for i in indices]
+            else:
+                for position, index in zip(positions, indices):
+                    result[position] = mapping[index]
+        return Categorical(result, list(categories))
+
+    return BatchMethod(method, batch, codes=codes)
+
+
+def choice_method(
+    population: t.Callable[t.Concatenate[t.Any, P], t.Sequence[T]],
+    /,
+    **enums: t.Any,
+) -> t.Callable[[t.Callable[t.Concatenate[t.Any, P], T]], BatchMethod[P, T]]:
+    """Turns a method into a :class:`BatchMethod` which chooses from a sequence.
+
+    The method must return a random element of the sequence which
+    ``population`` returns for the same arguments. Its bulk version
+    resolves the sequence only once per batch:
+
+        >>> class MyProvider(BaseDataProvider):
+        ...     def _cities(self) -> list[str]:
+        ...         return self._extract(["city"])
+        ...
+        ...     @choice_method(_cities)
+        ...     def city(self) -> str:
+        ...         return self.random.choice(self._cities())
+        ...
+        ...     def _names(self, gender: Gender | None = None) -> list[str]:
+        ...         key = self.validate_enum(gender, Gender)
+        ...         return self._extract(["names", key])
+        ...
+        ...     @choice_method(_names, gender=Gender)
+        ...     def name(self, gender: Gender | None = None) -> str:
+        ...         return self.random.choice(self._names(gender))
+
+    Enums of the parameters, which are chosen randomly when they are
+    ``None``, must be passed as keyword arguments. This way, the bulk
+    version chooses a random member of the enum for each value.
+
+    :param population: Function which takes the provider and
+        the arguments of the method and returns a sequence.
+    :param enums: Enums of the parameters of the method.
+    :return: Decorator.
+    """
+
+    def decorator(method: t.Callable[t.Concatenate[t.Any, P], T]) -> BatchMethod[P, T]:
+        return _choice_method(population, method, enums)
+
+    return decorator
+
+
+def batch_method(
+    batch: t.Callable[t.Concatenate[t.Any, int, P], list[T]],
+) -> t.Callable[[t.Callable[t.Concatenate[t.Any, P], T]], BatchMethod[P, T]]:
+    """Turns a method into a :class:`BatchMethod` with the given bulk version.
+
+    Use it for methods which don't choose values from a sequence,
+    so :func:`choice_method` doesn't apply to them:
+
+        >>> class MyProvider(BaseProvider):
+        ...     def _numbers(self, n: int, maximum: int = 10) -> list[int]:
+        ...         return self.random.randint_batch(0, maximum, n)
+        ...
+        ...     @batch_method(_numbers)
+        ...     def number(self, maximum: int = 10) -> int:
+        ...         return self.random.randint(0, maximum)
+
+    :param batch: Function which takes the provider, the number
+        of values and the arguments of the method and returns a list.
+    :return: Decorator.
+    """
+
+    def decorator(method: t.Callable[t.Concatenate[t.Any, P], T]) -> BatchMethod[P, T]:
+        return BatchMethod(method, batch)
+
+    return decorator
 
 
 class BaseProvider:
@@ -71,6 +357,21 @@ class BaseProvider:
         else:
             self.random.seed(t.cast(t.Any, seed))
 
+    def _share_random(self, provider: type[ProviderT], **kwargs: t.Any) -> ProviderT:
+        """Create a provider which shares the random generator with this one.
+
+        The state of the random generator is preserved, so the provider
+        can be created lazily without affecting the generated values.
+
+        :param provider: Provider class.
+        :param kwargs: Keyword arguments for the provider.
+        :return: Instance of the provider.
+        """
+        state = self.random.getstate()
+        instance = provider(seed=self.seed, random=self.random, **kwargs)
+        self.random.setstate(state)
+        return instance
+
     def validate_enum(self, item: t.Any, enum: t.Any) -> t.Any:
         """Validates various enum objects that are used as arguments for methods.
 
@@ -80,15 +381,15 @@ class BaseProvider:
         :raises NonEnumerableError: If enums has not such an item.
         """
         if item is None:
-            result = self.random.choice_enum_item(enum)
-        elif item and isinstance(item, enum):
-            result = item
-        else:
-            raise NonEnumerableError(enum)
-
-        return result.value
-
-    def _read_global_file(self, file_name: str) -> t.Any:
+            # The same as choice_enum_item(), but without
+            # getting the value of the chosen member.
+            return self.random.choice(_enum_values(enum))
+        if item and isinstance(item, enum):
+            return item._value_
+        raise NonEnumerableError(enum)
+
+    @staticmethod
+    def _read_global_file(file_name: str) -> t.Any:
         """Reads JSON file and return dict.
 
         Reads JSON file from mimesis/data/global/ directory.
@@ -97,11 +398,20 @@ class BaseProvider:
         :raises FileNotFoundError: If the file was not found.
         :return: JSON data.
         """
-        with open(DATADIR.joinpath("global", file_name)) as f:
+        with open(DATADIR.joinpath("global", file_name), encoding="utf8") as f:
             data = json.load(f)
 
         return data
 
+    def __getstate__(self) -> dict[str, t.Any]:
+        # Bound batch methods refer to the instance itself,
+        # so we don't copy them, they are created on demand.
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not isinstance(value, BoundBatchMethod)
+        }
+
     def _has_seed(self) -> bool:
         """Internal API to check if seed is set."""
         return (self.seed is not None and self.seed is not MissingSeed) or (
@@ -131,7 +441,7 @@ class BaseDataProvider(BaseProvider):
         super().__init__(seed=seed, *args, **kwargs)
         # This is a dict with data
         # loaded from the JSON file.
-        self._dataset: JSON = {}
+        self._dataset: t.Mapping[str, t.Any] = {}
         # Order matters here, since
         # we have to set up locale first.
         self._setup_locale(locale)
@@ -162,7 +472,7 @@ class BaseDataProvider(BaseProvider):
         except (TypeError, KeyError):
             return default
 
-    def _update_dict(self, initial: JSON, other: JSON) -> JSON:
+    def _update_dict(self, initial: JSON, other: t.Mapping[str, t.Any]) -> JSON:
         """Recursively updates a dictionary.
 
         :param initial: Dict to update.
@@ -179,6 +489,11 @@ class BaseDataProvider(BaseProvider):
     def _load_dataset(self) -> None:
         """Loads the content from the JSON dataset.
 
+        Parsed datasets are cached for the whole process and
+        shared between all instances of the provider. Up-to-date
+        compiled datasets (see :mod:`mimesis.datasets.compiler`)
+        are preferred over JSON files.
+
         :return: The content of the file.
         :raises UnsupportedLocale: Raises if locale is unsupported.
         """
@@ -189,30 +504,35 @@ class BaseDataProvider(BaseProvider):
         if not datafile:
             return None
 
-        def read_file(locale_name: str) -> t.Any:
-            file_path = datadir / locale_name / datafile
-            with open(file_path, encoding="utf8") as f:
-                return json.load(f)
-
-        master_locale = locale.split(LOCALE_SEP).pop(0)
+        def load(locale_name: str) -> t.Mapping[str, t.Any]:
+            key = (datadir, locale_name, datafile)
+            if key not in _DATASETS:
+                data = read_dataset(datadir / locale_name / datafile)
 
-        data = read_file(master_locale)
+                if LOCALE_SEP in locale_name:
+                    master_locale = locale_name.split(LOCALE_SEP).pop(0)
+                    # The master dataset is shared, so we merge into its copy.
+                    master = copy.deepcopy(dict(load(master_locale)))
+                    data = self._update_dict(master, data)
 
-        if LOCALE_SEP in locale:
-            data = self._update_dict(data, read_file(locale))
+                _DATASETS.setdefault(key, data)
+            return _DATASETS[key]
 
-        self._dataset = data
+        self._dataset = load(locale)
 
     def update_dataset(self, data: JSON) -> None:
         """Updates dataset merging a given dict into default data.
 
         This method may be useful when you need to override data
         for a given key in JSON file.
+
+        The loaded dataset is shared with other instances of the provider,
+        so the changes are applied to a copy and affect only this instance.
         """
         if not isinstance(data, dict):
             raise TypeError("The data must be a dict.")
 
-        self._dataset |= data
+        self._dataset = {**self._dataset, **data}
 
     def get_current_locale(self) -> str:
         """Returns current locale.
@@ -1,5 +1,7 @@
 """Binary data provider."""
 
+import functools
+import io
 import typing as t
 
 from mimesis.constants import DATADIR
@@ -14,6 +16,19 @@ from mimesis.providers.base import BaseProvider
 
 __all__ = ["BinaryFile"]
 
+FileType = t.Union[AudioFile, CompressedFile, DocumentFile, ImageFile, VideoFile]
+
+
+@functools.cache
+def _read_sample(extension: str) -> bytes:
+    """Read a sample file, which is read only once per process.
+
+    :param extension: Extension of the sample file.
+    :return: Content of the file.
+    """
+    with open(DATADIR / "bin" / f"sample.{extension}", "rb") as file:
+        return file.read()
+
 
 class BinaryFile(BaseProvider):
     """Class for generating binary data"""
@@ -29,16 +44,39 @@ class BinaryFile(BaseProvider):
     class Meta:
         name = "binaryfile"
 
-    def _read_file(
-        self,
-        *,
-        file_type: AudioFile | CompressedFile | DocumentFile | ImageFile | VideoFile,
-    ) -> bytes:
-        file_type = self.validate_enum(file_type, file_type.__class__)
-        file_path = DATADIR / "bin" / f"sample.{file_type}"
+    def _read_file(self, *, file_type: FileType) -> bytes:
+        # Bytes are immutable, so the cached content is returned as is.
+        return _read_sample(self.validate_enum(file_type, file_type.__class__))
+
+    def view(self, *, file_type: FileType) -> memoryview:
+        """Returns a read-only view of a file of given format.
 
-        with open(file_path, "rb") as file:
-            return file.read()
+        Unlike the methods which return bytes, slicing the view
+        doesn't copy the content.
+
+        .. note:: This method accepts keyword-only arguments.
+
+        .. versionadded:: 18.1.0
+
+        :param file_type: File extension.
+        :return: Memory view of the file.
+        """
+        return memoryview(self._read_file(file_type=file_type))
+
+    def stream(self, *, file_type: FileType) -> io.BytesIO:
+        """Returns a file of given format as a binary stream.
+
+        The stream shares the content with other streams until it is
+        written to, so it is cheap to create one for each upload.
+
+        .. note:: This method accepts keyword-only arguments.
+
+        .. versionadded:: 18.1.0
+
+        :param file_type: File extension.
+        :return: File-like object positioned at the start of the file.
+        """
+        return io.BytesIO(self._read_file(file_type=file_type))
 
     def video(self, *, file_type: VideoFile = VideoFile.MP4) -> bytes:
         """Generates video file of given format and returns it as bytes.
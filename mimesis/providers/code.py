@@ -1,15 +1,11 @@
 """The data provider of a variety of codes."""
 
-from mimesis.datasets import (
-    EAN_MASKS,
-    IMEI_TACS,
-    ISBN_GROUPS,
-    ISBN_MASKS,
-    LOCALE_CODES,
-)
+import typing as t
+
+from mimesis import datasets
 from mimesis.enums import EANFormat, ISBNFormat
 from mimesis.locales import Locale
-from mimesis.providers.base import BaseProvider
+from mimesis.providers.base import BaseProvider, choice_method
 from mimesis.shortcuts import luhn_checksum
 
 __all__ = ["Code"]
@@ -21,6 +17,10 @@ class Code(BaseProvider):
     class Meta:
         name = "code"
 
+    def _locale_codes(self) -> t.Sequence[str]:
+        return datasets.LOCALE_CODES
+
+    @choice_method(_locale_codes)
     def locale_code(self) -> str:
         """Generates a random locale code (MS-LCID).
 
@@ -29,7 +29,7 @@ class Code(BaseProvider):
 
         :return: Locale code.
         """
-        return self.random.choice(LOCALE_CODES)
+        return self.random.choice(self._locale_codes())
 
     def issn(self, mask: str = "####-####") -> str:
         """Generates a random ISSN.
@@ -53,7 +53,7 @@ class Code(BaseProvider):
         :raises NonEnumerableError: if code is not enum ISBNFormat.
         """
         fmt_value = self.validate_enum(item=fmt, enum=ISBNFormat)
-        mask = ISBN_MASKS[fmt_value].format(ISBN_GROUPS[locale.value])
+        mask = datasets.ISBN_MASKS[fmt_value].format(datasets.ISBN_GROUPS[locale.value])
         return self.random.generate_string_by_mask(mask)
 
     def ean(self, fmt: EANFormat | None = None) -> str:
@@ -70,7 +70,7 @@ class Code(BaseProvider):
             item=fmt,
             enum=EANFormat,
         )
-        mask = EAN_MASKS[key]
+        mask = datasets.EAN_MASKS[key]
         return self.random.generate_string_by_mask(mask=mask)
 
     def imei(self) -> str:
@@ -78,7 +78,7 @@ class Code(BaseProvider):
 
         :return: IMEI.
         """
-        num = self.random.choice(IMEI_TACS)
+        num = self.random.choice(datasets.IMEI_TACS)
         num += str(self.random.randint(100000, 999999))
         return num + luhn_checksum(num)
 
@@ -4,7 +4,7 @@ import hashlib
 import secrets
 from uuid import UUID, uuid4
 
-from mimesis.datasets.int.cryptographic import WORDLIST
+from mimesis import datasets
 from mimesis.enums import Algorithm
 from mimesis.providers.base import BaseProvider
 
@@ -102,5 +102,5 @@ class Cryptographic(BaseProvider):
         :return: Mnemonic phrase.
         """
         length = self.random.choice([12, 24])
-        phrases = self.random.choices(WORDLIST, k=length)
+        phrases = self.random.choices(datasets.WORDLIST, k=length)
         return " ".join(phrases)
@@ -1,18 +1,141 @@
 """Provider of data related to date and time."""
 
+import functools
+import operator
 import typing as t
 from calendar import monthrange
 from datetime import date, datetime, time, timedelta
 
+from mimesis import compat, datasets
 from mimesis.compat import pytz
-from mimesis.datasets import GMT_OFFSETS, ROMAN_NUMS, TIMEZONES
 from mimesis.enums import DurationUnit, TimestampFormat, TimezoneRegion
-from mimesis.providers.base import BaseDataProvider
+from mimesis.providers.base import (
+    BaseDataProvider,
+    batch_method,
+    choice_method,
+)
+from mimesis.random import NUMPY_BATCH_SIZE
 from mimesis.types import Date, DateTime, Time
 
 __all__ = ["Datetime"]
 
 
+@functools.cache
+def _region_timezones(region: str) -> tuple[str, ...]:
+    """Get the timezones of a region, which are filtered once per region."""
+    return tuple(tz for tz in datasets.TIMEZONES if tz.startswith(region))
+
+
+@functools.cache
+def _tzinfo(timezone: str) -> t.Any:
+    """Get the tzinfo object of a timezone, which is resolved once per timezone."""
+    if not pytz:
+        raise ImportError("Timezones are supported only with pytz")
+    return pytz.timezone(timezone)
+
+
+def _shift(first: t.Any, offsets: t.Any, unit: str) -> t.Any:
+    """Shift the first value by an ``int64`` array of offsets in the unit.
+
+    :return: Array of ``datetime64`` values.
+    """
+    return compat.numpy.datetime64(first, unit) + offsets.view(f"timedelta64[{unit}]")
+
+
+#: Printf-style conversions of the strftime directives which depend only
+#: on the numeric fields, with the indexes of the fields (see _Format.format).
+_DIRECTIVES: t.Final[dict[str, tuple[str, int]]] = {
+    "Y": ("%d", 0),
+    "m": ("%02d", 1),
+    "d": ("%02d", 2),
+    "H": ("%02d", 3),
+    "M": ("%02d", 4),
+    "S": ("%02d", 5),
+    "f": ("%06d", 6),
+    "y": ("%02d", 7),
+    "I": ("%02d", 8),
+}
+
+
+class _Format:
+    """A strftime format compiled into a printf-style template.
+
+    Formats with other directives, e.g. names of months, which depend
+    on the locale of the process, are not compiled, so they fall back
+    to strftime.
+    """
+
+    __slots__ = ("fmt", "template", "fields", "full_year")
+
+    def __init__(self, fmt: str) -> None:
+        self.fmt = fmt
+        self.template: str | None = None
+        self.full_year = "%Y" in fmt
+        # An empty slice gets no fields for formats without directives.
+        self.fields: t.Callable[[tuple[int, ...]], t.Any]
+        self.fields = operator.itemgetter(slice(0, 0))
+
+        parts, fields = [], []
+        chars = iter(fmt)
+        for char in chars:
+            if char != "%":
+                parts.append(char)
+                continue
+
+            directive = next(chars, "")
+            if directive == "%":
+                parts.append("%%")
+            elif directive in _DIRECTIVES:
+                conversion, field = _DIRECTIVES[directive]
+                parts.append(conversion)
+                fields.append(field)
+            else:
+                return
+
+        self.template = "".join(parts)
+        if fields:
+            self.fields = operator.itemgetter(*fields)
+
+    def format(
+        self,
+        year: int = 1900,
+        month: int = 1,
+        day: int = 1,
+        hour: int = 0,
+        minute: int = 0,
+        second: int = 0,
+        microsecond: int = 0,
+    ) -> str:
+        """Format the fields, the same way as ``strftime`` does."""
+        # Padding of years before 1000 depends on the platform.
+        if self.template is None or (year < 1000 and self.full_year):
+            moment = datetime(year, month, day, hour, minute, second, microsecond)
+            return moment.strftime(self.fmt)
+
+        values = (
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            microsecond,
+            year % 100,
+            hour % 12 or 12,
+        )
+        formatted: str = self.template % self.fields(values)
+        return formatted
+
+
+#: Format of RFC 3339 timestamps.
+_RFC_3339: t.Final[str] = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_format(fmt: str) -> _Format:
+    return _Format(fmt)
+
+
 class Datetime(BaseDataProvider):
     """Class for generating data related to the date and time."""
 
@@ -23,6 +146,24 @@ class Datetime(BaseDataProvider):
         name = "datetime"
         datafile = f"{name}.json"
 
+    @staticmethod
+    def _bulk_step(
+        date_start: DateTime,
+        date_end: DateTime,
+        kwargs: dict[str, t.Any],
+    ) -> timedelta:
+        """Validate the arguments of the bulk methods and get the step."""
+        if not date_start and not date_end:
+            raise ValueError("You must pass date_start and date_end")
+
+        if date_end < date_start:
+            raise ValueError("date_start can not be larger than date_end")
+
+        step = timedelta(**kwargs)
+        if step <= timedelta():
+            raise ValueError("timedelta must be positive")
+        return step
+
     @staticmethod
     def bulk_create_datetimes(
         date_start: DateTime,
@@ -52,6 +193,9 @@ class Datetime(BaseDataProvider):
 
         See :py:class:`datetime.timedelta` for more details.
 
+        See :meth:`iter_datetimes` for a lazy version of this method
+        and :meth:`bulk_create_datetime64` for a NumPy version.
+
         :param date_start: Begin of the range.
         :param date_end: End of the range.
         :param kwargs: Keyword arguments for :py:class:`datetime.timedelta`
@@ -60,22 +204,70 @@ class Datetime(BaseDataProvider):
             when ``date_start`` larger than ``date_end`` or when the given
             keywords for `datetime.timedelta` represent a non-positive timedelta.
         """
-        dt_objects = []
+        return list(Datetime.iter_datetimes(date_start, date_end, **kwargs))
 
-        if not date_start and not date_end:
-            raise ValueError("You must pass date_start and date_end")
+    @staticmethod
+    def iter_datetimes(
+        date_start: DateTime,
+        date_end: DateTime,
+        **kwargs: t.Any,
+    ) -> t.Iterator[DateTime]:
+        """Lazily create datetime objects.
 
-        if date_end < date_start:
-            raise ValueError("date_start can not be larger than date_end")
+        Yields the same datetime objects as :meth:`bulk_create_datetimes`,
+        one by one, so the memory usage doesn't depend on the size of
+        the range. The arguments are validated immediately.
 
-        if timedelta(**kwargs) <= timedelta():
-            raise ValueError("timedelta must be positive")
+        .. versionadded:: 18.1.0
 
-        while date_start <= date_end:
-            date_start += timedelta(**kwargs)
-            dt_objects.append(date_start)
+        :param date_start: Begin of the range.
+        :param date_end: End of the range.
+        :param kwargs: Keyword arguments for :py:class:`datetime.timedelta`
+        :return: Iterator of datetime objects.
+        :raises: ValueError: See :meth:`bulk_create_datetimes`.
+        """
+        step = Datetime._bulk_step(date_start, date_end, kwargs)
 
-        return dt_objects
+        def iterate(current: DateTime) -> t.Iterator[DateTime]:
+            while current <= date_end:
+                current += step
+                yield current
+
+        return iterate(date_start)
+
+    @staticmethod
+    def bulk_create_datetime64(
+        date_start: DateTime,
+        date_end: DateTime,
+        **kwargs: t.Any,
+    ) -> t.Any:
+        """Bulk create datetime values as a NumPy array.
+
+        The values are the same as the values of :meth:`bulk_create_datetimes`,
+        but they are created in one vectorized step, as ``datetime64[us]``.
+
+        .. versionadded:: 18.1.0
+
+        :param date_start: Begin of the range (a naive datetime object).
+        :param date_end: End of the range (a naive datetime object).
+        :param kwargs: Keyword arguments for :py:class:`datetime.timedelta`
+        :return: Array of ``datetime64[us]`` values (:py:class:`numpy.ndarray`).
+        :raises: ValueError: See :meth:`bulk_create_datetimes`, or when
+            the datetime objects are timezone-aware.
+        :raises ImportError: If numpy is not installed.
+        """
+        numpy = compat.numpy
+        if not numpy:
+            raise ImportError("NumPy output is supported only with numpy")
+
+        step = Datetime._bulk_step(date_start, date_end, kwargs)
+        if date_start.tzinfo is not None or date_end.tzinfo is not None:
+            raise ValueError("datetime64 doesn't support timezone-aware datetimes")
+
+        count = (date_end - date_start) // step + 1
+        steps = numpy.arange(1, count + 1, dtype=numpy.int64)
+        step_us = numpy.timedelta64(step // timedelta(microseconds=1), "us")
+        return numpy.datetime64(date_start, "us") + steps * step_us
 
     def week_date(self, start: int = 2017, end: int = _CURRENT_YEAR) -> str:
         """Generates week number with year.
@@ -88,25 +280,33 @@ class Datetime(BaseDataProvider):
         week = self.random.randint(1, 52)
         return f"{year}-W{week}"
 
+    def _days(self, abbr: bool = False) -> t.Sequence[str]:
+        key = "abbr" if abbr else "name"
+        days: list[str] = self._extract(["day", key])
+        return days
+
+    @choice_method(_days)
     def day_of_week(self, abbr: bool = False) -> str:
         """Generates a random day of the week.
 
         :param abbr: Abbreviated day name.
         :return: Day of the week.
         """
+        return self.random.choice(self._days(abbr))
+
+    def _months(self, abbr: bool = False) -> t.Sequence[str]:
         key = "abbr" if abbr else "name"
-        days: list[str] = self._extract(["day", key])
-        return self.random.choice(days)
+        months: list[str] = self._extract(["month", key])
+        return months
 
+    @choice_method(_months)
     def month(self, abbr: bool = False) -> str:
         """Generates a random month of the year.
 
         :param abbr: Abbreviated month name.
         :return: Month name.
         """
-        key = "abbr" if abbr else "name"
-        months: list[str] = self._extract(["month", key])
-        return self.random.choice(months)
+        return self.random.choice(self._months(abbr))
 
     def year(self, minimum: int = 1990, maximum: int = _CURRENT_YEAR) -> int:
         """Generates a random year.
@@ -117,62 +317,172 @@ class Datetime(BaseDataProvider):
         """
         return self.random.randint(minimum, maximum)
 
+    def _centuries(self) -> t.Sequence[str]:
+        return datasets.ROMAN_NUMS
+
+    @choice_method(_centuries)
     def century(self) -> str:
         """Generates a random century.
 
         :return: Century.
         """
-        return self.random.choice(ROMAN_NUMS)
+        return self.random.choice(self._centuries())
 
+    def _periodicity(self) -> t.Sequence[str]:
+        periodicity: list[str] = self._extract(["periodicity"])
+        return periodicity
+
+    @choice_method(_periodicity)
     def periodicity(self) -> str:
         """Generates a random periodicity string.
 
         :return: Periodicity.
         """
-        periodicity: list[str] = self._extract(["periodicity"])
-        return self.random.choice(periodicity)
+        return self.random.choice(self._periodicity())
+
+    def _date_batch(
+        self,
+        n: int,
+        start: int = 2000,
+        end: int = _CURRENT_YEAR,
+    ) -> list[Date]:
+        """Generates a list of random date objects.
 
+        Unlike :meth:`date`, which chooses the year, the month and
+        the day separately, it chooses proleptic Gregorian ordinals
+        uniformly from the range of the years, so every day is equally
+        likely.
+
+        :param n: Number of date objects.
+        :param start: Minimum value of year.
+        :param end: Maximum value of year.
+        :return: List of date objects.
+        """
+        first = date(start, 1, 1)
+        span = date(end, 12, 31).toordinal() - first.toordinal()
+        if compat.numpy and n >= NUMPY_BATCH_SIZE:
+            offsets = self.random._randint_array(0, span, n)
+            return _shift(first, offsets, "D").tolist()  # type: ignore
+        return [
+            first + timedelta(days=offset)
+            for offset in self.random.randint_batch(0, span, n)
+        ]
+
+    @batch_method(_date_batch)
     def date(self, start: int = 2000, end: int = _CURRENT_YEAR) -> Date:
         """Generates a random date object.
 
+        Use ``date.batch(n, ...)`` to generate many values at once.
+
+        .. note:: This method chooses the year, the month and the day
+            separately, so days of short months are more likely.
+            ``date.batch()`` chooses days uniformly from the range
+            of the years, so its values are distributed differently.
+
         :param start: Minimum value of year.
         :param end: Maximum value of year.
         :return: Formatted date.
         """
+        return date(*self._date_fields(start, end))
+
+    def _date_fields(
+        self,
+        start: int = 2000,
+        end: int = _CURRENT_YEAR,
+    ) -> tuple[int, int, int]:
+        """Chooses the year, the month and the day of a random date."""
         year = self.random.randint(start, end)
         month = self.random.randint(1, 12)
         day = self.random.randint(1, monthrange(year, month)[1])
-        date_object = date(year, month, day)
-        return date_object
+        return year, month, day
+
+    def _formatted_date_batch(
+        self,
+        n: int,
+        fmt: str = "",
+        **kwargs: t.Any,
+    ) -> list[str]:
+        """Generates a list of random dates as strings.
+
+        :param n: Number of dates.
+        :param fmt: The format of date, if None then use standard
+            accepted in the current locale.
+        :param kwargs: Keyword arguments for :meth:`~.date()`
+        :return: List of formatted dates.
+        """
+        formatter = _compile_format(fmt or self._extract(["formats", "date"]))
+        return [
+            formatter.format(value.year, value.month, value.day)
+            for value in self._date_batch(n, **kwargs)
+        ]
 
+    @batch_method(_formatted_date_batch)
     def formatted_date(self, fmt: str = "", **kwargs: t.Any) -> str:
         """Generates random date as string.
 
+        The format is compiled once, so the string is built from the
+        fields of the date without ``strftime``, unless the format has
+        directives which depend on the locale of the process, e.g. ``%B``.
+
         :param fmt: The format of date, if None then use standard
             accepted in the current locale.
         :param kwargs: Keyword arguments for :meth:`~.date()`
         :return: Formatted date.
         """
-        date_obj = self.date(**kwargs)
+        fields = self._date_fields(**kwargs)
 
         if not fmt:
             fmt = self._extract(["formats", "date"])
 
-        return date_obj.strftime(fmt)
+        return _compile_format(fmt).format(*fields)
 
+    def _time_batch(self, n: int) -> list[Time]:
+        """Generates a list of random time objects.
+
+        :param n: Number of time objects.
+        :return: List of ``datetime.time`` objects.
+        """
+        return [time(*fields) for fields in self._time_fields_batch(n)]
+
+    @batch_method(_time_batch)
     def time(self) -> Time:
         """Generates a random time object.
 
         :return: ``datetime.time`` object.
         """
-        random_time = time(
+        return time(*self._time_fields())
+
+    def _time_fields(self) -> tuple[int, int, int, int]:
+        """Chooses the hour, the minute, the second and the microsecond."""
+        return (
             self.random.randint(0, 23),
             self.random.randint(0, 59),
             self.random.randint(0, 59),
             self.random.randint(0, 999999),
         )
-        return random_time
 
+    def _time_fields_batch(self, n: int) -> list[tuple[int, int, int, int]]:
+        """Chooses the fields of n times from the microseconds of a day."""
+        fields = []
+        for offset in self.random.randint_batch(0, 86_399_999_999, n):
+            seconds, microsecond = divmod(offset, 1_000_000)
+            minutes, second = divmod(seconds, 60)
+            hour, minute = divmod(minutes, 60)
+            fields.append((hour, minute, second, microsecond))
+        return fields
+
+    def _formatted_time_batch(self, n: int, fmt: str = "") -> list[str]:
+        """Generates a list of random times as strings.
+
+        :param n: Number of times.
+        :param fmt: The format of time, if None then use standard
+            accepted in the current locale.
+        :return: List of formatted times.
+        """
+        format_ = _compile_format(fmt or self._extract(["formats", "time"])).format
+        return [format_(1900, 1, 1, *fields) for fields in self._time_fields_batch(n)]
+
+    @batch_method(_formatted_time_batch)
     def formatted_time(self, fmt: str = "") -> str:
         """Generates formatted time as string.
 
@@ -180,11 +490,11 @@ class Datetime(BaseDataProvider):
             accepted in the current locale.
         :return: String formatted time.
         """
-        time_obj = self.time()
+        fields = self._time_fields()
 
         if not fmt:
             fmt = self._extract(["formats", "time"])
-        return time_obj.strftime(fmt)
+        return _compile_format(fmt).format(1900, 1, 1, *fields)
 
     def day_of_month(self) -> int:
         """Generates a random day of the month, from 1 to 31.
@@ -193,24 +503,89 @@ class Datetime(BaseDataProvider):
         """
         return self.random.randint(1, 31)
 
+    def _timezones(self, region: TimezoneRegion | None = None) -> t.Sequence[str]:
+        return _region_timezones(self.validate_enum(region, TimezoneRegion))
+
+    @choice_method(_timezones, region=TimezoneRegion)
     def timezone(self, region: TimezoneRegion | None = None) -> str:
         """Generates a random timezone.
 
         :param region: Timezone region.
         :return: Timezone.
         """
-        region_name = self.validate_enum(region, TimezoneRegion)
-        return self.random.choice(
-            [tz for tz in TIMEZONES if tz.startswith(region_name)]
-        )
+        return self.random.choice(self._timezones(region))
 
+    def _gmt_offsets(self) -> t.Sequence[str]:
+        return datasets.GMT_OFFSETS
+
+    @choice_method(_gmt_offsets)
     def gmt_offset(self) -> str:
         """Generates a random GMT offset value.
 
         :return: GMT Offset.
         """
-        return self.random.choice(GMT_OFFSETS)
+        return self.random.choice(self._gmt_offsets())
+
+    def _datetime_batch(
+        self,
+        n: int,
+        start: int = _CURRENT_YEAR,
+        end: int = _CURRENT_YEAR,
+        timezone: str | None = None,
+    ) -> list[DateTime]:
+        """Generates a list of random datetime objects.
+
+        Unlike :meth:`datetime`, which chooses the year, the month and
+        the day separately, it chooses microseconds uniformly from
+        the range of the years, so every moment is equally likely.
+
+        :param n: Number of datetime objects.
+        :param start: Minimum value of year.
+        :param end: Maximum value of year.
+        :param timezone: Set custom timezone (pytz required).
+        :return: List of datetime objects.
+        """
+        first, last = self._bounds(start, end, timezone)
+        if not timezone:
+            return self._moments(first, last, n)
+
+        # Moments are chosen in UTC, because converting them from UTC
+        # is much faster than localizing naive datetime objects.
+        first, last = (
+            moment.astimezone(pytz.utc).replace(tzinfo=None) for moment in (first, last)
+        )
+        return list(map(_tzinfo(timezone).fromutc, self._moments(first, last, n)))
 
+    @staticmethod
+    def _bounds(
+        start: int = _CURRENT_YEAR,
+        end: int = _CURRENT_YEAR,
+        timezone: str | None = None,
+    ) -> tuple[DateTime, DateTime]:
+        """Get the first and the last moment of the range of the years."""
+        first = datetime(start, 1, 1)
+        last = datetime(end, 12, 31, 23, 59, 59, 999999)
+        if timezone:
+            tz = _tzinfo(timezone)
+            return tz.localize(first), tz.localize(last)
+        return first, last
+
+    def _moments(self, first: DateTime, last: DateTime, n: int) -> list[DateTime]:
+        """Chooses n moments in the range uniformly, with microsecond precision."""
+        if compat.numpy and n >= NUMPY_BATCH_SIZE:
+            # Converting datetime64 values to datetime objects is much
+            # faster than adding timedelta objects one by one.
+            return self._moments64(first, last, n).tolist()  # type: ignore
+        span = (last - first) // timedelta(microseconds=1)
+        offsets = self.random.randint_batch(0, span, n)
+        return [first + timedelta(microseconds=offset) for offset in offsets]
+
+    def _moments64(self, first: DateTime, last: DateTime, n: int) -> t.Any:
+        """The same as :meth:`_moments`, but as an array of ``datetime64[us]``."""
+        span = (last - first) // timedelta(microseconds=1)
+        return _shift(first, self.random._randint_array(0, span, n), "us")
+
+    @batch_method(_datetime_batch)
     def datetime(
         self,
         start: int = _CURRENT_YEAR,
@@ -219,23 +594,71 @@ class Datetime(BaseDataProvider):
     ) -> DateTime:
         """Generates random datetime.
 
+        Use ``datetime.batch(n, ...)`` to generate many values at once.
+
+        .. note:: This method chooses the year, the month and the day
+            separately, so moments of short months are more likely.
+            ``datetime.batch()`` chooses microseconds uniformly from
+            the range of the years, so its values are distributed
+            differently.
+
         :param start: Minimum value of year.
         :param end: Maximum value of year.
         :param timezone: Set custom timezone (pytz required).
         :return: Datetime
         """
-        datetime_obj = datetime.combine(
-            date=self.date(start, end),
-            time=self.time(),
-        )
-        if timezone:
-            if not pytz:
-                raise ImportError("Timezones are supported only with pytz")
-            tz = pytz.timezone(timezone)
+        fields, tz = self._moment(start, end, timezone)
+        datetime_obj = datetime(*fields)
+        if tz:
             datetime_obj = tz.localize(datetime_obj)
 
         return datetime_obj
 
+    def _moment(
+        self,
+        start: int = _CURRENT_YEAR,
+        end: int = _CURRENT_YEAR,
+        timezone: str | None = None,
+    ) -> tuple[tuple[int, int, int, int, int, int, int], t.Any]:
+        """Chooses the fields of a random datetime and resolves its timezone."""
+        fields = (*self._date_fields(start, end), *self._time_fields())
+        return fields, _tzinfo(timezone) if timezone else None
+
+    def _formatted_datetime_batch(
+        self,
+        n: int,
+        fmt: str = "",
+        **kwargs: t.Any,
+    ) -> list[str]:
+        """Generates a list of random datetime strings.
+
+        :param n: Number of datetime strings.
+        :param fmt: Custom format (default is format for current locale)
+        :param kwargs: Keyword arguments for :meth:`~.datetime()`
+        :return: List of formatted datetime strings.
+        """
+        if not fmt:
+            fmt = self._datetime_format()
+
+        values = self._datetime_batch(n, **kwargs)
+        formatter = _compile_format(fmt)
+        if formatter.template is None:
+            return [value.strftime(fmt) for value in values]
+
+        return [
+            formatter.format(
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+            )
+            for value in values
+        ]
+
+    @batch_method(_formatted_datetime_batch)
     def formatted_datetime(self, fmt: str = "", **kwargs: t.Any) -> str:
         """Generates datetime string in human-readable format.
 
@@ -243,15 +666,119 @@ class Datetime(BaseDataProvider):
         :param kwargs: Keyword arguments for :meth:`~.datetime()`
         :return: Formatted datetime string.
         """
-        dt_obj = self.datetime(**kwargs)
+        fields, tz = self._moment(**kwargs)
 
         if not fmt:
-            date_fmt = self._extract(["formats", "date"])
-            time_fmt = self._extract(["formats", "time"])
-            fmt = f"{date_fmt} {time_fmt}"
+            fmt = self._datetime_format()
+
+        formatter = _compile_format(fmt)
+        if tz and formatter.template is None:
+            # Directives such as %z need a timezone-aware datetime.
+            moment: DateTime = tz.localize(datetime(*fields))
+            return moment.strftime(fmt)
+        return formatter.format(*fields)
+
+    def _datetime_format(self) -> str:
+        """Get the format of datetime for the current locale."""
+        date_fmt = self._extract(["formats", "date"])
+        time_fmt = self._extract(["formats", "time"])
+        return f"{date_fmt} {time_fmt}"
+
+    def datetime64(
+        self,
+        n: int,
+        start: int = _CURRENT_YEAR,
+        end: int = _CURRENT_YEAR,
+        unit: str = "us",
+    ) -> t.Any:
+        """Generates a NumPy array of random naive datetime values.
 
-        return dt_obj.strftime(fmt)
+        The values are chosen uniformly from the range of the years
+        in one vectorized step, e.g. use ``unit="D"`` for dates
+        or ``unit="s"`` for datetime values without fractions of a second.
 
+        .. versionadded:: 18.1.0
+
+        :param n: Number of values.
+        :param start: Minimum value of year.
+        :param end: Maximum value of year.
+        :param unit: Unit of ``datetime64``, such as ``"D"``, ``"s"`` or ``"us"``.
+        :return: Array of ``datetime64`` values (:py:class:`numpy.ndarray`).
+        :raises ImportError: If numpy is not installed.
+        """
+        numpy = compat.numpy
+        if not numpy:
+            raise ImportError("NumPy output is supported only with numpy")
+
+        first = numpy.datetime64(f"{start:04d}-01-01", unit)
+        stop = numpy.datetime64(f"{end + 1:04d}-01-01", unit)
+        span = int((stop - first).astype(numpy.int64)) - 1
+        return _shift(first, self.random._randint_array(0, span, n), unit)
+
+    def _timestamp_batch(
+        self,
+        n: int,
+        fmt: TimestampFormat = TimestampFormat.POSIX,
+        **kwargs: t.Any,
+    ) -> list[t.Any]:
+        """Generates a list of random timestamps in given format.
+
+        POSIX timestamps are chosen uniformly from the range of seconds,
+        without creating datetime objects. The other formats format
+        the values of ``datetime.batch()``, in one vectorized step
+        when numpy is installed and the values are naive.
+
+        :param n: Number of timestamps.
+        :param fmt: Format of timestamp (Default is TimestampFormat.POSIX).
+        :param kwargs: Kwargs for :meth:`~.datetime()`.
+        :return: List of timestamps.
+        """
+        self.validate_enum(fmt, TimestampFormat)
+        numpy = compat.numpy
+
+        if fmt not in (TimestampFormat.RFC_3339, TimestampFormat.ISO_8601):
+            first, last = self._bounds(**kwargs)
+            return self.random.randint_batch(
+                int(first.timestamp()),
+                int(last.timestamp()),
+                n,
+            )
+
+        first, last = self._bounds(**kwargs)
+        # Naive values are formatted by NumPy in one vectorized step,
+        # unless NumPy would pad years before 1000, unlike strftime.
+        if (
+            numpy
+            and n >= NUMPY_BATCH_SIZE
+            and not kwargs.get("timezone")
+            and first.year >= 1000
+        ):
+            moments = self._moments64(first, last, n)
+            if fmt == TimestampFormat.RFC_3339:
+                stamps = numpy.datetime_as_string(moments, unit="s").tolist()
+                return [stamp + "Z" for stamp in stamps]
+            # Unlike isoformat(), NumPy doesn't omit zero microseconds.
+            return [
+                stamp[:19] if stamp.endswith(".000000") else stamp
+                for stamp in numpy.datetime_as_string(moments).tolist()
+            ]
+
+        if fmt == TimestampFormat.RFC_3339:
+            format_ = _compile_format(_RFC_3339).format
+            return [
+                format_(
+                    stamp.year,
+                    stamp.month,
+                    stamp.day,
+                    stamp.hour,
+                    stamp.minute,
+                    stamp.second,
+                )
+                for stamp in self._datetime_batch(n, **kwargs)
+            ]
+        return list(map(datetime.isoformat, self._datetime_batch(n, **kwargs)))
+
+    @batch_method(_timestamp_batch)
     def timestamp(
         self, fmt: TimestampFormat = TimestampFormat.POSIX, **kwargs: t.Any
     ) -> str | int:
@@ -275,16 +802,22 @@ class Datetime(BaseDataProvider):
         >>> dt.timestamp(fmt=TimestampFormat.ISO_8601)
         '2009-05-30T21:45:57.328600'
 
+        Use ``timestamp.batch(n, ...)`` to generate many values at once.
+        Like ``datetime.batch()``, it chooses moments uniformly from
+        the range of the years, unlike this method.
+
         :param fmt: Format of timestamp (Default is TimestampFormat.POSIX).
         :param kwargs: Kwargs for :meth:`~.datetime()`.
         :return: Timestamp.
         """
         self.validate_enum(fmt, TimestampFormat)
-        stamp = self.datetime(**kwargs)
 
         if fmt == TimestampFormat.RFC_3339:
-            return stamp.strftime("%Y-%m-%dT%H:%M:%SZ")
-        elif fmt == TimestampFormat.ISO_8601:
+            fields, _ = self._moment(**kwargs)
+            return _compile_format(_RFC_3339).format(*fields)
+
+        stamp = self.datetime(**kwargs)
+        if fmt == TimestampFormat.ISO_8601:
             return stamp.isoformat()
         else:
             return int(stamp.timestamp())
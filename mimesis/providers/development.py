@@ -3,14 +3,8 @@
 import typing as t
 from datetime import datetime
 
-from mimesis.datasets import (
-    LICENSES,
-    OS,
-    PROGRAMMING_LANGS,
-    STAGES,
-    SYSTEM_QUALITY_ATTRIBUTES,
-)
-from mimesis.providers.base import BaseProvider
+from mimesis import datasets
+from mimesis.providers.base import BaseProvider, choice_method
 
 __all__ = ["Development"]
 
@@ -24,6 +18,10 @@ class Development(BaseProvider):
     class Meta:
         name = "development"
 
+    def _licenses(self) -> t.Sequence[str]:
+        return datasets.LICENSES
+
+    @choice_method(_licenses)
     def software_license(self) -> str:
         """Generates a random software license.
 
@@ -32,7 +30,7 @@ class Development(BaseProvider):
         :Example:
             The BSD 3-Clause License.
         """
-        return self.random.choice(LICENSES)
+        return self.random.choice(self._licenses())
 
     def calver(self) -> str:
         """Generates a random calendar versioning string.
@@ -58,6 +56,10 @@ class Development(BaseProvider):
         major, minor, patch = self.random.randints(n=3, a=0, b=100)
         return f"{major}.{minor}.{patch}"
 
+    def _stages(self) -> t.Sequence[str]:
+        return datasets.STAGES
+
+    @choice_method(_stages)
     def stage(self) -> str:
         """Generates a random stage of development.
 
@@ -66,8 +68,12 @@ class Development(BaseProvider):
         :Example:
             Alpha.
         """
-        return self.random.choice(STAGES)
+        return self.random.choice(self._stages())
+
+    def _programming_languages(self) -> t.Sequence[str]:
+        return datasets.PROGRAMMING_LANGS
 
+    @choice_method(_programming_languages)
     def programming_language(self) -> str:
         """Generates a random programming language from the list.
 
@@ -76,8 +82,12 @@ class Development(BaseProvider):
         :Example:
             Erlang.
         """
-        return self.random.choice(PROGRAMMING_LANGS)
+        return self.random.choice(self._programming_languages())
 
+    def _operating_systems(self) -> t.Sequence[str]:
+        return datasets.OS
+
+    @choice_method(_operating_systems)
     def os(self) -> str:
         """Generates a random operating system or distributive name.
 
@@ -86,15 +96,23 @@ class Development(BaseProvider):
         :Example:
             Gentoo
         """
-        return self.random.choice(OS)
+        return self.random.choice(self._operating_systems())
+
+    def _booleans(self) -> t.Sequence[bool]:
+        return [True, False]
 
+    @choice_method(_booleans)
     def boolean(self) -> bool:
         """Generates a random boolean value.
 
         :return: True of False.
         """
-        return self.random.choice([True, False])
+        return self.random.choice(self._booleans())
+
+    def _system_quality_attributes(self) -> t.Sequence[str]:
+        return datasets.SYSTEM_QUALITY_ATTRIBUTES
 
+    @choice_method(_system_quality_attributes)
     def system_quality_attribute(self) -> str:
         """Generates a random system quality attribute.
 
@@ -105,7 +123,7 @@ class Development(BaseProvider):
 
         :return: System quality attribute.
         """
-        return self.random.choice(SYSTEM_QUALITY_ATTRIBUTES)
+        return self.random.choice(self._system_quality_attributes())
 
     def ility(self) -> str:
         """Generates a random system quality attribute.
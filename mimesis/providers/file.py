@@ -1,8 +1,10 @@
 """File data provider."""
 
-from mimesis.datasets import EXTENSIONS, FILENAMES, MIME_TYPES
+import typing as t
+
+from mimesis import datasets
 from mimesis.enums import FileType, MimeType
-from mimesis.providers.base import BaseProvider
+from mimesis.providers.base import BaseProvider, choice_method
 
 __all__ = ["File"]
 
@@ -13,6 +15,12 @@ class File(BaseProvider):
     class Meta:
         name = "file"
 
+    def _extensions(self, file_type: FileType | None = None) -> t.Sequence[str]:
+        key = self.validate_enum(item=file_type, enum=FileType)
+        extensions = datasets.EXTENSIONS[key]
+        return extensions
+
+    @choice_method(_extensions, file_type=FileType)
     def extension(self, file_type: FileType | None = None) -> str:
         """Generates a random file extension.
 
@@ -22,19 +30,21 @@ class File(BaseProvider):
         :Example:
             .py
         """
-        key = self.validate_enum(item=file_type, enum=FileType)
-        extensions = EXTENSIONS[key]
-        return self.random.choice(extensions)
+        return self.random.choice(self._extensions(file_type))
 
+    def _mime_types(self, type_: MimeType | None = None) -> t.Sequence[str]:
+        key = self.validate_enum(item=type_, enum=MimeType)
+        types = datasets.MIME_TYPES[key]
+        return types
+
+    @choice_method(_mime_types, type_=MimeType)
     def mime_type(self, type_: MimeType | None = None) -> str:
         """Generates a random mime type.
 
         :param type_: Enum object MimeType.
         :return: Mime type.
         """
-        key = self.validate_enum(item=type_, enum=MimeType)
-        types = MIME_TYPES[key]
-        return self.random.choice(types)
+        return self.random.choice(self._mime_types(type_))
 
     def size(self, minimum: int = 1, maximum: int = 100) -> str:
         """Generates a random file size as string.
@@ -60,5 +70,5 @@ class File(BaseProvider):
             legislative.txt
         """
         ext = self.extension(file_type)
-        name = self.random.choice(FILENAMES)
+        name = self.random.choice(datasets.FILENAMES)
         return f"{name}{ext}"
@@ -1,15 +1,9 @@
 """Business data provider."""
 
-from mimesis.datasets import (
-    CRYPTOCURRENCY_ISO_CODES,
-    CRYPTOCURRENCY_SYMBOLS,
-    CURRENCY_ISO_CODES,
-    CURRENCY_SYMBOLS,
-    STOCK_EXCHANGES,
-    STOCK_NAMES,
-    STOCK_TICKERS,
-)
-from mimesis.providers.base import BaseDataProvider
+import typing as t
+
+from mimesis import datasets
+from mimesis.providers.base import BaseDataProvider, choice_method
 
 __all__ = ["Finance"]
 
@@ -21,25 +15,33 @@ class Finance(BaseDataProvider):
         name = "finance"
         datafile = f"{name}.json"
 
+    def _companies(self) -> t.Sequence[str]:
+        names: list[str] = self._extract(["company", "name"])
+
+        return names
+
+    @choice_method(_companies)
     def company(self) -> str:
         """Generates a random company name.
 
         :return: Company name.
         """
-        names: list[str] = self._extract(["company", "name"])
+        return self.random.choice(self._companies())
 
-        return self.random.choice(names)
+    def _company_types(self, abbr: bool = False) -> t.Sequence[str]:
+        key = "abbr" if abbr else "title"
+
+        company_types: list[str] = self._extract(["company", "type", key])
+        return company_types
 
+    @choice_method(_company_types)
     def company_type(self, abbr: bool = False) -> str:
         """Generates a random type of business entity.
 
         :param abbr: Abbreviated company type.
         :return: Types of business entity.
         """
-        key = "abbr" if abbr else "title"
-
-        company_types: list[str] = self._extract(["company", "type", key])
-        return self.random.choice(company_types)
+        return self.random.choice(self._company_types(abbr))
 
     def currency_iso_code(self, allow_random: bool = False) -> str:
         """Returns a currency code for current locale.
@@ -50,37 +52,49 @@ class Finance(BaseDataProvider):
         code: str = self._extract(["currency-code"])
 
         if allow_random:
-            return self.random.choice(CURRENCY_ISO_CODES)
+            return self.random.choice(datasets.CURRENCY_ISO_CODES)
         return code
 
+    def _banks(self) -> t.Sequence[str]:
+        banks: list[str] = self._extract(["banks"])
+        return banks
+
+    @choice_method(_banks)
     def bank(self) -> str:
         """Generates a random bank name.
 
         :return: Bank name.
         """
-        banks: list[str] = self._extract(["banks"])
-        return self.random.choice(banks)
+        return self.random.choice(self._banks())
+
+    def _cryptocurrency_iso_codes(self) -> t.Sequence[str]:
+        return datasets.CRYPTOCURRENCY_ISO_CODES
 
+    @choice_method(_cryptocurrency_iso_codes)
     def cryptocurrency_iso_code(self) -> str:
         """Generates a random cryptocurrency ISO code.
 
         :return: Symbol of cryptocurrency.
         """
-        return self.random.choice(CRYPTOCURRENCY_ISO_CODES)
+        return self.random.choice(self._cryptocurrency_iso_codes())
 
     def currency_symbol(self) -> str:
         """Returns a currency symbol for current locale.
 
         :return: Currency symbol.
         """
-        return CURRENCY_SYMBOLS[self.locale]
+        return datasets.CURRENCY_SYMBOLS[self.locale]
 
+    def _cryptocurrency_symbols(self) -> t.Sequence[str]:
+        return datasets.CRYPTOCURRENCY_SYMBOLS
+
+    @choice_method(_cryptocurrency_symbols)
     def cryptocurrency_symbol(self) -> str:
         """Get a cryptocurrency symbol.
 
         :return: Symbol of cryptocurrency.
         """
-        return self.random.choice(CRYPTOCURRENCY_SYMBOLS)
+        return self.random.choice(self._cryptocurrency_symbols())
 
     def price(self, minimum: float = 500, maximum: float = 1500) -> float:
         """Generate a random price.
@@ -108,23 +122,35 @@ class Finance(BaseDataProvider):
             precision=7,
         )
 
+    def _stock_tickers(self) -> t.Sequence[str]:
+        return datasets.STOCK_TICKERS
+
+    @choice_method(_stock_tickers)
     def stock_ticker(self) -> str:
         """Generates a random stock ticker.
 
         :return: Ticker.
         """
-        return self.random.choice(STOCK_TICKERS)
+        return self.random.choice(self._stock_tickers())
 
+    def _stock_names(self) -> t.Sequence[str]:
+        return datasets.STOCK_NAMES
+
+    @choice_method(_stock_names)
     def stock_name(self) -> str:
         """Generates a stock name.
 
         :return: Stock name.
         """
-        return self.random.choice(STOCK_NAMES)
+        return self.random.choice(self._stock_names())
+
+    def _stock_exchanges(self) -> t.Sequence[str]:
+        return datasets.STOCK_EXCHANGES
 
+    @choice_method(_stock_exchanges)
     def stock_exchange(self) -> str:
         """Generates a stock exchange name.
 
         :return: Returns exchange name.
         """
-        return self.random.choice(STOCK_EXCHANGES)
+        return self.random.choice(self._stock_exchanges())
@@ -1,6 +1,8 @@
 """Provides data related to food."""
 
-from mimesis.providers.base import BaseDataProvider
+import typing as t
+
+from mimesis.providers.base import BaseDataProvider, choice_method
 
 __all__ = ["Food"]
 
@@ -12,11 +14,11 @@ class Food(BaseDataProvider):
         name = "food"
         datafile = f"{name}.json"
 
-    def _choice_from(self, key: str) -> str:
-        """Choice random element."""
-        data: list[str] = self._extract([key])
-        return self.random.choice(data)
+    def _vegetables(self) -> t.Sequence[str]:
+        vegetables: list[str] = self._extract(["vegetables"])
+        return vegetables
 
+    @choice_method(_vegetables)
     def vegetable(self) -> str:
         """Generates a random vegetable name.
 
@@ -25,8 +27,13 @@ class Food(BaseDataProvider):
         :Example:
             Tomato.
         """
-        return self._choice_from("vegetables")
+        return self.random.choice(self._vegetables())
+
+    def _fruits(self) -> t.Sequence[str]:
+        fruits: list[str] = self._extract(["fruits"])
+        return fruits
 
+    @choice_method(_fruits)
     def fruit(self) -> str:
         """Generates a random fruit or berry name.
 
@@ -35,8 +42,13 @@ class Food(BaseDataProvider):
         :Example:
             Banana.
         """
-        return self._choice_from("fruits")
+        return self.random.choice(self._fruits())
+
+    def _dishes(self) -> t.Sequence[str]:
+        dishes: list[str] = self._extract(["dishes"])
+        return dishes
 
+    @choice_method(_dishes)
     def dish(self) -> str:
         """Generates a random dish name.
 
@@ -45,8 +57,13 @@ class Food(BaseDataProvider):
         :Example:
             Ratatouille.
         """
-        return self._choice_from("dishes")
+        return self.random.choice(self._dishes())
 
+    def _spices(self) -> t.Sequence[str]:
+        spices: list[str] = self._extract(["spices"])
+        return spices
+
+    @choice_method(_spices)
     def spices(self) -> str:
         """Generates a random spices/herb name.
 
@@ -55,8 +72,13 @@ class Food(BaseDataProvider):
         :Example:
             Anise.
         """
-        return self._choice_from("spices")
+        return self.random.choice(self._spices())
+
+    def _drinks(self) -> t.Sequence[str]:
+        drinks: list[str] = self._extract(["drinks"])
+        return drinks
 
+    @choice_method(_drinks)
     def drink(self) -> str:
         """Generates a random drink name.
 
@@ -65,4 +87,4 @@ class Food(BaseDataProvider):
         :Example:
             Vodka.
         """
-        return self._choice_from("drinks")
+        return self.random.choice(self._drinks())
@@ -1,11 +1,12 @@
 """Provides all at one."""
 
+import functools
 import importlib
 import inspect
 import typing as t
 
 from mimesis.locales import Locale
-from mimesis.providers.base import BaseDataProvider, BaseProvider
+from mimesis.providers.base import BaseDataProvider, BaseProvider, BatchMethod
 from mimesis.types import MissingSeed, Seed
 
 __all__ = ["Generic"]
@@ -33,28 +34,81 @@ DEFAULT_PROVIDERS: tuple[str, ...] = (
 )
 
 
+@functools.cache
+def _default_providers() -> dict[str, type[BaseProvider]]:
+    """Get the default providers keyed by their names.
+
+    :return: Dict of provider classes.
+    """
+    # Providers are imported here to avoid a circular import.
+    module = importlib.import_module("mimesis.providers")
+    providers = {}
+    for name in DEFAULT_PROVIDERS:
+        provider = getattr(module, name)
+        providers[provider.Meta.name] = provider
+    return providers
+
+
+#: Names of the attributes which are a part of the provider API.
+_PROVIDER_API: t.Final[frozenset[str]] = frozenset(dir(BaseDataProvider))
+
+
+def _provider_methods(provider: t.Any) -> list[str]:
+    """Get the names of the public methods of a provider.
+
+    :param provider: Provider class or instance.
+    :return: List of method names.
+    """
+    methods = []
+    for name in dir(provider):
+        if name.startswith("_") or name in _PROVIDER_API:
+            continue
+        attribute = inspect.getattr_static(provider, name)
+        if isinstance(attribute, BatchMethod) or callable(attribute):
+            methods.append(name)
+    return methods
+
+
+@functools.cache
+def _default_index() -> dict[str, tuple[str, ...]]:
+    """Get the index of the methods of the default providers.
+
+    The index maps the names of methods to the sorted names
+    of the providers which have them.
+
+    :return: Index.
+    """
+    index: dict[str, tuple[str, ...]] = {}
+    for name, provider in _default_providers().items():
+        for method in _provider_methods(provider):
+            index[method] = tuple(sorted({*index.get(method, ()), name}))
+    return index
+
+
 class Generic(BaseProvider):
-    """Class which contain all providers at one."""
+    """Class which contain all providers at one.
+
+    The default providers are created on the first access to them,
+    so creating an instance of this class is cheap.
+    """
 
     def __init__(
         self,
         locale: Locale = Locale.DEFAULT,
         seed: Seed = MissingSeed,
+        shared_random: bool = False,
     ) -> None:
-        """Initialize attributes lazily."""
+        """Initialize attributes lazily.
+
+        :param locale: Locale of the locale-dependent providers.
+        :param seed: Seed for random.
+        :param shared_random: Use the random generator of this object
+            for all the providers, so they produce a single random stream.
+            By default, every provider has its own random generator.
+        """
         super().__init__(seed=seed)
         self.locale = locale
-
-        for provider in DEFAULT_PROVIDERS:
-            module = importlib.import_module("mimesis.providers")
-            provider = getattr(module, provider)
-            name = getattr(provider.Meta, "name")  # type: ignore
-
-            # Check if a provider is locale-dependent.
-            if issubclass(provider, BaseDataProvider):
-                setattr(self, f"_{name}", provider)
-            elif issubclass(provider, BaseProvider):
-                setattr(self, name, provider(seed=self.seed))
+        self._shared_random = shared_random
 
     class Meta:
         """Class for metadata."""
@@ -62,43 +116,65 @@ class Generic(BaseProvider):
         name: t.Final[str] = "generic"
 
     def __getattr__(self, attrname: str) -> t.Any:
-        """Get attribute without an underscore.
+        """Create a default provider on the first access to it.
 
         :param attrname: Attribute name.
         :return: An attribute.
         """
-        attribute = object.__getattribute__(self, "_" + attrname)
-        if attribute and callable(attribute):
-            self.__dict__[attrname] = attribute(
-                self.locale,
-                self.seed,
-            )
-            return self.__dict__[attrname]
+        try:
+            provider = _default_providers()[attrname]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {attrname!r}"
+            ) from None
+
+        kwargs = {}
+        # Check if a provider is locale-dependent.
+        if issubclass(provider, BaseDataProvider):
+            kwargs["locale"] = self.locale
+
+        if self._shared_random:
+            instance = self._share_random(provider, **kwargs)
+        else:
+            instance = provider(seed=self.seed, **kwargs)
+        self.__dict__[attrname] = instance
+        return instance
+
+    @functools.cached_property
+    def _index(self) -> dict[str, tuple[str, ...]]:
+        """Index of the methods of the providers.
+
+        It is shared between all instances until a custom provider is added.
+        """
+        return _default_index()
+
+    def find_providers(self, method: str) -> tuple[str, ...]:
+        """Find the providers which have a method.
+
+        The providers are not created to find it.
+
+        :param method: Name of the method.
+        :return: Sorted names of the providers.
+        """
+        return self._index.get(method, ())
 
     def __dir__(self) -> list[str]:
         """Available data providers.
 
         :return: List of attributes.
         """
-        attributes = []
-        exclude = list(BaseProvider().__dict__.keys())
-        # Exclude locale explicitly because
-        # it is not a provider.
-        exclude.append("locale")
-
-        for attr in self.__dict__:
-            if attr not in exclude:
-                if attr.startswith("_"):
-                    attribute = attr.replace("_", "", 1)
-                    attributes.append(attribute)
-                else:
-                    attributes.append(attr)
+        attributes = list(_default_providers())
+        for attr, value in self.__dict__.items():
+            if isinstance(value, BaseProvider) and attr not in attributes:
+                attributes.append(attr)
         return attributes
 
     def reseed(self, seed: Seed = MissingSeed) -> None:
         """Reseed the internal random generator.
 
         Overrides method `BaseProvider.reseed()`.
+        Only the providers which are already created are reseeded,
+        the others are created with the new seed.
 
         :param seed: Seed for random.
         :return: None.
@@ -106,12 +182,9 @@ class Generic(BaseProvider):
         # Make sure to reseed the random generator on Generic itself.
         super().reseed(seed)
 
-        for attr in self.__dir__():
-            try:
-                provider = getattr(self, attr)
-                provider.reseed(seed)
-            except AttributeError:
-                continue
+        for value in list(self.__dict__.values()):
+            if isinstance(value, BaseProvider):
+                value.reseed(seed)
 
     def add_provider(self, cls: t.Type[BaseProvider], **kwargs: t.Any) -> None:
         """Adds a custom provider to a Generic() object.
@@ -137,13 +210,37 @@ class Generic(BaseProvider):
             # Enforce the same seed is used across all providers.
             kwargs.pop("seed", None)
 
-            instance = cls(seed=self.seed, **kwargs)
-            if isinstance(instance, Generic):
+            if issubclass(cls, Generic):
                 raise TypeError("Cannot add Generic instance to itself.")
+
+            if self._shared_random:
+                instance = self._share_random(cls, **kwargs)
+            else:
+                instance = cls(seed=self.seed, **kwargs)
             setattr(self, name, instance)
+            self._add_to_index(name, instance)
         else:
             raise TypeError("The provider must be a class")
 
+    def _add_to_index(self, name: str, provider: BaseProvider) -> None:
+        """Add the methods of a provider to the index.
+
+        :param name: Name of the provider.
+        :param provider: Instance of the provider.
+        """
+        index = self._index
+        if index is _default_index():
+            # Copy on write, the default index is shared.
+            index = self._index = dict(index)
+
+        # The provider can replace another one with the same name.
+        for method, providers in index.items():
+            if name in providers:
+                index[method] = tuple(p for p in providers if p != name)
+
+        for method in _provider_methods(provider):
+            index[method] = tuple(sorted({*index.get(method, ()), name}))
+
     def add_providers(self, *providers: t.Type[BaseProvider]) -> None:
         """Adds multiple custom providers to a Generic() object.
 
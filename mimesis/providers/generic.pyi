@@ -7,6 +7,8 @@ from mimesis.types import Seed
 
 __all__ = ["Generic"]
 
+DEFAULT_PROVIDERS: tuple[str, ...]
+
 class Generic(BaseProvider):
     locale: Locale
     # Locale-dependent providers
@@ -32,12 +34,15 @@ class Generic(BaseProvider):
     science: providers.Science
     transport: providers.Transport
 
-    def __init__(self, locale: Locale = ..., seed: Seed = ...) -> None: ...
+    def __init__(
+        self, locale: Locale = ..., seed: Seed = ..., shared_random: bool = ...
+    ) -> None: ...
 
     class Meta:
         name: t.Final[str]
     def __getattr__(self, attrname: str) -> t.Any: ...
     def __dir__(self) -> list[str]: ...
+    def find_providers(self, method: str) -> tuple[str, ...]: ...
     def reseed(self, seed: Seed = ...) -> None: ...
     def add_provider(self, cls: t.Type[BaseProvider], **kwargs: t.Any) -> None: ...
     def add_providers(self, *providers: t.Type[BaseProvider]) -> None: ...
@@ -1,19 +1,9 @@
 """Provides data related to hardware."""
 
-from mimesis.datasets import (
-    CPU,
-    CPU_CODENAMES,
-    GENERATION,
-    GRAPHICS,
-    HDD_SSD,
-    MANUFACTURERS,
-    PHONE_MODELS,
-    RAM_SIZES,
-    RAM_TYPES,
-    RESOLUTIONS,
-    SCREEN_SIZES,
-)
-from mimesis.providers.base import BaseProvider
+import typing as t
+
+from mimesis import datasets
+from mimesis.providers.base import BaseProvider, choice_method
 
 __all__ = ["Hardware"]
 
@@ -26,6 +16,10 @@ class Hardware(BaseProvider):
 
         name = "hardware"
 
+    def _resolutions(self) -> t.Sequence[str]:
+        return datasets.RESOLUTIONS
+
+    @choice_method(_resolutions)
     def resolution(self) -> str:
         """Generates a random screen resolution.
 
@@ -34,8 +28,12 @@ class Hardware(BaseProvider):
         :Example:
             1280x720.
         """
-        return self.random.choice(RESOLUTIONS)
+        return self.random.choice(self._resolutions())
+
+    def _screen_sizes(self) -> t.Sequence[str]:
+        return datasets.SCREEN_SIZES
 
+    @choice_method(_screen_sizes)
     def screen_size(self) -> str:
         """Generates a random size of screen in inch.
 
@@ -44,8 +42,12 @@ class Hardware(BaseProvider):
         :Example:
             13″.
         """
-        return self.random.choice(SCREEN_SIZES)
+        return self.random.choice(self._screen_sizes())
 
+    def _cpus(self) -> t.Sequence[str]:
+        return datasets.CPU
+
+    @choice_method(_cpus)
     def cpu(self) -> str:
         """Generates a random CPU name.
 
@@ -54,7 +56,7 @@ class Hardware(BaseProvider):
         :Example:
             Intel® Core i7.
         """
-        return self.random.choice(CPU)
+        return self.random.choice(self._cpus())
 
     def cpu_frequency(self) -> str:
         """Generates a random frequency of CPU.
@@ -67,6 +69,10 @@ class Hardware(BaseProvider):
         frequency = self.random.uniform(a=1.5, b=4.3, precision=1)
         return f"{frequency}GHz"
 
+    def _generations(self) -> t.Sequence[str]:
+        return datasets.GENERATION
+
+    @choice_method(_generations)
     def generation(self) -> str:
         """Generates a random generation.
 
@@ -75,8 +81,12 @@ class Hardware(BaseProvider):
         :Example:
              6th Generation.
         """
-        return self.random.choice(GENERATION)
+        return self.random.choice(self._generations())
+
+    def _cpu_codenames(self) -> t.Sequence[str]:
+        return datasets.CPU_CODENAMES
 
+    @choice_method(_cpu_codenames)
     def cpu_codename(self) -> str:
         """Generates a random CPU code name.
 
@@ -85,8 +95,12 @@ class Hardware(BaseProvider):
         :Example:
             Cannonlake.
         """
-        return self.random.choice(CPU_CODENAMES)
+        return self.random.choice(self._cpu_codenames())
 
+    def _ram_types(self) -> t.Sequence[str]:
+        return datasets.RAM_TYPES
+
+    @choice_method(_ram_types)
     def ram_type(self) -> str:
         """Generates a random RAM type.
 
@@ -95,8 +109,12 @@ class Hardware(BaseProvider):
         :Example:
             DDR3.
         """
-        return self.random.choice(RAM_TYPES)
+        return self.random.choice(self._ram_types())
+
+    def _ram_sizes(self) -> t.Sequence[str]:
+        return datasets.RAM_SIZES
 
+    @choice_method(_ram_sizes)
     def ram_size(self) -> str:
         """Generates a random size of RAM.
 
@@ -105,8 +123,12 @@ class Hardware(BaseProvider):
         :Example:
             16GB.
         """
-        return self.random.choice(RAM_SIZES)
+        return self.random.choice(self._ram_sizes())
+
+    def _drive_types(self) -> t.Sequence[str]:
+        return datasets.HDD_SSD
 
+    @choice_method(_drive_types)
     def ssd_or_hdd(self) -> str:
         """Generates a random type of disk.
 
@@ -115,8 +137,12 @@ class Hardware(BaseProvider):
         :Example:
             512GB SSD.
         """
-        return self.random.choice(HDD_SSD)
+        return self.random.choice(self._drive_types())
 
+    def _graphics(self) -> t.Sequence[str]:
+        return datasets.GRAPHICS
+
+    @choice_method(_graphics)
     def graphics(self) -> str:
         """Generates a random graphics card name.
 
@@ -125,8 +151,12 @@ class Hardware(BaseProvider):
         :Example:
             Intel® Iris™ Pro Graphics 6200.
         """
-        return self.random.choice(GRAPHICS)
+        return self.random.choice(self._graphics())
+
+    def _manufacturers(self) -> t.Sequence[str]:
+        return datasets.MANUFACTURERS
 
+    @choice_method(_manufacturers)
     def manufacturer(self) -> str:
         """Generates a random manufacturer of hardware.
 
@@ -135,8 +165,12 @@ class Hardware(BaseProvider):
         :Example:
             Dell.
         """
-        return self.random.choice(MANUFACTURERS)
+        return self.random.choice(self._manufacturers())
+
+    def _phone_models(self) -> t.Sequence[str]:
+        return datasets.PHONE_MODELS
 
+    @choice_method(_phone_models)
     def phone_model(self) -> str:
         """Generates a random phone model.
 
@@ -145,4 +179,4 @@ class Hardware(BaseProvider):
         :Example:
             Nokia Lumia 920.
         """
-        return self.random.choice(PHONE_MODELS)
+        return self.random.choice(self._phone_models())
@@ -1,5 +1,6 @@
 """Provides data related to internet."""
 
+import functools
 import typing as t
 import urllib.error
 import urllib.parse
@@ -7,19 +8,7 @@ import urllib.request
 from base64 import b64encode
 from ipaddress import IPv4Address, IPv6Address
 
-from mimesis.datasets import (
-    CONTENT_ENCODING_DIRECTIVES,
-    CORS_OPENER_POLICIES,
-    CORS_RESOURCE_POLICIES,
-    HTTP_METHODS,
-    HTTP_SERVERS,
-    HTTP_STATUS_CODES,
-    HTTP_STATUS_MSGS,
-    PUBLIC_DNS,
-    TLD,
-    USER_AGENTS,
-    USERNAMES,
-)
+from mimesis import datasets
 from mimesis.enums import (
     DSNType,
     IPv4Purpose,
@@ -29,7 +18,7 @@ from mimesis.enums import (
     TLDType,
     URLScheme,
 )
-from mimesis.providers.base import BaseProvider
+from mimesis.providers.base import BaseProvider, choice_method
 from mimesis.providers.code import Code
 from mimesis.providers.date import Datetime
 from mimesis.providers.file import File
@@ -45,35 +34,29 @@ class Internet(BaseProvider):
     _MAX_IPV4: t.Final[int] = (2**32) - 1
     _MAX_IPV6: t.Final[int] = (2**128) - 1
 
-    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Initialize attributes.
-
-        :param args: Arguments.
-        :param kwargs: Keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-        self._file = File(
-            seed=self.seed,
-            random=self.random,
-        )
-        self._code = Code(
-            seed=self.seed,
-            random=self.random,
-        )
-        self._text = Text(
-            locale=Locale.EN,
-            seed=self.seed,
-            random=self.random,
-        )
-        self._datetime = Datetime(
-            locale=Locale.EN,
-            seed=self.seed,
-            random=self.random,
-        )
-
     class Meta:
         name = "internet"
 
+    @functools.cached_property
+    def _file(self) -> File:
+        """File provider, which is created on the first use."""
+        return self._share_random(File)
+
+    @functools.cached_property
+    def _code(self) -> Code:
+        """Code provider, which is created on the first use."""
+        return self._share_random(Code)
+
+    @functools.cached_property
+    def _text(self) -> Text:
+        """Text provider, which is created on the first use."""
+        return self._share_random(Text, locale=Locale.EN)
+
+    @functools.cached_property
+    def _datetime(self) -> Datetime:
+        """Datetime provider, which is created on the first use."""
+        return self._share_random(Datetime, locale=Locale.EN)
+
     def content_type(self, mime_type: MimeType | None = None) -> str:
         """Generates a random HTTP content type.
 
@@ -94,6 +77,10 @@ class Internet(BaseProvider):
         scheme, port = self.validate_enum(dsn_type, DSNType)
         return f"{scheme}://{hostname}:{port}"
 
+    def _http_status_messages(self) -> t.Sequence[str]:
+        return datasets.HTTP_STATUS_MSGS
+
+    @choice_method(_http_status_messages)
     def http_status_message(self) -> str:
         """Generates a random HTTP status message.
 
@@ -102,8 +89,12 @@ class Internet(BaseProvider):
         :Example:
             200 OK
         """
-        return self.random.choice(HTTP_STATUS_MSGS)
+        return self.random.choice(self._http_status_messages())
+
+    def _http_status_codes(self) -> t.Sequence[int]:
+        return datasets.HTTP_STATUS_CODES
 
+    @choice_method(_http_status_codes)
     def http_status_code(self) -> int:
         """Generates a random HTTP status code.
 
@@ -112,8 +103,12 @@ class Internet(BaseProvider):
         :Example:
             200
         """
-        return self.random.choice(HTTP_STATUS_CODES)
+        return self.random.choice(self._http_status_codes())
+
+    def _http_methods(self) -> t.Sequence[str]:
+        return datasets.HTTP_METHODS
 
+    @choice_method(_http_methods)
     def http_method(self) -> str:
         """Generates a random HTTP method.
 
@@ -122,7 +117,7 @@ class Internet(BaseProvider):
         :Example:
             POST
         """
-        return self.random.choice(HTTP_METHODS)
+        return self.random.choice(self._http_methods())
 
     def ip_v4_object(self) -> IPv4Address:
         """Generates a random :py:class:`ipaddress.IPv4Address` object.
@@ -247,7 +242,7 @@ class Internet(BaseProvider):
         :return: Hostname.
         """
         tld = self.tld(tld_type=tld_type)
-        host = self.random.choice(USERNAMES)
+        host = self.random.choice(datasets.USERNAMES)
 
         if subdomains:
             subdomain = self.random.choice(subdomains)
@@ -339,6 +334,11 @@ class Internet(BaseProvider):
 
         return dict(zip(pick_unique_words(length), self._text.words(length)))
 
+    def _top_level_domains(self, tld_type: TLDType = TLDType.CCTLD) -> t.Sequence[str]:
+        key = self.validate_enum(item=tld_type, enum=TLDType)
+        return datasets.TLD[key]
+
+    @choice_method(_top_level_domains, tld_type=TLDType)
     def top_level_domain(self, tld_type: TLDType = TLDType.CCTLD) -> str:
         """Generates random top level domain.
 
@@ -346,8 +346,7 @@ class Internet(BaseProvider):
         :return: Top level domain.
         :raises NonEnumerableError: if tld_type not in :class:`enums.TLDType`.
         """
-        key = self.validate_enum(item=tld_type, enum=TLDType)
-        return self.random.choice(TLD[key])
+        return self.random.choice(self._top_level_domains(tld_type))
 
     def tld(self, *args: t.Any, **kwargs: t.Any) -> str:
         """Generates a random TLD.
@@ -356,6 +355,10 @@ class Internet(BaseProvider):
         """
         return self.top_level_domain(*args, **kwargs)
 
+    def _user_agents(self) -> t.Sequence[str]:
+        return datasets.USER_AGENTS
+
+    @choice_method(_user_agents)
     def user_agent(self) -> str:
         """Get a random user agent.
 
@@ -365,7 +368,7 @@ class Internet(BaseProvider):
             Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:15.0)
             Gecko/20100101 Firefox/15.0.1
         """
-        return self.random.choice(USER_AGENTS)
+        return self.random.choice(self._user_agents())
 
     def port(self, port_range: PortRange = PortRange.ALL) -> int:
         """Generates a random port.
@@ -408,13 +411,17 @@ class Internet(BaseProvider):
 
         return "-".join(self._text.words(parts_count))
 
+    def _public_dns(self) -> t.Sequence[str]:
+        return datasets.PUBLIC_DNS
+
+    @choice_method(_public_dns)
     def public_dns(self) -> str:
         """Generates a random public DNS.
 
         :Example:
             1.1.1.1
         """
-        return self.random.choice(PUBLIC_DNS)
+        return self.random.choice(self._public_dns())
 
     def http_response_headers(self) -> dict[str, t.Any]:
         """Generates a random HTTP response headers.
@@ -458,7 +465,7 @@ class Internet(BaseProvider):
         headers = {
             "Allow": "*",
             "Age": max_age,
-            "Server": self.random.choice(HTTP_SERVERS),
+            "Server": self.random.choice(datasets.HTTP_SERVERS),
             "Content-Type": self._file.mime_type(),
             "X-Request-ID": self.random.randbytes(16).hex(),
             "Content-Language": self._code.locale_code(),
@@ -469,9 +476,15 @@ class Internet(BaseProvider):
             "X-XSS-Protection": 1,
             "Connection": self.random.choice(["close", "keep-alive"]),
             "X-Frame-Options": self.random.choice(["DENY", "SAMEORIGIN"]),
-            "Content-Encoding": self.random.choice(CONTENT_ENCODING_DIRECTIVES),
-            "Cross-Origin-Opener-Policy": self.random.choice(CORS_OPENER_POLICIES),
-            "Cross-Origin-Resource-Policy": self.random.choice(CORS_RESOURCE_POLICIES),
+            "Content-Encoding": self.random.choice(
+                datasets.CONTENT_ENCODING_DIRECTIVES,
+            ),
+            "Cross-Origin-Opener-Policy": self.random.choice(
+                datasets.CORS_OPENER_POLICIES,
+            ),
+            "Cross-Origin-Resource-Policy": self.random.choice(
+                datasets.CORS_RESOURCE_POLICIES,
+            ),
             "Strict-Transport-Security": f"max-age={max_age}",
         }
         return headers
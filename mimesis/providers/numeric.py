@@ -1,5 +1,6 @@
 """Provides data related to numbers."""
 
+import threading
 import typing as t
 from collections import defaultdict
 from decimal import Decimal
@@ -18,16 +19,36 @@ class Numeric(BaseProvider):
         super().__init__(*args, **kwargs)
         self.__increment_dict: t.DefaultDict[str, int] = defaultdict(int)
         self.__default_accumulator_value: t.Final[str] = "default"
+        self.__lock = threading.Lock()
 
     class Meta:
         name = "numeric"
 
+    def __getstate__(self) -> dict[str, t.Any]:
+        state = super().__getstate__()
+        # Locks can't be pickled, a new one is created on unpickling.
+        del state["_Numeric__lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, t.Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def _share_counters(self, other: "Numeric") -> None:
+        """Use the counters of :meth:`increment` of another instance.
+
+        :param other: Instance whose counters are shared.
+        """
+        self.__increment_dict = other.__increment_dict
+        self.__lock = other.__lock
+
     def increment(self, accumulator: str | None = None) -> int:
         """Generates an incrementing number.
 
         Each call of this method returns an incrementing number (with the step of +1).
 
         If **accumulator** passed then increments number associated with it.
+        The counters are safe to use from multiple threads.
 
         Example:
             >>> self.increment()
@@ -49,8 +70,9 @@ class Numeric(BaseProvider):
         if not accumulator:
             accumulator = self.__default_accumulator_value
 
-        self.__increment_dict[accumulator] += 1
-        return self.__increment_dict[accumulator]
+        with self.__lock:
+            self.__increment_dict[accumulator] += 1
+            return self.__increment_dict[accumulator]
 
     def float_number(
         self, start: float = -1000.0, end: float = 1000.0, precision: int = 15
@@ -4,13 +4,7 @@ import sys
 import typing as t
 from pathlib import PurePosixPath, PureWindowsPath
 
-from mimesis.datasets import (
-    FOLDERS,
-    PLATFORMS,
-    PROGRAMMING_LANGS,
-    PROJECT_NAMES,
-    USERNAMES,
-)
+from mimesis import datasets
 from mimesis.providers.base import BaseProvider
 
 __all__ = ["Path"]
@@ -36,7 +30,7 @@ class Path(BaseProvider):
             platform = "freebsd"
         self.platform = platform
         self._pathlib_home = PureWindowsPath() if "win" in platform else PurePosixPath()
-        self._pathlib_home /= PLATFORMS[platform]["home"]
+        self._pathlib_home /= datasets.PLATFORMS[platform]["home"]
 
     class Meta:
         name = "path"
@@ -69,7 +63,7 @@ class Path(BaseProvider):
         :Example:
             /home/oretha
         """
-        user = self.random.choice(USERNAMES)
+        user = self.random.choice(datasets.USERNAMES)
         user = user.capitalize() if "win" in self.platform else user.lower()
         return str(self._pathlib_home / user)
 
@@ -82,7 +76,7 @@ class Path(BaseProvider):
             /home/taneka/Pictures
         """
         user = self.user()
-        folder = self.random.choice(FOLDERS)
+        folder = self.random.choice(datasets.FOLDERS)
         return str(self._pathlib_home / user / folder)
 
     def dev_dir(self) -> str:
@@ -95,7 +89,7 @@ class Path(BaseProvider):
         """
         user = self.user()
         folder = self.random.choice(["Development", "Dev"])
-        stack = self.random.choice(PROGRAMMING_LANGS)
+        stack = self.random.choice(datasets.PROGRAMMING_LANGS)
         return str(self._pathlib_home / user / folder / stack)
 
     def project_dir(self) -> str:
@@ -107,5 +101,5 @@ class Path(BaseProvider):
             /home/sherika/Development/Falcon/mercenary
         """
         dev_dir = self.dev_dir()
-        project = self.random.choice(PROJECT_NAMES)
+        project = self.random.choice(datasets.PROJECT_NAMES)
         return str(self._pathlib_home / dev_dir / project)
@@ -1,14 +1,15 @@
 """Provides data related to payment."""
 
+import functools
 import re
 import string
 import typing as t
 
-from mimesis.datasets import CREDIT_CARD_NETWORKS
+from mimesis import datasets
 from mimesis.enums import CardType, Gender
 from mimesis.exceptions import NonEnumerableError
 from mimesis.locales import Locale
-from mimesis.providers.base import BaseProvider
+from mimesis.providers.base import BaseProvider, choice_method
 from mimesis.providers.person import Person
 from mimesis.shortcuts import luhn_checksum
 
@@ -18,22 +19,14 @@ __all__ = ["Payment"]
 class Payment(BaseProvider):
     """Class that provides data related to payments."""
 
-    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Initialize attributes.
-
-        :param args: Arguments.
-        :param kwargs: Keyword arguments.
-        """
-        super().__init__(*args, **kwargs)
-        self._person = Person(
-            locale=Locale.EN,
-            seed=self.seed,
-            random=self.random,
-        )
-
     class Meta:
         name = "payment"
 
+    @functools.cached_property
+    def _person(self) -> Person:
+        """Person provider, which is created on the first use."""
+        return self._share_random(Person, locale=Locale.EN)
+
     def cid(self) -> str:
         """Generates a random CID.
 
@@ -84,6 +77,10 @@ class Payment(BaseProvider):
         address = bits.to_bytes(20, byteorder="big")
         return "0x" + address.hex()
 
+    def _credit_card_networks(self) -> t.Sequence[str]:
+        return datasets.CREDIT_CARD_NETWORKS
+
+    @choice_method(_credit_card_networks)
     def credit_card_network(self) -> str:
         """Generates a random credit card network.
 
@@ -92,7 +89,7 @@ class Payment(BaseProvider):
         :Example:
             MasterCard
         """
-        return self.random.choice(CREDIT_CARD_NETWORKS)
+        return self.random.choice(self._credit_card_networks())
 
     def credit_card_number(self, card_type: CardType | None = None) -> str:
         """Generates a random credit card number.
@@ -7,16 +7,9 @@ import uuid
 from datetime import date, datetime
 from string import ascii_letters, digits, punctuation
 
-from mimesis.datasets import (
-    BLOOD_GROUPS,
-    CALLING_CODES,
-    EMAIL_DOMAINS,
-    GENDER_CODES,
-    GENDER_SYMBOLS,
-    USERNAMES,
-)
+from mimesis import datasets
 from mimesis.enums import Gender, TitleType
-from mimesis.providers.base import BaseDataProvider
+from mimesis.providers.base import BaseDataProvider, choice_method
 from mimesis.types import Date
 
 __all__ = ["Person"]
@@ -83,6 +76,12 @@ class Person(BaseDataProvider):
         day = self.random.randint(1, max_day)
         return date(year=year, month=month, day=day)
 
+    def _names(self, gender: Gender | None = None) -> t.Sequence[str]:
+        key = self.validate_enum(gender, Gender)
+        names: list[str] = self._extract(["names", key])
+        return names
+
+    @choice_method(_names, gender=Gender)
     def name(self, gender: Gender | None = None) -> str:
         """Generates a random name.
 
@@ -92,9 +91,7 @@ class Person(BaseDataProvider):
         :Example:
             John.
         """
-        key = self.validate_enum(gender, Gender)
-        names: list[str] = self._extract(["names", key])
-        return self.random.choice(names)
+        return self.random.choice(self._names(gender))
 
     def first_name(self, gender: Gender | None = None) -> str:
         """Generates a random first name.
@@ -106,6 +103,17 @@ class Person(BaseDataProvider):
         """
         return self.name(gender)
 
+    def _surnames(self, gender: Gender | None = None) -> t.Sequence[str]:
+        surnames: t.Sequence[str] = self._extract(["surnames"])
+
+        # Surnames separated by gender.
+        if isinstance(surnames, dict):
+            key = self.validate_enum(gender, Gender)
+            surnames = surnames[key]
+
+        return surnames
+
+    @choice_method(_surnames, gender=Gender)
     def surname(self, gender: Gender | None = None) -> str:
         """Generates a random surname.
 
@@ -115,14 +123,7 @@ class Person(BaseDataProvider):
         :Example:
             Smith.
         """
-        surnames: t.Sequence[str] = self._extract(["surnames"])
-
-        # Surnames separated by gender.
-        if isinstance(surnames, dict):
-            key = self.validate_enum(gender, Gender)
-            surnames = surnames[key]
-
-        return self.random.choice(surnames)
+        return self.random.choice(self._surnames(gender))
 
     def last_name(self, gender: Gender | None = None) -> str:
         """Generates a random last name.
@@ -134,6 +135,18 @@ class Person(BaseDataProvider):
         """
         return self.surname(gender)
 
+    def _titles(
+        self,
+        gender: Gender | None = None,
+        title_type: TitleType | None = None,
+    ) -> t.Sequence[str]:
+        gender_key = self.validate_enum(gender, Gender)
+        title_key = self.validate_enum(title_type, TitleType)
+
+        titles: list[str] = self._extract(["title", gender_key, title_key])
+        return titles
+
+    @choice_method(_titles, gender=Gender, title_type=TitleType)
     def title(
         self,
         gender: Gender | None = None,
@@ -152,11 +165,7 @@ class Person(BaseDataProvider):
         :Example:
             PhD.
         """
-        gender_key = self.validate_enum(gender, Gender)
-        title_key = self.validate_enum(title_type, TitleType)
-
-        titles: list[str] = self._extract(["title", gender_key, title_key])
-        return self.random.choice(titles)
+        return self.random.choice(self._titles(gender, title_type))
 
     def full_name(
         self,
@@ -220,7 +229,7 @@ class Person(BaseDataProvider):
 
         final_username = ""
         for tag in tags:
-            username = self.random.choice(USERNAMES)
+            username = self.random.choice(datasets.USERNAMES)
             if tag == "C":
                 final_username += username.capitalize()
             if tag == "U":
@@ -275,7 +284,7 @@ class Person(BaseDataProvider):
             )
 
         if not domains:
-            domains = EMAIL_DOMAINS
+            domains = datasets.EMAIL_DOMAINS
 
         domain = self.random.choice(domains)
 
@@ -289,14 +298,22 @@ class Person(BaseDataProvider):
 
         return f"{name}{domain}"
 
+    def _gender_symbols(self) -> t.Sequence[str]:
+        return datasets.GENDER_SYMBOLS
+
+    @choice_method(_gender_symbols)
     def gender_symbol(self) -> str:
         """Generate a random sex symbol.
 
         :Example:
             ♂
         """
-        return self.random.choice(GENDER_SYMBOLS)
+        return self.random.choice(self._gender_symbols())
+
+    def _gender_codes(self) -> t.Sequence[int]:
+        return datasets.GENDER_CODES
 
+    @choice_method(_gender_codes)
     def gender_code(self) -> int:
         """Generate a random ISO/IEC 5218 gender code.
 
@@ -310,16 +327,20 @@ class Person(BaseDataProvider):
 
         :return:
         """
-        return self.random.choice(GENDER_CODES)
+        return self.random.choice(self._gender_codes())
+
+    def _genders(self) -> t.Sequence[str]:
+        genders: list[str] = self._extract(["gender"])
+        return genders
 
+    @choice_method(_genders)
     def gender(self) -> str:
         """Generates a random gender title.
 
         :Example:
             Male
         """
-        genders: list[str] = self._extract(["gender"])
-        return self.random.choice(genders)
+        return self.random.choice(self._genders())
 
     def sex(self) -> str:
         """An alias for method :meth:`~.gender`.
@@ -353,6 +374,10 @@ class Person(BaseDataProvider):
         """
         return self.random.randint(minimum, maximum)
 
+    def _blood_types(self) -> t.Sequence[str]:
+        return datasets.BLOOD_GROUPS
+
+    @choice_method(_blood_types)
     def blood_type(self) -> str:
         """Generates a random blood type.
 
@@ -361,8 +386,13 @@ class Person(BaseDataProvider):
         :Example:
             A+
         """
-        return self.random.choice(BLOOD_GROUPS)
+        return self.random.choice(self._blood_types())
 
+    def _occupations(self) -> t.Sequence[str]:
+        jobs: list[str] = self._extract(["occupation"])
+        return jobs
+
+    @choice_method(_occupations)
     def occupation(self) -> str:
         """Generates a random job.
 
@@ -371,9 +401,13 @@ class Person(BaseDataProvider):
         :Example:
             Programmer.
         """
-        jobs: list[str] = self._extract(["occupation"])
-        return self.random.choice(jobs)
+        return self.random.choice(self._occupations())
 
+    def _political_views(self) -> t.Sequence[str]:
+        views: list[str] = self._extract(["political_views"])
+        return views
+
+    @choice_method(_political_views)
     def political_views(self) -> str:
         """Get a random political views.
 
@@ -382,9 +416,13 @@ class Person(BaseDataProvider):
         :Example:
             Liberal.
         """
-        views: list[str] = self._extract(["political_views"])
-        return self.random.choice(views)
+        return self.random.choice(self._political_views())
+
+    def _worldviews(self) -> t.Sequence[str]:
+        views: list[str] = self._extract(["worldview"])
+        return views
 
+    @choice_method(_worldviews)
     def worldview(self) -> str:
         """Generates a random worldview.
 
@@ -393,9 +431,13 @@ class Person(BaseDataProvider):
         :Example:
             Pantheism.
         """
-        views: list[str] = self._extract(["worldview"])
-        return self.random.choice(views)
+        return self.random.choice(self._worldviews())
 
+    def _views_on(self) -> t.Sequence[str]:
+        views: list[str] = self._extract(["views_on"])
+        return views
+
+    @choice_method(_views_on)
     def views_on(self) -> str:
         """Get a random views on.
 
@@ -404,9 +446,19 @@ class Person(BaseDataProvider):
         :Example:
             Negative.
         """
-        views: list[str] = self._extract(["views_on"])
-        return self.random.choice(views)
+        return self.random.choice(self._views_on())
+
+    def _nationalities(self, gender: Gender | None = None) -> t.Sequence[str]:
+        nationalities: list[str] = self._extract(["nationality"])
+
+        # Separated by gender
+        if isinstance(nationalities, dict):
+            key = self.validate_enum(gender, Gender)
+            nationalities = nationalities[key]
 
+        return nationalities
+
+    @choice_method(_nationalities, gender=Gender)
     def nationality(self, gender: Gender | None = None) -> str:
         """Generates a random nationality.
 
@@ -416,15 +468,13 @@ class Person(BaseDataProvider):
         :Example:
             Russian
         """
-        nationalities: list[str] = self._extract(["nationality"])
-
-        # Separated by gender
-        if isinstance(nationalities, dict):
-            key = self.validate_enum(gender, Gender)
-            nationalities = nationalities[key]
+        return self.random.choice(self._nationalities(gender))
 
-        return self.random.choice(nationalities)
+    def _universities(self) -> t.Sequence[str]:
+        universities: list[str] = self._extract(["university"])
+        return universities
 
+    @choice_method(_universities)
     def university(self) -> str:
         """Generates a random university name.
 
@@ -433,9 +483,13 @@ class Person(BaseDataProvider):
         :Example:
             MIT.
         """
-        universities: list[str] = self._extract(["university"])
-        return self.random.choice(universities)
+        return self.random.choice(self._universities())
+
+    def _academic_degrees(self) -> t.Sequence[str]:
+        degrees: list[str] = self._extract(["academic_degree"])
+        return degrees
 
+    @choice_method(_academic_degrees)
     def academic_degree(self) -> str:
         """Generates a random academic degree.
 
@@ -444,9 +498,13 @@ class Person(BaseDataProvider):
         :Example:
             Bachelor.
         """
-        degrees: list[str] = self._extract(["academic_degree"])
-        return self.random.choice(degrees)
+        return self.random.choice(self._academic_degrees())
+
+    def _languages(self) -> t.Sequence[str]:
+        languages: list[str] = self._extract(["language"])
+        return languages
 
+    @choice_method(_languages)
     def language(self) -> str:
         """Generates a random language name.
 
@@ -455,8 +513,7 @@ class Person(BaseDataProvider):
         :Example:
             Irish.
         """
-        languages: list[str] = self._extract(["language"])
-        return self.random.choice(languages)
+        return self.random.choice(self._languages())
 
     def phone_number(self, mask: str = "", placeholder: str = "#") -> str:
         """Generates a random phone number.
@@ -469,7 +526,7 @@ class Person(BaseDataProvider):
             +7-(963)-409-11-22.
         """
         if not mask:
-            code = self.random.choice(CALLING_CODES)
+            code = self.random.choice(datasets.CALLING_CODES)
             default = f"{code}-(###)-###-####"
             masks = self._extract(["telephone_fmt"], default=[default])
             mask = self.random.choice(masks)
@@ -1,8 +1,10 @@
 """Provides pseudo-scientific data."""
 
-from mimesis.datasets import SI_PREFIXES, SI_PREFIXES_SYM
+import typing as t
+
+from mimesis import datasets
 from mimesis.enums import MeasureUnit, MetricPrefixSign
-from mimesis.providers.base import BaseProvider
+from mimesis.providers.base import BaseProvider, choice_method
 
 __all__ = ["Science"]
 
@@ -55,6 +57,15 @@ class Science(BaseProvider):
             return result[1]
         return result[0]
 
+    def _metric_prefixes(
+        self, sign: MetricPrefixSign | None = None, symbol: bool = False
+    ) -> t.Sequence[str]:
+        prefixes = datasets.SI_PREFIXES_SYM if symbol else datasets.SI_PREFIXES
+
+        key = self.validate_enum(item=sign, enum=MetricPrefixSign)
+        return prefixes[key]
+
+    @choice_method(_metric_prefixes, sign=MetricPrefixSign)
     def metric_prefix(
         self, sign: MetricPrefixSign | None = None, symbol: bool = False
     ) -> str:
@@ -68,7 +79,4 @@ class Science(BaseProvider):
         :Example:
             mega
         """
-        prefixes = SI_PREFIXES_SYM if symbol else SI_PREFIXES
-
-        key = self.validate_enum(item=sign, enum=MetricPrefixSign)
-        return self.random.choice(prefixes[key])
+        return self.random.choice(self._metric_prefixes(sign, symbol))
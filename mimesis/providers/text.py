@@ -1,21 +1,35 @@
 """Provides data related to text."""
+import functools
 import typing as t
 
-from mimesis.datasets import SAFE_COLORS
+from mimesis import datasets
 from mimesis.enums import EmojyCategory
-from mimesis.providers.base import BaseDataProvider
+from mimesis.providers.base import BaseDataProvider, choice_method
 
 __all__ = ["Text"]
 
 
+def _decode_emoji(symbol: str | list[str]) -> str:
+    """Decode hex code points of an emoji into a string."""
+    # Some emoji consist of multiple Unicode characters.
+    if isinstance(symbol, list):
+        return "".join([chr(int(s, 16)) for s in symbol])
+    return chr(int(symbol, 16))
+
+
+@functools.cache
+def _emojis() -> dict[str, tuple[str, ...]]:
+    """Get the emojis of each category, which are decoded once per process."""
+    emojis = BaseDataProvider._read_global_file("emojis.json")
+    return {
+        category: tuple(map(_decode_emoji, symbols))
+        for category, symbols in emojis.items()
+    }
+
+
 class Text(BaseDataProvider):
     """Class for generating text data."""
 
-    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Initialize attributes."""
-        super().__init__(*args, **kwargs)
-        self._emojis = self._read_global_file("emojis.json")
-
     class Meta:
         name = "text"
         datafile = f"{name}.json"
@@ -31,6 +45,11 @@ class Text(BaseDataProvider):
         alpha: list[str] = self._extract(["alphabet", case])
         return alpha
 
+    def _levels(self) -> t.Sequence[str]:
+        levels: list[str] = self._extract(["level"])
+        return levels
+
+    @choice_method(_levels)
     def level(self) -> str:
         """Generates a word that indicates a level of something.
 
@@ -39,8 +58,7 @@ class Text(BaseDataProvider):
         :Example:
             critical.
         """
-        levels: list[str] = self._extract(["level"])
-        return self.random.choice(levels)
+        return self.random.choice(self._levels())
 
     def text(self, quantity: int = 5) -> str:
         """Generates the text.
@@ -87,6 +105,11 @@ class Text(BaseDataProvider):
         """
         return self.words(quantity=1)[0]
 
+    def _quotes(self) -> t.Sequence[str]:
+        quotes: list[str] = self._extract(["quotes"])
+        return quotes
+
+    @choice_method(_quotes)
     def quote(self) -> str:
         """Generates a random quote.
 
@@ -95,9 +118,13 @@ class Text(BaseDataProvider):
         :Example:
             "Bond... James Bond."
         """
-        quotes: list[str] = self._extract(["quotes"])
-        return self.random.choice(quotes)
+        return self.random.choice(self._quotes())
 
+    def _colors(self) -> t.Sequence[str]:
+        colors: list[str] = self._extract(["color"])
+        return colors
+
+    @choice_method(_colors)
     def color(self) -> str:
         """Generates a random color name.
 
@@ -106,8 +133,7 @@ class Text(BaseDataProvider):
         :Example:
             Red.
         """
-        colors: list[str] = self._extract(["color"])
-        return self.random.choice(colors)
+        return self.random.choice(self._colors())
 
     @staticmethod
     def _hex_to_rgb(color: str) -> tuple[int, ...]:
@@ -129,7 +155,7 @@ class Text(BaseDataProvider):
             #d8346b
         """
         if safe:
-            return self.random.choice(SAFE_COLORS)
+            return self.random.choice(datasets.SAFE_COLORS)
 
         return f"#{self.random.randint(0x000000, 0xFFFFFF):06x}"
 
@@ -145,6 +171,11 @@ class Text(BaseDataProvider):
         color = self.hex_color(safe)
         return self._hex_to_rgb(color)
 
+    def _answers(self) -> t.Sequence[str]:
+        answers: list[str] = self._extract(["answers"])
+        return answers
+
+    @choice_method(_answers)
     def answer(self) -> str:
         """Generates a random answer in the current language.
 
@@ -153,9 +184,14 @@ class Text(BaseDataProvider):
         :Example:
             No
         """
-        answers: list[str] = self._extract(["answers"])
-        return self.random.choice(answers)
+        return self.random.choice(self._answers())
+
+    def _category_emojis(
+        self, category: EmojyCategory | None = EmojyCategory.DEFAULT
+    ) -> t.Sequence[str]:
+        return _emojis()[self.validate_enum(category, EmojyCategory)]
 
+    @choice_method(_category_emojis, category=EmojyCategory)
     def emoji(self, category: EmojyCategory | None = EmojyCategory.DEFAULT) -> str:
         """Generates a random emoji from the specified category.
 
@@ -169,11 +205,4 @@ class Text(BaseDataProvider):
         :example:
             😟
         """
-        category = self.validate_enum(category, EmojyCategory)
-        symbol = self.random.choice(self._emojis[category])
-
-        base = 16
-        # Some emoji consist of multiple Unicode characters.
-        if isinstance(symbol, list):
-            return "".join([chr(int(s, base)) for s in symbol])
-        return chr(int(symbol, base))
+        return self.random.choice(self._category_emojis(category))
@@ -1,14 +1,10 @@
 """Provides data related to transports."""
 
-from mimesis.datasets import (
-    AIRPLANES,
-    AUTO_MANUFACTURERS,
-    CARS,
-    VR_CODES,
-    VRC_BY_LOCALES,
-)
+import typing as t
+
+from mimesis import datasets
 from mimesis.locales import Locale
-from mimesis.providers.base import BaseProvider
+from mimesis.providers.base import BaseProvider, choice_method
 
 __all__ = ["Transport"]
 
@@ -19,6 +15,10 @@ class Transport(BaseProvider):
     class Meta:
         name = "transport"
 
+    def _manufacturers(self) -> t.Sequence[str]:
+        return datasets.AUTO_MANUFACTURERS
+
+    @choice_method(_manufacturers)
     def manufacturer(self) -> str:
         """Generates a random car manufacturer.
 
@@ -27,8 +27,12 @@ class Transport(BaseProvider):
         :Example:
             Tesla.
         """
-        return self.random.choice(AUTO_MANUFACTURERS)
+        return self.random.choice(self._manufacturers())
 
+    def _cars(self) -> t.Sequence[str]:
+        return datasets.CARS
+
+    @choice_method(_cars)
     def car(self) -> str:
         """Generates a random vehicle name.
 
@@ -37,8 +41,12 @@ class Transport(BaseProvider):
         :Example:
             Tesla Model S.
         """
-        return self.random.choice(CARS)
+        return self.random.choice(self._cars())
+
+    def _airplanes(self) -> t.Sequence[str]:
+        return datasets.AIRPLANES
 
+    @choice_method(_airplanes)
     def airplane(self) -> str:
         """Generates a random airplane model name.
 
@@ -47,7 +55,7 @@ class Transport(BaseProvider):
         :Example:
             Boeing 727.
         """
-        return self.random.choice(AIRPLANES)
+        return self.random.choice(self._airplanes())
 
     def vehicle_registration_code(self, locale: Locale | None = None) -> str:
         """Returns vehicle registration code.
@@ -56,6 +64,6 @@ class Transport(BaseProvider):
         :return: Vehicle registration code.
         """
         if locale:
-            return VRC_BY_LOCALES[locale.value]
+            return datasets.VRC_BY_LOCALES[locale.value]
 
-        return self.random.choice(VR_CODES)
+        return self.random.choice(datasets.VR_CODES)
@@ -5,18 +5,158 @@ methods which are not included in standard :py:class:`random.Random`,
 but frequently used in this project.
 """
 
+import bisect
+import functools
+import hashlib
+import itertools
+import math
 import random as random_module
 import typing as t
 
+from mimesis import compat
 from mimesis.types import MissingSeed, Seed
 
-__all__ = ["Random", "random"]
+__all__ = ["Random", "WeightedSampler", "derive_seed", "random"]
 
 #: Different plugins (like `pytest-randomly`)
 #: can set custom values to a global seed,
 #: which are going to be the new default.
 global_seed: Seed = MissingSeed
 
+#: Batches of this size and larger are generated
+#: using NumPy, when it is installed.
+NUMPY_BATCH_SIZE: t.Final[int] = 1024
+
+_INT64_MIN: t.Final[int] = -(2**63)
+_INT64_MAX: t.Final[int] = 2**63 - 1
+
+
+@functools.cache
+def _enum_members(enum: t.Any) -> tuple[t.Any, ...]:
+    """Get the members of an enum, which are listed only once for each enum."""
+    return tuple(enum)
+
+
+class _Mask:
+    """A mask of a code compiled into the positions of its placeholders."""
+
+    __slots__ = ("encoded", "placeholders", "chars", "digits")
+
+    def __init__(self, mask: str, char: str, digit: str) -> None:
+        char_code = ord(char)
+        digit_code = ord(digit)
+
+        if char_code == digit_code:
+            raise ValueError(
+                "The same placeholder cannot be "
+                "used for both numbers and characters."
+            )
+
+        self.encoded = mask.encode()
+        #: Positions of the placeholders with the first code and the number
+        #: of codes of their characters: A-Z for chars and 0-9 for digits.
+        self.placeholders = tuple(
+            (i, 65, 26) if p == char_code else (i, 48, 10)
+            for i, p in enumerate(self.encoded)
+            if p == char_code or p == digit_code
+        )
+        self.chars = [i for i, p in enumerate(self.encoded) if p == char_code]
+        self.digits = [i for i, p in enumerate(self.encoded) if p == digit_code]
+
+    def fill(self, random: "Random") -> str:
+        """Fill the placeholders drawing a float for each of them."""
+        code = bytearray(self.encoded)
+        random_ = random.random
+        for i, first, count in self.placeholders:
+            code[i] = first + int(random_() * count)
+        return code.decode()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_mask(mask: str, char: str, digit: str) -> _Mask:
+    return _Mask(mask, char, digit)
+
+
+class WeightedSampler:
+    """Chooses elements according to weights which are prepared once.
+
+    :meth:`Random.weighted_choice` accumulates the weights on each call,
+    which costs O(n) per value. A sampler accumulates them once, so each
+    value costs only a binary search, and it can be reused with any
+    instance of :class:`Random`:
+
+        >>> sampler = WeightedSampler({"a": 0.1, "b": 0.9})
+        >>> random.weighted_choice(sampler)
+        'b'
+        >>> sampler.sample_batch(random, 3)
+        ['b', 'a', 'b']
+
+    The values are the same as the values of :meth:`Random.weighted_choice`
+    and :py:meth:`random.Random.choices` with the same weights.
+
+    .. versionadded:: 18.1.0
+    """
+
+    __slots__ = ("population", "cum_weights", "total", "_numpy_cum_weights")
+
+    def __init__(self, choices: t.Mapping[t.Any, float]) -> None:
+        """Prepare the weights.
+
+        :param choices: A mapping where keys are choices and values are weights.
+        :raises ValueError: If choices are empty or the total of weights
+            is not a positive finite number.
+        """
+        if not choices:
+            raise ValueError("Choices cannot be empty.")
+
+        self.population = tuple(choices.keys())
+        self.cum_weights = tuple(itertools.accumulate(choices.values()))
+        self.total: float = self.cum_weights[-1] + 0.0
+        if self.total <= 0.0:
+            raise ValueError("Total of weights must be greater than zero")
+        if not math.isfinite(self.total):
+            raise ValueError("Total of weights must be finite")
+        self._numpy_cum_weights: t.Any = None
+
+    def __len__(self) -> int:
+        return len(self.population)
+
+    def sample(self, random: "Random") -> t.Any:
+        """Choose a random element.
+
+        :param random: Random generator.
+        :return: Random element.
+        """
+        index = bisect.bisect(
+            self.cum_weights, random.random() * self.total, 0, len(self) - 1
+        )
+        return self.population[index]
+
+    def sample_batch(self, random: "Random", n: int) -> list[t.Any]:
+        """Choose n random elements.
+
+        :param random: Random generator.
+        :param n: Number of elements.
+        :raises ValueError: If n is negative.
+        :return: List of random elements.
+        """
+        if n < 0:
+            raise ValueError("Amount out of range.")
+
+        population = self.population
+        rng = random._numpy_generator(n)
+        if rng is not None:
+            numpy = compat.numpy
+            if self._numpy_cum_weights is None:
+                self._numpy_cum_weights = numpy.asarray(self.cum_weights, float)
+            indices = numpy.searchsorted(
+                self._numpy_cum_weights, rng.random(n) * self.total, side="right"
+            )
+            numpy.minimum(indices, len(self) - 1, out=indices)
+            return [population[i] for i in indices.tolist()]
+
+        return random.choices(population, cum_weights=self.cum_weights, k=n)
+
 
 class Random(random_module.Random):
     """A custom random class.
@@ -24,6 +164,10 @@ class Random(random_module.Random):
     It is a subclass of the :py:class:`random.Random` class from the standard
     library's random module. The class incorporates additional custom methods.
 
+    Methods with the ``_batch`` suffix generate many values in one call,
+    which is much faster than calling their single-value counterparts
+    in a loop. They use NumPy for large batches when it is installed.
+
     This class can be extended according to specific requirements.
     """
 
@@ -58,35 +202,15 @@ class Random(random_module.Random):
     ) -> str:
         """Generate custom code using ascii uppercase and random integers.
 
+        Masks are compiled once, so only the placeholders
+        are filled on each call.
+
         :param mask: Mask of code.
         :param char: Placeholder for characters.
         :param digit: Placeholder for digits.
         :return: Custom code.
         """
-        char_code = ord(char)
-        digit_code = ord(digit)
-
-        if char_code == digit_code:
-            raise ValueError(
-                "The same placeholder cannot be "
-                "used for both numbers and characters."
-            )
-
-        def random_int(a: int, b: int) -> int:
-            b = b - a
-            return int(self.random() * b) + a
-
-        _mask = mask.encode()
-        code = bytearray(len(_mask))
-        for i, p in enumerate(_mask):
-            if p == char_code:
-                a = random_int(65, 91)  # A-Z
-            elif p == digit_code:
-                a = random_int(48, 58)  # 0-9
-            else:
-                a = p
-            code[i] = a
-        return code.decode()
+        return _compile_mask(mask, char, digit).fill(self)
 
     def uniform(self, a: float, b: float, precision: int = 15) -> float:
         """Get a random number in the range [a, b) or [a, b] depending on rounding.
@@ -102,19 +226,186 @@ class Random(random_module.Random):
         """Generate n random bytes."""
         return self.getrandbits(n * 8).to_bytes(n, "little")
 
-    def weighted_choice(self, choices: dict[t.Any, float]) -> t.Any:
+    def weighted_choice(
+        self, choices: t.Union[dict[t.Any, float], WeightedSampler]
+    ) -> t.Any:
         """Returns a random element according to the specified weights.
 
-        :param choices: A dictionary where keys are choices and values are weights.
+        Pass a :class:`WeightedSampler` to avoid preparing
+        the weights on each call.
+
+        :param choices: A dictionary where keys are choices and values are weights,
+            or a sampler.
         :raises ValueError: If choices are empty.
         :return: Random key from dictionary.
         """
-        if not choices:
-            raise ValueError("Choices cannot be empty.")
+        if not isinstance(choices, WeightedSampler):
+            choices = WeightedSampler(choices)
+        return choices.sample(self)
+
+    def _numpy_generator(self, n: int) -> t.Any:
+        """Get a NumPy generator for a batch of the given size.
+
+        The generator is seeded from this instance, so batches are
+        deterministic under the same seed. Returns ``None`` when NumPy
+        is not installed or the batch is too small to benefit from it.
+        """
+        if n < NUMPY_BATCH_SIZE or compat.numpy is None:
+            return None
+        bit_generator = compat.numpy.random.PCG64(self.getrandbits(128))
+        return compat.numpy.random.Generator(bit_generator)
+
+    def _randint_array(self, a: int, b: int, n: int) -> t.Any:
+        """Generate a NumPy array of ``int64`` random integers in the range [a, b].
+
+        For :data:`NUMPY_BATCH_SIZE` and more elements, it draws the same
+        integers as :meth:`randint_batch`, but doesn't convert them to a list.
+        NumPy must be installed.
+        """
+        numpy = compat.numpy
+        rng = numpy.random.Generator(numpy.random.PCG64(self.getrandbits(128)))
+        return rng.integers(a, b, size=n, endpoint=True, dtype=numpy.int64)
+
+    def randint_batch(self, a: int, b: int, n: int) -> list[int]:
+        """Generate a list of random integers in the range [a, b].
+
+        .. note:: Results of all batch methods are deterministic under
+            the same seed, but they depend on whether NumPy is installed.
+
+        :param a: Minimum value of range.
+        :param b: Maximum value of range.
+        :param n: Number of elements.
+        :return: List of random integers.
+        :raises ValueError: if the range is empty or n is negative.
+        """
+        if a > b:
+            raise ValueError("The range [a, b] cannot be empty.")
+        if n < 0:
+            raise ValueError("Amount out of range.")
+
+        rng = self._numpy_generator(n)
+        if rng is not None and _INT64_MIN <= a and b <= _INT64_MAX:
+            values: list[int] = rng.integers(a, b, size=n, endpoint=True).tolist()
+            return values
+
+        span = b - a + 1
+        if span <= 2**32:
+            # The bias of the float-based approach is negligible here.
+            random = self.random
+            return [a + int(random() * span) for _ in range(n)]
+
+        randrange = self.randrange
+        return [a + randrange(span) for _ in range(n)]
+
+    def uniform_batch(
+        self, a: float, b: float, n: int, precision: int = 15
+    ) -> list[float]:
+        """Generate a list of random floats in the range [a, b].
+
+        :param a: Minimum value.
+        :param b: Maximum value.
+        :param n: Number of elements.
+        :param precision: Round numbers to a given
+            precision in decimal digits, default is 15.
+        :return: List of random floats.
+        :raises ValueError: if n is negative.
+        """
+        if n < 0:
+            raise ValueError("Amount out of range.")
+
+        rng = self._numpy_generator(n)
+        if rng is not None:
+            values: list[float] = compat.numpy.round(
+                a + (b - a) * rng.random(n), precision
+            ).tolist()
+            return values
+
+        random = self.random
+        delta = b - a
+        return [round(a + delta * random(), precision) for _ in range(n)]
 
-        population = list(choices.keys())
-        weights = list(choices.values())
-        return self.choices(population, weights=weights, k=1)[0]
+    def index_batch(self, size: int, n: int) -> list[int]:
+        """Generate a list of random indices into a sequence of the given size.
+
+        :param size: Size of the sequence.
+        :param n: Number of indices.
+        :return: List of indices.
+        :raises ValueError: if the size is not positive or n is negative.
+        """
+        if size <= 0:
+            raise ValueError("Cannot choose from an empty sequence.")
+        return self.randint_batch(0, size - 1, n)
+
+    def choice_batch(self, population: t.Sequence[t.Any], n: int) -> list[t.Any]:
+        """Choose n random elements from a non-empty sequence.
+
+        :param population: Sequence of elements.
+        :param n: Number of elements.
+        :return: List of random elements.
+        :raises ValueError: if population is empty or n is negative.
+        """
+        return [population[i] for i in self.index_batch(len(population), n)]
+
+    def weighted_choice_batch(
+        self, choices: t.Union[dict[t.Any, float], WeightedSampler], n: int
+    ) -> list[t.Any]:
+        """Choose n random elements according to the specified weights.
+
+        :param choices: A dictionary where keys are choices and values are weights,
+            or a sampler (see :class:`WeightedSampler`).
+        :param n: Number of elements.
+        :raises ValueError: If choices are empty or n is negative.
+        :return: List of random keys from dictionary.
+        """
+        if not isinstance(choices, WeightedSampler):
+            choices = WeightedSampler(choices)
+        return choices.sample_batch(self, n)
+
+    def generate_string_by_mask_batch(
+        self,
+        mask: str,
+        n: int,
+        char: str = "@",
+        digit: str = "#",
+    ) -> list[str]:
+        """Generate a list of custom codes by mask.
+
+        See :meth:`generate_string_by_mask` for details.
+
+        :param mask: Mask of code.
+        :param n: Number of codes.
+        :param char: Placeholder for characters.
+        :param digit: Placeholder for digits.
+        :return: List of custom codes.
+        """
+        compiled = _compile_mask(mask, char, digit)
+        if n < 0:
+            raise ValueError("Amount out of range.")
+
+        _mask = compiled.encoded
+        chars = compiled.chars
+        digits = compiled.digits
+
+        rng = self._numpy_generator(n)
+        if rng is not None:
+            template = compat.numpy.frombuffer(_mask, dtype=compat.numpy.uint8)
+            codes = compat.numpy.tile(template, (n, 1))
+            codes[:, chars] = rng.integers(65, 91, size=(n, len(chars)))
+            codes[:, digits] = rng.integers(48, 58, size=(n, len(digits)))
+            data = codes.tobytes()
+            length = len(_mask)
+            return [data[i : i + length].decode() for i in range(0, n * length, length)]
+
+        random = self.random
+        code = bytearray(_mask)
+        result = []
+        for _ in range(n):
+            for i in chars:
+                code[i] = 65 + int(random() * 26)
+            for i in digits:
+                code[i] = 48 + int(random() * 10)
+            result.append(code.decode())
+        return result
 
     def choice_enum_item(self, enum: t.Any) -> t.Any:
         """Get random value of enum object.
@@ -122,7 +413,22 @@ class Random(random_module.Random):
         :param enum: Enum object.
         :return: Random value of enum.
         """
-        return self.choice(list(enum))
+        return self.choice(_enum_members(enum))
+
+
+def derive_seed(seed: Seed, *keys: t.Any) -> int:
+    """Derive a new seed from the given seed and keys.
+
+    The derived seed depends only on the seed and the keys, so it is
+    the same across processes and runs. It is used to get independent
+    but reproducible random streams, e.g. for shards of a schema.
+
+    :param seed: Base seed.
+    :param keys: Keys which identify the stream (must have a stable ``repr()``).
+    :return: Derived seed.
+    """
+    data = repr((seed, keys)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
 
 
 # Compat
@@ -1,14 +1,35 @@
 """Implements classes for generating data by schema."""
 
+import asyncio
 import csv
+import datetime
+import functools
 import inspect
+import itertools
 import json
+import os
 import pickle
 import re
-from typing import Any, Callable, Sequence
+import threading
+import warnings
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import IO, Any, AsyncIterator, Callable
+from typing import Generic as GenericType
+from typing import Iterable, Iterator, Mapping, Sequence, TypeVar, cast
 
+from mimesis import compat
+from mimesis import random as _random
 from mimesis.exceptions import (
     AliasesTypeError,
+    FieldAmbiguityWarning,
     FieldArityError,
     FieldError,
     FieldNameError,
@@ -16,13 +37,21 @@ from mimesis.exceptions import (
     SchemaError,
 )
 from mimesis.locales import Locale
-from mimesis.providers.base import BaseProvider
 from mimesis.providers.generic import Generic
-from mimesis.random import Random
-from mimesis.types import JSON, CallableSchema, Key, MissingSeed, Seed
+from mimesis.providers.numeric import Numeric
+from mimesis.random import Random, derive_seed
+from mimesis.types import (
+    JSON,
+    CallableSchema,
+    Categorical,
+    Key,
+    MissingSeed,
+    Seed,
+)
 
 __all__ = [
     "BaseField",
+    "CompiledSchema",
     "Field",
     "Fieldset",
     "Schema",
@@ -35,33 +64,187 @@ FieldCache = dict[str, Callable[[Any], Any]]
 FieldHandler = Callable[[Random, Any], Any]
 RegisterableFieldHandler = tuple[str, FieldHandler]
 RegisterableFieldHandlers = Sequence[RegisterableFieldHandler]
+SchemaDefinition = Mapping[str, Any]
+T = TypeVar("T")
+CompiledField = tuple[
+    Callable[[], Any],
+    Callable[[int], list[Any]],
+    Callable[[int], Categorical] | None,
+]
+
+
+class _ThreadState(threading.local):
+    """State of a thread-safe field, which is separate for each thread."""
+
+    #: Version of the seed of the field which the state is created for.
+    version: int = -1
+    generic: Generic
+    cache: FieldCache
+
+
+class _PerThread(GenericType[T]):
+    """An attribute of a field which is separate for each thread.
+
+    It is a non-data descriptor, so it is used only when the instance
+    has no attribute with the same name. Fields which are not thread-safe
+    set the attribute, so accessing it costs nothing.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name.lstrip("_")
+
+    def __get__(self, instance: "BaseField", owner: type | None = None) -> T:
+        value: T = getattr(instance._thread_state(), self.name)
+        return value
 
 
 class BaseField:
+    _generic: _PerThread[Generic] = _PerThread()
+    _cache: _PerThread[FieldCache] = _PerThread()
+
     def __init__(
         self,
         locale: Locale = Locale.DEFAULT,
         seed: Seed = MissingSeed,
+        thread_safe: bool = False,
     ) -> None:
         """Base class for fields.
 
         This class is used as a base class for :class:`Field` and :class:`Fieldset`.
 
+        A thread-safe field has separate providers for each thread. The thread
+        which creates the field uses the seed itself, so its values are the
+        same as those of a regular field. Other threads use seeds derived from
+        the seed and the name of the thread (see :func:`~mimesis.random.derive_seed`),
+        so name the threads to get reproducible values. The counters of
+        ``increment`` are shared by all the threads, so they never repeat.
+
         :attr: aliases: A dictionary of aliases for standard fields.
         :param locale: Locale.
         :param seed: Seed for random.
+        :param thread_safe: Use separate providers for each thread.
         """
-        self._generic = Generic(locale, seed)
-        self._cache: FieldCache = {}
+        generic = Generic(locale, seed)
+        self._locale = locale
+        self._seed = seed
+        self._local: _ThreadState | None = None
+        self._version = 0
+        self._owner = threading.get_ident()
+        self._numeric: Numeric | None = None
+        if thread_safe:
+            self._numeric = generic.numeric
+            self._local = _ThreadState()
+            self._local.generic = generic
+            self._local.cache = {}
+            self._local.version = self._version
+        else:
+            self.__dict__["_generic"] = generic
+            self.__dict__["_cache"] = {}
         self._handlers: dict[str, FieldHandler] = {}
         self.aliases: dict[str, str] = {}
 
+    def _thread_seed(self) -> Seed:
+        """Get the seed for the current thread.
+
+        :return: Seed.
+        """
+        seed = self._seed
+        if threading.get_ident() == self._owner:
+            return seed
+        if seed is MissingSeed:
+            seed = _random.global_seed
+        if seed is MissingSeed or seed is None:
+            return seed
+        return derive_seed(seed, "thread", threading.current_thread().name)
+
+    def _thread_state(self) -> _ThreadState:
+        """Get the state of the current thread for a thread-safe field.
+
+        :return: State.
+        """
+        state = cast(_ThreadState, self._local)
+        if state.version != self._version:
+            seed = self._thread_seed()
+            if state.version < 0:
+                state.generic = Generic(self._locale, seed)
+                if self._numeric is not None:
+                    state.generic.numeric._share_counters(self._numeric)
+                state.cache = {}
+            else:
+                state.generic.reseed(seed)
+            state.version = self._version
+        return state
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        if self._local is not None:
+            # Thread-local data can't be pickled, so the providers
+            # of the current thread are used by the unpickled field.
+            state["_local"] = self._thread_state().generic
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        generic = state.pop("_local", None)
+        self.__dict__.update(state)
+        self._local = None
+        if generic is not None:
+            self._owner = threading.get_ident()
+            self._numeric = generic.numeric
+            self._local = _ThreadState()
+            self._local.generic = generic
+            self._local.cache = {}
+            self._local.version = self._version
+
+    @property
+    def thread_safe(self) -> bool:
+        """Whether the field uses separate providers for each thread."""
+        return self._local is not None
+
     def reseed(self, seed: Seed = MissingSeed) -> None:
         """Reseed the random generator.
 
+        The providers of other threads of a thread-safe field
+        are reseeded on the next use.
+
         :param seed: Seed for random.
         """
-        self._generic.reseed(seed)
+        self._seed = seed
+        if self._local is None:
+            self._generic.reseed(seed)
+        else:
+            self._version += 1
+            self._thread_state()
+
+    def seek(self, index: int) -> None:
+        """Move the random generators to the row with the given index.
+
+        This is a counter-based mode of generation: the state of the
+        generators after seeking is derived from the seed of the field
+        and the index only (see :func:`~mimesis.random.derive_seed`), so
+        the values of any row can be generated without generating the rows
+        before it, and replayed by seeking to the same index again:
+
+            >>> field = Field(seed=0xff)
+            >>> field.seek(40_000_000)
+            >>> name = field("name")
+            >>> field.seek(40_000_000)
+            >>> field("name") == name
+            True
+
+        .. note:: Stateful fields, such as ``increment``,
+            don't depend on the index.
+
+        .. versionadded:: 18.1.0
+
+        :param index: Index of the row.
+        :raises ValueError: If neither the field nor the global seed is set.
+        """
+        seed = self._seed
+        if seed is MissingSeed:
+            seed = _random.global_seed
+        if seed is None or seed is MissingSeed:
+            raise ValueError("Counter-based generation requires a seed.")
+        self._generic.reseed(derive_seed(seed, "row", index))
 
     def get_random_instance(self) -> Random:
         """Get a random object from Generic.
@@ -97,13 +280,20 @@ class BaseField:
         :return: Callable object.
         :raise FieldError: When field is invalid.
         """
-        for provider in dir(self._generic):
-            provider = getattr(self._generic, provider)
-            if isinstance(provider, BaseProvider):
-                if name in dir(provider):
-                    return getattr(provider, name)
+        providers = self._generic.find_providers(name)
+        if not providers:
+            raise FieldError(name)
 
-        raise FieldError(name)
+        if len(providers) > 1:
+            candidates = ", ".join(f"{p}.{name}" for p in providers)
+            warnings.warn(
+                f"The field «{name}» is ambiguous ({candidates}), "
+                f"«{providers[0]}.{name}» is used. Specify the provider "
+                f"explicitly to avoid this warning.",
+                FieldAmbiguityWarning,
+                stacklevel=5,
+            )
+        return getattr(getattr(self._generic, providers[0]), name)
 
     def _lookup_method(self, name: str) -> Any:
         """Lookup method by the field name.
@@ -155,8 +345,9 @@ class BaseField:
         .. note:: Some data providers have methods with the same names,
             and in such cases, you can explicitly define that the method
             belongs to data-provider ``field(name='provider.name')`` otherwise
-            it will return the data from the first provider which
-            has a method ``name``.
+            it will return the data from the first provider (in alphabetical
+            order) which has a method ``name`` and issue
+            :class:`~mimesis.exceptions.FieldAmbiguityWarning`.
 
             Allowed delimiters: ``.``, ``:``, ``/`` and space:
 
@@ -206,6 +397,80 @@ class BaseField:
 
         return result
 
+    def compile(self, schema: SchemaDefinition) -> "CompiledSchema":
+        """Compiles a declarative schema definition.
+
+        See :class:`CompiledSchema` for details.
+
+        .. versionadded:: 18.1.0
+
+        :param schema: A mapping of keys of the resulting dicts to fields.
+        :return: Compiled schema.
+        """
+        return CompiledSchema(self, schema)
+
+    def _compile_field(self, definition: Any) -> CompiledField:
+        """Resolves the field definition once.
+
+        :param definition: Definition of the field.
+        :return: Functions which generate a value, a list of values
+            and dictionary-encoded values (if they are chosen from a fixed list).
+        :raise FieldError: When field is invalid.
+        """
+        if isinstance(definition, Mapping):
+            nested = CompiledSchema(self, definition)
+            return nested, nested._records, None
+
+        if isinstance(definition, str) or definition is None:
+            definition = (definition,)
+
+        if not isinstance(definition, tuple) or not 1 <= len(definition) <= 3:
+            raise TypeError(
+                "The field must be defined as a name, "
+                "a tuple (name, kwargs, key) or a nested schema."
+            )
+
+        name, kwargs, key = (*definition, None, None)[:3]
+        kwargs = kwargs or {}
+
+        if name is None:
+            raise FieldError()
+
+        random = self.get_random_instance()
+        method: Callable[..., Any]
+        batch: Callable[..., list[Any]] | None = None
+        codes: Callable[..., Categorical] | None = None
+
+        if name in self._handlers:
+            method = functools.partial(self._handlers[name], random, **kwargs)
+        else:
+            method = self._lookup_method(name)
+            # Methods which choose an element of a list have a bulk version.
+            batch = getattr(method, "batch", None)
+            codes = getattr(method, "codes", None)
+            if kwargs:
+                method = functools.partial(method, **kwargs)
+                if batch is not None:
+                    batch = functools.partial(batch, **kwargs)
+                if codes is not None:
+                    codes = functools.partial(codes, **kwargs)
+
+        if batch is None:
+            batch = functools.partial(_repeat, method)
+
+        if not key or not callable(key):
+            return method, batch, codes
+
+        apply_key = _key_function(key, random)
+
+        def keyed_method() -> Any:
+            return apply_key(method())
+
+        def keyed_batch(n: int) -> list[Any]:
+            return list(map(apply_key, batch(n)))
+
+        return keyed_method, keyed_batch, None
+
     def register_handler(self, field_name: str, field_handler: FieldHandler) -> None:
         """Register a new field handler.
 
@@ -381,21 +646,397 @@ class Fieldset(BaseField):
         return [self.perform(*args, **kwargs) for _ in range(iterations)]
 
 
+def _key_function(key: Callable[..., Any], random: Random) -> Callable[[Any], Any]:
+    """Resolves the arity of the key function once.
+
+    :param key: A key function.
+    :param random: Random object.
+    :return: A key function which accepts only the result.
+    """
+    try:
+        signature = inspect.signature(key)
+    except (TypeError, ValueError):
+        # The signature is unknown, so we do the same as BaseField.perform().
+        def apply_key(result: Any) -> Any:
+            try:
+                return key(result, random)
+            except TypeError:
+                return key(result)
+
+        return apply_key
+
+    try:
+        signature.bind(None, None)
+    except TypeError:
+        return key
+
+    return functools.partial(_call_with_random, key, random)
+
+
+def _repeat(method: Callable[[], Any], n: int) -> list[Any]:
+    return [method() for _ in range(n)]
+
+
+def _call_with_random(key: Callable[..., Any], random: Random, result: Any) -> Any:
+    return key(result, random)
+
+
+class CompiledSchema:
+    """A declarative schema definition compiled into a generation plan.
+
+    Unlike the callable passed to :class:`Schema`, which looks up the methods
+    of all fields each time it is called, a compiled schema resolves the fields
+    once, so generating a row costs only calls of the methods themselves.
+
+    A schema definition is a mapping of keys of the resulting dicts to fields.
+    A field is either a name of the field, a tuple ``(name, kwargs, key)``
+    (where ``kwargs`` and ``key`` are optional) or a nested schema definition:
+
+        >>> from mimesis import Field
+        >>> from mimesis.enums import Gender
+        >>> field = Field()
+        >>> schema = field.compile({
+        ...     "pk": "increment",
+        ...     "name": ("person.full_name", {"gender": Gender.FEMALE}),
+        ...     "email": ("email", {}, str.upper),
+        ...     "address": {
+        ...         "city": "address.city",
+        ...         "street": "address.street_name",
+        ...     },
+        ... })
+        >>> schema()
+        {'pk': 1, 'name': 'Kimberely Bell', 'email': 'ALSO2038@DUCK.COM', ...}
+
+    The aliases and the handlers of the field are resolved at compile time,
+    so changing them later doesn't affect the compiled schema.
+
+    A compiled schema can be passed to :class:`Schema` as is.
+
+    .. versionadded:: 18.1.0
+    """
+
+    __slots__ = ("_field", "_fields", "_schema")
+
+    def __init__(self, field: BaseField, schema: SchemaDefinition) -> None:
+        """Compile the schema definition.
+
+        :param field: The field used to resolve the fields.
+        :param schema: A mapping of keys of the resulting dicts to fields.
+        :raise FieldError: When any of fields is invalid.
+        :raise TypeError: When any of fields is defined incorrectly.
+        """
+        if not isinstance(schema, Mapping):
+            raise TypeError("The schema definition must be a mapping.")
+
+        field._validate_aliases()
+        self._field = field
+        self._schema = schema
+        self._fields = tuple(
+            (name, *field._compile_field(definition))
+            for name, definition in schema.items()
+        )
+
+    def __call__(self) -> JSON:
+        """Generate a row.
+
+        :return: Filled schema.
+        """
+        return {name: method() for name, method, _, _ in self._fields}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Compiled fields are closures, so we compile the schema again.
+        return self.__class__, (self._field, self._schema)
+
+    @property
+    def seed(self) -> Seed:
+        """The seed of the field."""
+        return self._field._seed
+
+    def reseed(self, seed: Seed = MissingSeed) -> None:
+        """Reseed the random generator of the field.
+
+        :param seed: Seed for random.
+        """
+        self._field.reseed(seed)
+
+    def row(self, index: int) -> JSON:
+        """Generate the row with the given index.
+
+        The row depends only on the seed of the field and the index
+        (see :meth:`BaseField.seek`), so any row can be generated directly.
+
+        .. versionadded:: 18.1.0
+
+        :param index: Index of the row.
+        :raises ValueError: If neither the field nor the global seed is set.
+        :return: Filled schema.
+        """
+        self._field.seek(index)
+        return self()
+
+    def create(self, iterations: int = 10) -> list[JSON]:
+        """Generate a list of rows.
+
+        It is equivalent to calling the compiled schema ``iterations`` times.
+
+        :param iterations: Number of rows.
+        :return: List of filled schemas.
+        """
+        return [self() for _ in range(iterations)]
+
+    def columns(
+        self, iterations: int = 10, categorical: bool = False
+    ) -> dict[str, list[Any] | Categorical]:
+        """Generate data column by column.
+
+        Columns are generated one after another, so fields
+        which support bulk generation (see :class:`~mimesis.providers.base.BatchMethod`)
+        generate the whole column at once.
+
+        When **categorical** is ``True``, columns of fields which choose values
+        from a fixed list (and have no key function) are returned as
+        :class:`~mimesis.types.Categorical`, i.e. as integer codes and a list
+        of unique values, instead of lists of repeated values. The values
+        are the same in both cases.
+
+        .. note:: Values are drawn from the random stream in
+            a different order than in :meth:`create`, so the data
+            is different even if the seed is the same.
+
+        :param iterations: Number of values in each column.
+        :param categorical: Return dictionary-encoded columns where possible.
+        :return: A dict of columns.
+        """
+        return {
+            name: codes(iterations) if categorical and codes else batch(iterations)
+            for name, _, batch, codes in self._fields
+        }
+
+    def _records(self, iterations: int) -> list[JSON]:
+        """Generate a list of rows column by column.
+
+        :param iterations: Number of rows.
+        :return: List of filled schemas.
+        """
+        names = [name for name, _, _, _ in self._fields]
+        columns = [batch(iterations) for _, _, batch, _ in self._fields]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def to_arrow(self, iterations: int = 10) -> Any:
+        """Generate data as an Arrow record batch.
+
+        Data is generated column by column (see :meth:`columns`).
+        Types of the columns are inferred from the values, e.g. integers
+        are stored as ``int64`` and datetime objects as ``timestamp``.
+        String fields which choose values from a fixed list (and have no key
+        function) are stored as dictionary-encoded arrays.
+
+        .. versionadded:: 18.1.0
+
+        :param iterations: Number of rows.
+        :raises ImportError: If pyarrow is not installed.
+        :return: Record batch (:py:class:`pyarrow.RecordBatch`).
+        """
+        return self._record_batch(iterations)
+
+    def to_numpy(self, iterations: int = 10) -> Any:
+        """Generate data as a NumPy structured array.
+
+        Data is generated column by column (see :meth:`columns`).
+        Types of the columns are inferred from the values, e.g. integers
+        are stored as ``int64``, strings as fixed-width unicode strings and
+        naive datetime objects as ``datetime64[us]``. Values which have
+        no NumPy counterpart (e.g. nested schemas) are stored as objects.
+
+        .. versionadded:: 18.1.0
+
+        :param iterations: Number of rows.
+        :raises ImportError: If numpy is not installed.
+        :return: Structured array (:py:class:`numpy.ndarray`).
+        """
+        numpy = compat.numpy
+        if not numpy:
+            raise ImportError("NumPy output is supported only with numpy")
+
+        columns = {}
+        for name, values in self.columns(iterations, categorical=True).items():
+            if isinstance(values, Categorical):
+                categories = _numpy_column(values.categories)
+                columns[name] = categories[numpy.array(values.codes, dtype=int)]
+            else:
+                columns[name] = _numpy_column(values)
+
+        dtype = [(name, column.dtype) for name, column in columns.items()]
+        result = numpy.empty(iterations, dtype=dtype)
+        for name, column in columns.items():
+            result[name] = column
+        return result
+
+    def _record_batch(self, iterations: int, schema: Any = None) -> Any:
+        """Generate an Arrow record batch.
+
+        :param iterations: Number of rows.
+        :param schema: Arrow schema of the batch. By default, it is inferred.
+        :raises ImportError: If pyarrow is not installed.
+        :return: Record batch.
+        """
+        pyarrow = compat.pyarrow
+        if not pyarrow:
+            raise ImportError("Arrow output is supported only with pyarrow")
+
+        arrays = []
+        for index, (_, _, batch, codes) in enumerate(self._fields):
+            type_ = None if schema is None else schema.types[index]
+            if codes is None:
+                arrays.append(pyarrow.array(batch(iterations), type=type_))
+                continue
+
+            # Values chosen from a fixed list are encoded without
+            # creating the list of repeated values.
+            encoded = codes(iterations)
+            dictionary = pyarrow.array(encoded.categories)
+            if pyarrow.types.is_string(dictionary.type):
+                indices = pyarrow.array(encoded.codes, type=pyarrow.int32())
+                array = pyarrow.DictionaryArray.from_arrays(indices, dictionary)
+            else:
+                array = pyarrow.array(encoded.decode(), type=type_)
+            arrays.append(array)
+
+        if schema is not None:
+            return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+        names = [name for name, _, _, _ in self._fields]
+        return pyarrow.RecordBatch.from_arrays(arrays, names=names)
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _dump_json_array(rows: Iterable[JSON], fp: IO[str], **kwargs: Any) -> None:
+    """Write rows as a JSON array without keeping them in memory.
+
+    :param rows: Rows.
+    :param fp: File object.
+    :param kwargs: Extra keyword arguments for :py:func:`json.dumps`.
+    """
+    indent = kwargs.get("indent")
+    if isinstance(indent, int):
+        indent = " " * indent
+
+    separators = kwargs.get("separators")
+    if separators is not None:
+        item_separator = separators[0]
+    else:
+        item_separator = ", " if indent is None else ","
+
+    if indent is not None:
+        # Each row is nested one level deeper than the array.
+        newline = "\n" + indent
+        item_separator += newline
+    else:
+        newline = ""
+
+    fp.write("[")
+    empty = True
+    for row in rows:
+        fp.write(newline if empty else item_separator)
+        fp.write(json.dumps(row, **kwargs).replace("\n", newline or "\n"))
+        empty = False
+    fp.write("]" if empty or indent is None else "\n]")
+
+
+def _numpy_column(values: list[Any]) -> Any:
+    """Convert a column to a NumPy array of the most specific type.
+
+    :param values: Values of the column.
+    :return: One-dimensional array.
+    """
+    numpy = compat.numpy
+    if values and all(
+        isinstance(value, datetime.datetime) and value.tzinfo is None
+        for value in values
+    ):
+        return numpy.array(values, dtype="datetime64[us]")
+
+    if values and all(type(value) is datetime.date for value in values):
+        return numpy.array(values, dtype="datetime64[D]")
+
+    try:
+        array = numpy.array(values)
+    except ValueError:
+        array = None
+
+    if array is None or array.ndim != 1 or array.dtype.kind in "OMm":
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+    return array
+
+
+def _generate_shard(
+    schema: bytes,
+    seed: Seed,
+    iterations: int,
+    start: int | None = None,
+) -> list[JSON]:
+    """Generate a shard of rows in a worker process.
+
+    The schema is unpickled for each shard, so the result depends
+    only on the seed of the shard and not on other shards.
+
+    :param schema: Pickled compiled schema.
+    :param seed: Seed of the shard.
+    :param iterations: Number of rows.
+    :param start: Index of the first row in the counter-based mode.
+    :return: List of filled schemas.
+    """
+    compiled: CompiledSchema = pickle.loads(schema)
+    compiled.reseed(seed)
+    if start is None:
+        return compiled.create(iterations)
+    return [compiled.row(index) for index in range(start, start + iterations)]
+
+
 class Schema:
     """Class which return list of filled schemas."""
 
     __slots__ = (
         "__counter",
+        "__counter_based",
         "__schema",
         "iterations",
     )
 
-    def __init__(self, schema: CallableSchema, iterations: int = 10) -> None:
+    #: Number of rows written to a file at once.
+    chunk_size: int = 1000
+
+    #: Number of rows generated by a worker process at once.
+    shard_size: int = 10000
+
+    #: Number of rows in a record batch of a Parquet file.
+    batch_size: int = 100000
+
+    def __init__(
+        self,
+        schema: CallableSchema,
+        iterations: int = 10,
+        counter_based: bool = False,
+    ) -> None:
         """Initialize schema.
 
+        In the counter-based mode, the row with index ``i`` is generated
+        by :meth:`CompiledSchema.row`, i.e. it depends only on the seed
+        and ``i``, so any row can be generated directly (see :meth:`row`)
+        and parallel generation gives the same rows as :meth:`create`.
+
         :param iterations: Number of iterations.
             This parameter is keyword-only. The default value is 10.
         :param schema: A schema (must be a callable object).
+        :param counter_based: Generate each row from the seed and its index.
+            The schema must be a :class:`CompiledSchema`.
+        :raises TypeError: If **counter_based** is set, but the schema
+            is not a :class:`CompiledSchema`.
         """
         if iterations < 1:
             raise ValueError("Number of iterations should be greater than 1.")
@@ -407,31 +1048,111 @@ class Schema:
         else:
             raise SchemaError()
 
+        if counter_based and not isinstance(schema, CompiledSchema):
+            raise TypeError(
+                "Counter-based generation requires a CompiledSchema, "
+                "see BaseField.compile() for details."
+            )
+        self.__counter_based = counter_based
+
     def to_csv(self, file_path: str, **kwargs: Any) -> None:
         """Export a schema as a CSV file.
 
+        Rows are generated and written in chunks, so the whole
+        dataset is never kept in memory. The field names are taken
+        from the first row.
+
         :param file_path: The file path.
         :param kwargs: The keyword arguments for :py:class:`csv.DictWriter` class.
         """
-        data = self.create()
+        rows = self.__rows()
+        first = next(rows)
         with open(file_path, "w", encoding="utf-8", newline="") as fp:
-            fieldnames = list(data[0])
-            dict_writer = csv.DictWriter(fp, fieldnames, **kwargs)
+            dict_writer = csv.DictWriter(fp, list(first), **kwargs)
             dict_writer.writeheader()
-            dict_writer.writerows(data)
+            dict_writer.writerow(first)
+            for chunk in _chunks(rows, self.chunk_size):
+                dict_writer.writerows(chunk)
 
     def to_json(self, file_path: str, **kwargs: Any) -> None:
         """Export a schema as a JSON file.
 
+        Rows are generated and written one by one, so the whole
+        dataset is never kept in memory. The output is the same
+        as the output of :py:func:`json.dump` for a list of rows.
+
         :param file_path: File a path.
         :param kwargs: Extra keyword arguments for :py:func:`json.dump` class.
         """
         with open(file_path, "w", encoding="utf-8") as fp:
-            json.dump(self.create(), fp, **kwargs)
+            _dump_json_array(self.__rows(), fp, **kwargs)
+
+    def to_jsonl(self, file_path: str, **kwargs: Any) -> None:
+        """Export a schema as a JSON Lines file.
+
+        Each row is written as a JSON object on a separate line,
+        so the whole dataset is never kept in memory.
+
+        .. versionadded:: 18.1.0
+
+        :param file_path: File a path.
+        :param kwargs: Extra keyword arguments for :py:func:`json.dumps`,
+            except **indent**, which would break the lines.
+        :raises ValueError: If **indent** is passed.
+        """
+        if kwargs.get("indent") is not None:
+            raise ValueError("JSON Lines cannot be indented.")
+
+        with open(file_path, "w", encoding="utf-8") as fp:
+            for chunk in _chunks(self.__rows(), self.chunk_size):
+                fp.writelines(json.dumps(row, **kwargs) + "\n" for row in chunk)
+
+    def to_parquet(self, file_path: str, **kwargs: Any) -> None:
+        """Export a schema as a Parquet file.
+
+        Data is generated and written in record batches of
+        :attr:`batch_size` rows (see :meth:`CompiledSchema.to_arrow`),
+        so the whole dataset is never kept in memory. Column types are
+        inferred from the first batch.
+
+        .. note:: Data is generated column by column, so the rows are
+            different from the rows of :meth:`create`, even in
+            the counter-based mode.
+
+        .. note:: The schema must be a :class:`CompiledSchema`.
+
+        .. versionadded:: 18.1.0
+
+        :param file_path: The file path.
+        :param kwargs: Extra keyword arguments for
+            :py:class:`pyarrow.parquet.ParquetWriter` class.
+        :raises TypeError: If the schema is not a :class:`CompiledSchema`.
+        :raises ImportError: If pyarrow is not installed.
+        """
+        if not isinstance(self.__schema, CompiledSchema):
+            raise TypeError(
+                "Parquet export requires a CompiledSchema, "
+                "see BaseField.compile() for details."
+            )
+
+        sizes = [
+            min(self.batch_size, rest)
+            for rest in range(self.iterations, 0, -self.batch_size)
+        ]
+        batch = self.__schema._record_batch(sizes[0])
+        with compat.pyarrow.parquet.ParquetWriter(
+            file_path, batch.schema, **kwargs
+        ) as writer:
+            writer.write_batch(batch)
+            for size in sizes[1:]:
+                writer.write_batch(self.__schema._record_batch(size, batch.schema))
 
     def to_pickle(self, file_path: str, **kwargs: Any) -> None:
         """Export a schema as the pickled representation of the object to the file.
 
+        .. note:: Unlike other exports, this one keeps all rows in memory,
+            because the pickled object is a list of rows.
+
         :param file_path: The file path.
         :param kwargs: Extra keyword arguments for :py:func:`pickle.dump` class.
         """
@@ -449,12 +1170,243 @@ class Schema:
 
         :return: List of fulfilled schemas.
         """
-        return [self.__schema() for _ in range(self.iterations)]
+        return self.__batch(0, self.iterations)
+
+    def row(self, index: int) -> JSON:
+        """Generates the row with the given index in the counter-based mode.
+
+        The row is the same as the row with this index of :meth:`create`,
+        but the rows before it are not generated.
+
+        .. versionadded:: 18.1.0
+
+        :param index: Index of the row.
+        :raises TypeError: If the schema is not counter-based.
+        :raises IndexError: If the index is out of range.
+        :return: Fulfilled schema.
+        """
+        if not self.__counter_based:
+            raise TypeError("Random access requires counter_based=True.")
+        if not 0 <= index < self.iterations:
+            raise IndexError("Row index out of range.")
+        return cast(CompiledSchema, self.__schema).row(index)
+
+    def create_parallel(
+        self,
+        workers: int | None = None,
+        seed: Seed = MissingSeed,
+        ordered: bool = True,
+    ) -> list[JSON]:
+        """Creates a list of a fulfilled schemas using multiple processes.
+
+        See :meth:`iterator_parallel` for details.
+
+        .. versionadded:: 18.1.0
+
+        :param workers: Number of worker processes.
+        :param seed: Base seed of the shards.
+        :param ordered: Keep the order of the shards.
+        :return: List of fulfilled schemas.
+        """
+        return list(self.iterator_parallel(workers, seed, ordered))
+
+    def iterator_parallel(
+        self,
+        workers: int | None = None,
+        seed: Seed = MissingSeed,
+        ordered: bool = True,
+    ) -> Iterator[JSON]:
+        """Generates fulfilled schemas using multiple processes.
+
+        The iterations are split into shards of :attr:`shard_size` rows.
+        Each shard is generated by a fresh copy of the schema, reseeded
+        with a seed derived from the base seed and the number of the shard,
+        so the result is the same for any number of workers.
+        In the counter-based mode, each shard generates the rows with
+        its indices instead, so the result is the same as of :meth:`create`.
+
+        Only a few shards per worker are generated ahead, so the memory
+        usage doesn't depend on the number of iterations.
+
+        .. note:: The schema must be a :class:`CompiledSchema`, because
+            it is sent to the worker processes, so it must be picklable.
+
+        .. note:: Since shards are independent, stateful fields,
+            such as ``increment``, start over in each shard.
+
+        .. versionadded:: 18.1.0
+
+        :param workers: Number of worker processes.
+            By default, it is the number of CPUs. When it is ``1``,
+            shards are generated in the current process.
+        :param seed: Base seed of the shards. By default, the seed
+            of the schema's field is used. If neither is set, the result
+            is random, but shards are still independent.
+        :param ordered: Yield shards in order. Otherwise, shards
+            are yielded as soon as they are ready.
+        :raises TypeError: If the schema is not a :class:`CompiledSchema`.
+        :return: Iterator of fulfilled schemas.
+        """
+        if not isinstance(self.__schema, CompiledSchema):
+            raise TypeError(
+                "Parallel generation requires a CompiledSchema, "
+                "see BaseField.compile() for details."
+            )
+
+        if seed is MissingSeed:
+            seed = self.__schema.seed
+        if seed is MissingSeed:
+            seed = _random.global_seed
+        if seed is None or seed is MissingSeed:
+            seed = int.from_bytes(os.urandom(8), "little")
+
+        schema = pickle.dumps(self.__schema)
+        shards = (
+            (
+                seed if self.__counter_based else derive_seed(seed, "shard", number),
+                min(self.shard_size, self.iterations - start),
+                start if self.__counter_based else None,
+            )
+            for number, start in enumerate(range(0, self.iterations, self.shard_size))
+        )
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            for shard in shards:
+                yield from _generate_shard(schema, *shard)
+            return
+
+        with ProcessPoolExecutor(workers) as executor:
+            pending: deque[Future[list[JSON]]] = deque()
+
+            def submit() -> bool:
+                shard = next(shards, None)
+                if shard is None:
+                    return False
+                pending.append(executor.submit(_generate_shard, schema, *shard))
+                return True
+
+            # Keep a few shards per worker in flight.
+            while len(pending) < 2 * workers and submit():
+                pass
+
+            try:
+                while pending:
+                    if ordered:
+                        done = [pending.popleft()]
+                    else:
+                        completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        done = [future for future in pending if future in completed]
+                        for future in done:
+                            pending.remove(future)
+
+                    for future in done:
+                        submit()
+                        yield from future.result()
+            finally:
+                # The iterator may be closed before all shards are consumed.
+                for future in pending:
+                    future.cancel()
+
+    async def aiter(
+        self,
+        batch_size: int = 100,
+        maxsize: int = 2,
+        executor: Executor | None = None,
+    ) -> AsyncIterator[JSON]:
+        """Generates fulfilled schemas asynchronously.
+
+        Rows are generated in batches of **batch_size** rows in
+        an executor, so the event loop is not blocked by the generation.
+        Generated batches are kept in a queue of at most **maxsize**
+        batches; when the queue is full, the generation waits until
+        the consumer takes a batch, so a slow consumer doesn't make
+        the memory usage grow.
+
+            >>> async for row in schema.aiter(batch_size=1000):
+            ...     await send(row)
+
+        The rows are the same as the rows of :meth:`create`, unless
+        the schema uses thread-safe fields (see :class:`BaseField`).
+        Such fields derive their seed from the name of the thread,
+        so their values depend on the thread of the executor.
+
+        .. note:: Batches are generated one after another, so
+            the schema is never called from several threads at once.
+            By default, a dedicated thread with the same name is used
+            each time, so thread-safe fields get the same seed each time.
+
+        .. versionadded:: 18.1.0
+
+        :param batch_size: Number of rows generated at once.
+        :param maxsize: Maximum number of batches generated ahead.
+        :param executor: Executor which runs the generation.
+            By default, a single-thread executor is created and shut down
+            when the iteration is over.
+        :raises ValueError: If **batch_size** or **maxsize** is less than 1.
+        :return: Asynchronous iterator of fulfilled schemas.
+        """
+        if batch_size < 1 or maxsize < 1:
+            raise ValueError("Batch size and queue size should be positive.")
+
+        own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(1, thread_name_prefix="mimesis-aiter")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[list[JSON] | BaseException | None]
+        queue = asyncio.Queue(maxsize)
+
+        async def produce() -> None:
+            try:
+                stop = self.iterations
+                for start in range(0, stop, batch_size):
+                    batch = await loop.run_in_executor(
+                        executor, self.__batch, start, min(stop, start + batch_size)
+                    )
+                    await queue.put(batch)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while (item := await queue.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                for row in item:
+                    yield row
+        finally:
+            # The iteration may be stopped before all batches are consumed.
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+            if own_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def __batch(self, start: int, stop: int) -> list[JSON]:
+        """Generate rows in the range without touching the state of the iterator."""
+        if self.__counter_based:
+            row = cast(CompiledSchema, self.__schema).row
+            return [row(index) for index in range(start, stop)]
+        return [self.__schema() for _ in range(start, stop)]
+
+    def __rows(self) -> Iterator[JSON]:
+        """Generate rows lazily without touching the state of the iterator."""
+        if self.__counter_based:
+            row = cast(CompiledSchema, self.__schema).row
+            return (row(index) for index in range(self.iterations))
+        return (self.__schema() for _ in range(self.iterations))
 
     def __next__(self) -> JSON:
         """Return the next item from the iterator."""
         if self.__counter < self.iterations:
             self.__counter += 1
+            if self.__counter_based:
+                return cast(CompiledSchema, self.__schema).row(self.__counter - 1)
             return self.__schema()
         raise StopIteration
 
@@ -14,10 +14,11 @@ If any of the following statements is true, move the type to this file:
 
 import datetime
 from decimal import Decimal
-from typing import Any, Callable, Final
+from typing import Any, Callable, Final, NamedTuple
 
 __all__ = [
     "CallableSchema",
+    "Categorical",
     "Date",
     "DateTime",
     "JSON",
@@ -58,3 +59,22 @@ Matrix = list[list[Number]]
 CallableSchema = Callable[[], JSON]
 
 Key = Callable[[Any], Any] | None
+
+
+class Categorical(NamedTuple):
+    """Dictionary-encoded values.
+
+    Each value is stored as a code, i.e. an index of the value in
+    the list of unique values (categories).
+    """
+
+    codes: list[int]
+    categories: list[Any]
+
+    def decode(self) -> list[Any]:
+        """Decode the values.
+
+        :return: List of values.
+        """
+        categories = self.categories
+        return [categories[code] for code in self.codes]
@@ -1,3 +1,3 @@
 #!/usr/bin/env bash
 
-python3 setup.py sdist bdist_wheel && twine upload dist/*
+python3 -m mimesis.datasets --release > /dev/null && poetry build && twine upload dist/*
@@ -0,0 +1,142 @@
+import copy
+import json
+import os
+import pickle
+import shutil
+
+import pytest
+
+from mimesis.constants import DATADIR
+from mimesis.datasets.compiler import (
+    CompiledDataset,
+    compile_dataset,
+    compile_datasets,
+    read_dataset,
+)
+from mimesis.locales import Locale
+from mimesis.providers.base import BaseDataProvider
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "en" / "data.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({"words": ["a", "b"], "names": {"male": ["John"]}}))
+    return path
+
+
+def test_compile_dataset(source):
+    target = compile_dataset(source)
+    assert target == source.with_suffix(".bin")
+
+    dataset = read_dataset(source)
+    assert isinstance(dataset, CompiledDataset)
+    assert dataset == json.loads(source.read_text())
+    assert list(dataset) == ["words", "names"]
+    assert len(dataset) == 2
+    assert "words" in dataset
+    assert "color" not in dataset
+
+
+def test_compiled_dataset_decodes_lazily(source):
+    compile_dataset(source)
+    dataset = read_dataset(source)
+    assert not dataset._values
+
+    assert dataset["words"] == ["a", "b"]
+    assert dataset["words"] is dataset["words"]
+    assert list(dataset._values) == ["words"]
+
+    with pytest.raises(KeyError):
+        dataset["color"]
+
+
+def test_compiled_dataset_copy_and_pickle(source):
+    compile_dataset(source)
+    dataset = read_dataset(source)
+    expected = json.loads(source.read_text())
+    assert copy.deepcopy(dataset) == expected
+    assert pickle.loads(pickle.dumps(dataset)) == expected
+
+
+def _edit(source, content):
+    # Changes the content without changing the size.
+    stat = source.stat()
+    source.write_text(content)
+    assert source.stat().st_size == stat.st_size
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_outdated_compiled_dataset_is_ignored(source):
+    compile_dataset(source)
+    _edit(source, source.read_text().replace("John", "Jack"))
+
+    dataset = read_dataset(source)
+    assert not isinstance(dataset, CompiledDataset)
+    assert dataset["names"] == {"male": ["Jack"]}
+
+    source.write_text(json.dumps({"words": ["c"]}))
+    compile_dataset(source)
+    source.write_text(json.dumps({"words": ["cd"]}))
+    assert read_dataset(source) == {"words": ["cd"]}
+
+
+def test_moved_compiled_dataset_is_used(source):
+    # Installing a package changes modification times, but not the content.
+    compile_dataset(source)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert isinstance(read_dataset(source), CompiledDataset)
+
+
+def test_release_compiled_dataset_is_trusted(source, monkeypatch):
+    compile_dataset(source, release=True)
+    _edit(source, source.read_text().replace("John", "Jack"))
+    # The source isn't read, only the size is compared.
+    monkeypatch.setattr("mimesis.datasets.compiler._digest", None)
+    assert read_dataset(source)["names"] == {"male": ["John"]}
+
+    source.write_text(json.dumps({"words": ["c"]}))
+    assert read_dataset(source) == {"words": ["c"]}
+
+
+def test_broken_compiled_dataset_is_ignored(source):
+    compile_dataset(source).write_bytes(b"MMDS")
+    assert read_dataset(source) == json.loads(source.read_text())
+
+
+def test_read_missing_dataset(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_dataset(tmp_path / "missing.json")
+
+
+def test_compile_dataset_rejects_non_dict(source):
+    source.write_text("[]")
+    with pytest.raises(TypeError):
+        compile_dataset(source)
+
+
+def test_provider_uses_compiled_datasets(tmp_path):
+    for locale in ("en", "en-gb"):
+        shutil.copytree(DATADIR / locale, tmp_path / locale)
+
+    compiled = compile_datasets(tmp_path)
+    assert compile_dataset(tmp_path / "en" / "person.json") in compiled
+
+    class Person(BaseDataProvider):
+        class Meta:
+            name = "person"
+            datafile = "person.json"
+            datadir = tmp_path
+
+    person = Person(Locale.EN)
+    assert isinstance(person._dataset, CompiledDataset)
+    assert (
+        person._extract(["occupation"])
+        == read_dataset(DATADIR / "en" / "person.json")["occupation"]
+    )
+
+    # Sub-locales are merged into a plain copy of the master dataset.
+    person_gb = Person(Locale.EN_GB)
+    assert isinstance(person_gb._dataset, dict)
+    assert person._dataset["telephone_fmt"] != person_gb._dataset["telephone_fmt"]
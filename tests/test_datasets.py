@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+from mimesis import datasets
+from mimesis.datasets.int import address
+
+
+def test_datasets_are_loaded_lazily():
+    code = (
+        "import sys, mimesis; "
+        "print(any(m.startswith('mimesis.datasets.int.') for m in sys.modules)); "
+        "mimesis.Address().calling_code(); "
+        "print(sorted(m for m in sys.modules if m.startswith('mimesis.datasets.int.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert output.stdout.splitlines() == [
+        "False",
+        "['mimesis.datasets.int.address']",
+    ]
+
+
+def test_getattr():
+    assert datasets.CALLING_CODES is address.CALLING_CODES
+    assert "CALLING_CODES" in vars(datasets)
+
+
+def test_getattr_unknown():
+    with pytest.raises(AttributeError, match="NONEXISTENT"):
+        datasets.NONEXISTENT  # noqa: B018
+
+
+def test_dir():
+    assert set(datasets.__all__) <= set(dir(datasets))
+    assert "TIMEZONES" in datasets.__all__
+
+
+def test_star_import():
+    namespace = {}
+    exec("from mimesis.datasets import *", namespace)
+    assert namespace["GENDER_CODES"] == datasets.GENDER_CODES
@@ -3,7 +3,7 @@ import pytest
 from mimesis.exceptions import LocaleError
 from mimesis.keys import maybe, romanize
 from mimesis.locales import Locale
-from mimesis.random import random
+from mimesis.random import Random, random
 
 ROMANIZE_INPUT_PARAMETERS = [
     (Locale.RU, "Ликид Геимфари", "Likid Geimfari"),
@@ -35,6 +35,15 @@ def test_maybe():
     assert key("foo", random) is not None
 
 
+@pytest.mark.parametrize("probability", [0.1, 0.3, 0.5, 0.9])
+def test_maybe_is_weighted_choice(probability):
+    key = maybe(None, probability=probability)
+    weights = [1 - probability, probability]
+    first, second = Random(0xFF), Random(0xFF)
+    expected = [first.choices([i, None], weights)[0] for i in range(100)]
+    assert [key(i, second) for i in range(100)] == expected
+
+
 @pytest.mark.parametrize(
     "locale, string, expected",
     ROMANIZE_INPUT_PARAMETERS,
@@ -1,4 +1,7 @@
+import copy
+import inspect
 import json
+import pickle
 import re
 import tempfile
 from pathlib import Path
@@ -10,8 +13,13 @@ from mimesis.enums import Gender
 from mimesis.exceptions import LocaleError, NonEnumerableError
 from mimesis.locales import Locale
 from mimesis.providers import Code, Cryptographic, Internet, Person
-from mimesis.providers.base import BaseDataProvider, BaseProvider
-from mimesis.types import MissingSeed
+from mimesis.providers.base import (
+    BaseDataProvider,
+    BaseProvider,
+    batch_method,
+    choice_method,
+)
+from mimesis.types import Categorical, MissingSeed
 
 from . import patterns
 
@@ -67,6 +75,24 @@ class TestBase:
         assert len(base_data_provider._dataset.keys()) == keys_count + 1
         assert len(base_data_provider._dataset.keys()) == values_count + 1
 
+    def test_dataset_is_shared(self):
+        p1, p2 = Person(Locale.EN), Person(Locale.EN)
+        assert p1._dataset is p2._dataset
+        assert Person(Locale.EN_GB)._dataset is not p1._dataset
+
+    def test_update_dataset_does_not_affect_other_instances(self):
+        p1, p2 = Person(Locale.EN), Person(Locale.EN)
+        p1.update_dataset({"occupation": ["Benchmarker"]})
+        assert p1.occupation() == "Benchmarker"
+        assert p2._dataset["occupation"] != ["Benchmarker"]
+        assert Person(Locale.EN)._dataset["occupation"] != ["Benchmarker"]
+
+    def test_sublocale_does_not_affect_master_locale(self):
+        master = Person(Locale.EN)._dataset
+        merged = Person(Locale.EN_GB)._dataset
+        assert merged["telephone_fmt"] != master["telephone_fmt"]
+        assert Person(Locale.EN)._dataset is master
+
     @pytest.mark.parametrize("data", [set(), [], "", tuple()])
     def test_update_dataset_raises_error(self, base_data_provider, data):
         with pytest.raises(TypeError):
@@ -209,6 +235,12 @@ class TestBase:
         with pytest.raises(NonEnumerableError):
             base_data_provider.validate_enum("", "")
 
+    def test_validate_enum_is_choice_enum_item(self):
+        first, second = BaseProvider(seed=0xFF), BaseProvider(seed=0xFF)
+        values = [first.validate_enum(None, Gender) for _ in range(50)]
+        members = [second.random.choice_enum_item(Gender) for _ in range(50)]
+        assert values == [member.value for member in members]
+
     @pytest.mark.parametrize("locale", Locale)
     def test_get_current_locale(self, locale):
         base = BaseDataProvider(locale=locale)
@@ -309,3 +341,162 @@ class TestSeededBase:
 
         b3 = BaseProvider(seed=seed)
         assert b3._has_seed() is True
+
+
+class TestBatchMethod:
+    @pytest.fixture
+    def person(self):
+        return Person(Locale.EN, seed=0xFF)
+
+    def test_batch(self, person):
+        names = person._extract(["names"])
+        result = person.name.batch(100, gender=Gender.MALE)
+        assert len(result) == 100
+        assert set(result) <= set(names["male"])
+
+    def test_batch_mixes_enum_members(self, person):
+        names = person._extract(["names"])
+        result = person.name.batch(500)
+        assert set(result) <= set(names["male"]) | set(names["female"])
+        assert set(result) & set(names["male"])
+        assert set(result) & set(names["female"])
+
+    def test_batch_multiple_enums(self, person):
+        result = person.title.batch(50)
+        assert len(result) == 50
+
+        result = person.title.batch(50, gender=Gender.FEMALE)
+        titles = person._extract(["title", "female"])
+        assert set(result) <= set(titles["typical"]) | set(titles["academic"])
+
+    @pytest.mark.parametrize("n", [0, 1, 10])
+    def test_batch_size(self, person, n):
+        assert len(person.occupation.batch(n)) == n
+        assert len(person.name.batch(n)) == n
+
+    def test_batch_is_deterministic(self):
+        p1, p2 = Person(seed=42), Person(seed=42)
+        assert p1.name.batch(50) == p2.name.batch(50)
+        assert p1.university.batch(50) == p2.university.batch(50)
+
+    def test_batch_raises(self, person):
+        with pytest.raises(NonEnumerableError):
+            person.name.batch(10, gender="male")
+
+    def test_single_value(self, person):
+        assert person.name(gender=Gender.FEMALE) in person._extract(["names", "female"])
+        assert person.blood_type() in person.blood_type.batch(1000)
+
+    def test_metadata(self, person):
+        assert person.name.__name__ == "name"
+        assert person.name.__doc__ == Person.name.__doc__
+        assert "gender" in str(inspect.signature(person.name))
+        assert person.name is person.name
+
+    def test_unbound_method(self, person):
+        assert callable(Person.name)
+        assert inspect.isroutine(Person.name)
+        assert Person.name(person, gender=Gender.FEMALE) in person._extract(
+            ["names", "female"]
+        )
+        assert str(inspect.signature(Person.blood_type)) == "(self) -> str"
+
+    def test_return_annotation(self, person):
+        assert inspect.signature(person.name).return_annotation is str
+        assert inspect.signature(Person.name).return_annotation is str
+        assert person.name.__annotations__["return"] is str
+
+    def test_instances_are_independent(self):
+        p1, p2 = Person(seed=1), Person(seed=1)
+        assert p1.name is not p2.name
+        p1.name.batch(10)
+        assert p2.name() == Person(seed=1).name()
+
+    def test_subclass_override(self):
+        class Shouting(Person):
+            def name(self, gender=None):
+                return super().name(gender).upper() + "!"
+
+        person = Shouting(seed=1)
+        names = [person.name() for _ in range(3)]
+        assert all(name.isupper() and name.endswith("!") for name in names)
+        assert "name" not in vars(person)
+        assert len(person.surname.batch(3)) == 3
+        assert "surname" in vars(person)
+
+    @pytest.mark.parametrize(
+        "method, kwargs",
+        [
+            ("blood_type", {}),
+            ("name", {}),
+            ("name", {"gender": Gender.MALE}),
+            ("title", {}),
+        ],
+    )
+    def test_codes(self, method, kwargs):
+        p1, p2 = Person(seed=7), Person(seed=7)
+        encoded = getattr(p1, method).codes(300, **kwargs)
+
+        assert isinstance(encoded, Categorical)
+        assert len(encoded.codes) == 300
+        assert len(set(encoded.categories)) == len(encoded.categories)
+        assert all(0 <= code < len(encoded.categories) for code in encoded.codes)
+        assert encoded.decode() == getattr(p2, method).batch(300, **kwargs)
+
+    def test_codes_with_duplicates(self, person):
+        person.update_dataset({"occupation": ["a", "b", "a", "c"]})
+        encoded = person.occupation.codes(100)
+        assert sorted(encoded.categories) == ["a", "b", "c"]
+        assert set(encoded.decode()) <= {"a", "b", "c"}
+
+    def test_copy_and_pickle(self, person):
+        person.name.batch(1)
+        clones = [copy.deepcopy(person), pickle.loads(pickle.dumps(person))]
+        result = person.name.batch(5)
+        for clone in clones:
+            assert clone.name is not person.name
+            assert clone.name.batch(5) == result
+        assert pickle.loads(pickle.dumps(person.name))() in person._extract(
+            ["names", "female"]
+        ) + person._extract(["names", "male"])
+
+    def test_batch_method(self):
+        class Numbers(BaseProvider):
+            class Meta:
+                name = "numbers"
+
+            def _numbers(self, n, maximum=10):
+                return [maximum] * n
+
+            @batch_method(_numbers)
+            def number(self, maximum=10):
+                """Docstring."""
+                return self.random.randint(0, maximum)
+
+        numbers = Numbers(seed=1)
+        assert 0 <= numbers.number(5) <= 5
+        assert numbers.number.batch(3, maximum=5) == [5, 5, 5]
+        assert numbers.number.codes is None
+        assert numbers.number.__doc__ == "Docstring."
+        assert "maximum" in str(inspect.signature(numbers.number))
+
+    def test_choice_method(self):
+        class Letters(BaseProvider):
+            class Meta:
+                name = "letters"
+
+            def _letters(self, gender=None):
+                key = self.validate_enum(gender, Gender)
+                return ["a", "b"] if key == "male" else ["c"]
+
+            @choice_method(_letters, gender=Gender)
+            def letter(self, gender=None):
+                """Docstring."""
+                return self.random.choice(self._letters(gender))
+
+        letters = Letters(seed=1)
+        assert letters.letter(Gender.FEMALE) == "c"
+        assert set(letters.letter.batch(50, gender=Gender.MALE)) == {"a", "b"}
+        assert set(letters.letter.batch(50)) == {"a", "b", "c"}
+        assert letters.letter.codes(5, gender=Gender.FEMALE).codes == [0] * 5
+        assert letters.letter.__doc__ == "Docstring."
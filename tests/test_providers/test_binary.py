@@ -39,3 +39,37 @@ class TestBinaryFile:
 
             with tempfile.TemporaryFile() as f:
                 f.write(content)
+
+    def test_content_is_cached(self, binary):
+        assert binary.image() is BinaryFile().image()
+        assert binary.image(file_type=ImageFile.GIF) is not binary.image()
+
+    @pytest.mark.parametrize(
+        "file_type",
+        [VideoFile.MOV, AudioFile.AAC, ImageFile.JPG, CompressedFile.GZIP],
+    )
+    def test_view(self, binary, file_type):
+        view = binary.view(file_type=file_type)
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view == binary._read_file(file_type=file_type)
+
+    @pytest.mark.parametrize(
+        "file_type",
+        [VideoFile.MP4, DocumentFile.PDF, CompressedFile.ZIP],
+    )
+    def test_stream(self, binary, file_type):
+        content = binary._read_file(file_type=file_type)
+        stream = binary.stream(file_type=file_type)
+        assert stream.read() == content
+
+        other = binary.stream(file_type=file_type)
+        other.write(b"overwritten")
+        assert binary.stream(file_type=file_type).read() == content
+        assert binary._read_file(file_type=file_type) == content
+
+    def test_view_and_stream_raise(self, binary):
+        with pytest.raises(TypeError):
+            binary.view(VideoFile.MP4)
+        with pytest.raises(TypeError):
+            binary.stream(VideoFile.MP4)
@@ -2,6 +2,7 @@ import datetime
 import re
 
 import pytest
+import pytz
 
 from mimesis import Datetime
 from mimesis.datasets import GMT_OFFSETS, TIMEZONES
@@ -53,6 +54,47 @@ class TestDatetime:
                 date_start, date_start + datetime.timedelta(days=1)
             )
 
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"hours": 1},
+            {"minutes": 7},
+            {"days": 7},
+            {"days": 8},
+            {"seconds": 1, "microseconds": 123457},
+        ],
+    )
+    def test_iter_datetimes(self, _datetime, kwargs):
+        date_start = datetime.datetime(2020, 1, 1, microsecond=1)
+        date_end = date_start + datetime.timedelta(days=7, seconds=5)
+        expected = _datetime.bulk_create_datetimes(date_start, date_end, **kwargs)
+
+        iterator = _datetime.iter_datetimes(date_start, date_end, **kwargs)
+        assert not isinstance(iterator, list)
+        assert list(iterator) == expected
+
+        array = _datetime.bulk_create_datetime64(date_start, date_end, **kwargs)
+        assert str(array.dtype) == "datetime64[us]"
+        assert array.tolist() == expected
+
+    @pytest.mark.parametrize("method", ["iter_datetimes", "bulk_create_datetime64"])
+    def test_iter_datetimes_error(self, _datetime, method):
+        date_start = datetime.datetime.now()
+        # Errors are raised immediately, not on the first iteration.
+        with pytest.raises(ValueError):
+            getattr(_datetime, method)(date_start, date_start - datetime.timedelta(1))
+        with pytest.raises(ValueError):
+            getattr(_datetime, method)(None, None)
+        with pytest.raises(ValueError):
+            getattr(_datetime, method)(date_start, date_start)
+
+    def test_bulk_create_datetime64_aware(self, _datetime):
+        date_start = datetime.datetime.now(datetime.timezone.utc)
+        with pytest.raises(ValueError):
+            _datetime.bulk_create_datetime64(
+                date_start, date_start + datetime.timedelta(days=1), hours=1
+            )
+
     def test_year(self, _datetime):
         result = _datetime.year(minimum=2000, maximum=_datetime._CURRENT_YEAR)
         assert result >= 2000
@@ -85,6 +127,54 @@ class TestDatetime:
         result = dt.formatted_datetime(fmt="")
         assert result
 
+    @pytest.mark.parametrize(
+        "fmt",
+        [
+            "%d.%m.%Y %H:%M:%S",
+            "%y. %m. %d %I:%M:%S.%f",
+            "100%% %Y",
+            "%d %B %Y %I:%M %p",
+            "no directives",
+        ],
+    )
+    @pytest.mark.parametrize("start, end", [(1, 999), (1000, 9999)])
+    def test_formatted_datetime_is_strftime(self, fmt, start, end):
+        first, second = Datetime(seed=0xFF), Datetime(seed=0xFF)
+        for _ in range(100):
+            expected = first.datetime(start, end).strftime(fmt)
+            assert second.formatted_datetime(fmt, start=start, end=end) == expected
+
+    def test_formatted_datetime_timezone(self, _datetime):
+        result = _datetime.formatted_datetime("%H %z", timezone="Asia/Tokyo")
+        assert result.endswith(" +0900")
+        assert (
+            _datetime.formatted_datetime.batch(5, "%z", timezone="Asia/Tokyo")
+            == ["+0900"] * 5
+        )
+
+    @pytest.mark.parametrize("n", [10, 2000])
+    def test_formatted_batch(self, dt, n):
+        date_fmt = dt._extract(["formats", "date"])
+        time_fmt = dt._extract(["formats", "time"])
+
+        dates = dt.formatted_date.batch(n, start=2001, end=2002)
+        times = dt.formatted_time.batch(n)
+        datetimes = dt.formatted_datetime.batch(n, start=2001, end=2002)
+        assert len(dates) == len(times) == len(datetimes) == n
+
+        for value in dates:
+            assert 2001 <= datetime.datetime.strptime(value, date_fmt).year <= 2002
+        for value in times:
+            datetime.datetime.strptime(value, time_fmt)
+        for value in datetimes:
+            datetime.datetime.strptime(value, f"{date_fmt} {time_fmt}")
+
+    @pytest.mark.parametrize("n", [10, 2000])
+    def test_time_batch(self, _datetime, n):
+        result = _datetime.time.batch(n)
+        assert len(result) == n
+        assert all(isinstance(value, datetime.time) for value in result)
+
     def test_time(self, dt):
         default = dt.time()
         assert isinstance(default, datetime.time)
@@ -141,6 +231,12 @@ class TestDatetime:
         region = result.split("/")[0]
         assert region in set([tz.split("/")[0] for tz in TIMEZONES])
 
+    @pytest.mark.parametrize("region", TimezoneRegion)
+    def test_timezone_batch(self, _datetime, region):
+        result = _datetime.timezone.batch(50, region=region)
+        assert len(result) == 50
+        assert all(tz.startswith(region.value) for tz in result)
+
     @pytest.mark.parametrize(
         "fmt, out_type, kwargs",
         [
@@ -164,6 +260,48 @@ class TestDatetime:
         with pytest.raises(NonEnumerableError):
             _datetime.timestamp(fmt="Blabla")
 
+    @pytest.mark.parametrize("n", [10, 2000])
+    @pytest.mark.parametrize("fmt", [*TimestampFormat, None])
+    @pytest.mark.parametrize("timezone", [None, "Europe/Paris"])
+    def test_timestamp_batch(self, _datetime, n, fmt, timezone):
+        kwargs = {"start": 1960, "end": 2030, "timezone": timezone}
+        result = _datetime.timestamp.batch(n, fmt, **kwargs)
+        assert len(result) == n
+
+        if fmt in (TimestampFormat.RFC_3339, TimestampFormat.ISO_8601):
+            for stamp in result:
+                assert 1960 <= int(stamp[:4]) <= 2030
+                if fmt == TimestampFormat.RFC_3339:
+                    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ", stamp)
+                else:
+                    parsed = datetime.datetime.fromisoformat(stamp)
+                    assert stamp == parsed.isoformat()
+                    assert (parsed.tzinfo is None) == (timezone is None)
+        else:
+            first = datetime.datetime(1960, 1, 1)
+            last = datetime.datetime(2030, 12, 31, 23, 59, 59)
+            if timezone:
+                first, last = map(pytz.timezone(timezone).localize, (first, last))
+            bounds = range(int(first.timestamp()), int(last.timestamp()) + 1)
+            assert all(type(stamp) is int and stamp in bounds for stamp in result)
+
+    @pytest.mark.parametrize("n", [10, 2000])
+    def test_date_batch(self, _datetime, n):
+        result = _datetime.date.batch(n, start=1, end=9999)
+        assert len(result) == n
+        assert all(type(value) is datetime.date for value in result)
+        assert _datetime.date.batch(n, start=2020, end=2020)[0].year == 2020
+        assert _datetime.date.batch(0) == []
+
+    @pytest.mark.parametrize("unit", ["D", "s", "us"])
+    def test_datetime64(self, _datetime, unit):
+        result = _datetime.datetime64(100, start=2019, end=2020, unit=unit)
+        assert len(result) == 100
+        assert str(result.dtype) == f"datetime64[{unit}]"
+        years = result.astype("datetime64[Y]").astype(int) + 1970
+        assert years.min() >= 2019
+        assert years.max() <= 2020
+
     @pytest.mark.parametrize(
         "start, end, timezone",
         [
@@ -182,6 +320,33 @@ class TestDatetime:
         else:
             assert dt_obj.tzinfo is None
 
+    @pytest.mark.parametrize(
+        "start, end, timezone",
+        [
+            (2014, 2019, "Europe/Paris"),
+            (2001, 2001, "America/New_York"),
+            (2001, 2001, "Pacific/Kiritimati"),
+            (2020, 2020, "UTC"),
+            (9999, 9999, None),
+            (2014, 2019, None),
+        ],
+    )
+    def test_datetime_batch(self, _datetime, start, end, timezone):
+        result = _datetime.datetime.batch(500, start=start, end=end, timezone=timezone)
+        assert len(result) == 500
+        for dt_obj in result:
+            assert start <= dt_obj.year <= end
+            if timezone:
+                assert str(dt_obj.tzinfo.zone) == timezone
+                assert dt_obj.utcoffset() == dt_obj.tzinfo.normalize(dt_obj).utcoffset()
+            else:
+                assert dt_obj.tzinfo is None
+
+    def test_datetime_batch_invalid(self, _datetime):
+        assert _datetime.datetime.batch(0) == []
+        with pytest.raises(ValueError):
+            _datetime.datetime.batch(1, start=2020, end=2019)
+
     @pytest.mark.parametrize(
         "start, end",
         [
@@ -294,6 +459,12 @@ class TestSeededDatetime:
     def test_formatted_time(self, d1, d2):
         assert d1.formatted_time() == d2.formatted_time()
 
+    @pytest.mark.parametrize(
+        "method", ["formatted_date", "formatted_time", "formatted_datetime", "time"]
+    )
+    def test_formatted_batch(self, d1, d2, method):
+        assert getattr(d1, method).batch(10) == getattr(d2, method).batch(10)
+
     def test_century(self, d1, d2):
         assert d1.century() == d2.century()
 
@@ -322,6 +493,24 @@ class TestSeededDatetime:
     def test_formatted_datetime(self, d1, d2):
         assert d1.formatted_datetime() == d2.formatted_datetime()
 
+    @pytest.mark.parametrize("timezone", [None, "Europe/Paris"])
+    def test_datetime_batch(self, d1, d2, timezone):
+        assert d1.datetime.batch(10, timezone=timezone) == d2.datetime.batch(
+            10, timezone=timezone
+        )
+
+    @pytest.mark.parametrize("n", [10, 2000])
+    @pytest.mark.parametrize("fmt", TimestampFormat)
+    def test_timestamp_batch(self, d1, d2, n, fmt):
+        assert d1.timestamp.batch(n, fmt) == d2.timestamp.batch(n, fmt)
+
+    @pytest.mark.parametrize("n", [10, 2000])
+    def test_date_batch(self, d1, d2, n):
+        assert d1.date.batch(n, 1, 9999) == d2.date.batch(n, 1, 9999)
+
+    def test_datetime64(self, d1, d2):
+        assert (d1.datetime64(10) == d2.datetime64(10)).all()
+
     def test_week_date(self, d1, d2):
         assert d1.week_date() == d2.week_date()
         assert d1.week_date(start=2007, end=2018) == d2.week_date(start=2007, end=2018)
@@ -137,6 +137,56 @@ class TestGeneric:
         for p in providers:
             assert not p.startswith("_")
 
+    def test_providers_are_created_lazily(self):
+        generic = Generic()
+        assert "person" not in vars(generic)
+        assert "person" in dir(generic)
+        assert generic.person is generic.person
+        assert "person" in vars(generic)
+        assert "address" not in vars(generic)
+
+    def test_find_providers(self):
+        generic = Generic()
+        assert generic.find_providers("title") == ("person", "text")
+        assert generic.find_providers("surname") == ("person",)
+        assert generic.find_providers("reseed") == ()
+        assert generic.find_providers("nonexistent") == ()
+        assert "person" not in vars(generic)
+
+    def test_reseed_created_providers_only(self):
+        generic = Generic(seed=1)
+        person = generic.person
+        generic.reseed(2)
+        assert person.seed == 2
+        assert "address" not in vars(generic)
+        assert generic.address.seed == 2
+
+    def test_shared_random(self):
+        generic = Generic(seed=0xFF, shared_random=True)
+        assert generic.person.random is generic.random
+        assert generic.payment._person.random is generic.random
+
+        class CustomProvider(BaseProvider):
+            class Meta:
+                name = "custom"
+
+        generic.add_provider(CustomProvider)
+        assert generic.custom.random is generic.random
+
+    def test_shared_random_stream(self):
+        g1 = Generic(seed=0xFF, shared_random=True)
+        g2 = Generic(seed=0xFF, shared_random=True)
+        # Creating a provider doesn't affect the stream.
+        _ = g2.address, g2.payment, g2.internet
+        assert g1.person.name() == g2.person.name()
+        assert g1.payment.credit_card_owner() == g2.payment.credit_card_owner()
+        assert g1.random.random() == g2.random.random()
+
+    def test_own_random(self):
+        generic = Generic(seed=0xFF)
+        assert generic.person.random is not generic.random
+        assert generic.person.random is not generic.address.random
+
 
 class TestSeededGeneric:
     @pytest.fixture
@@ -26,6 +26,12 @@ class TestInternet:
     def test_str(self, net):
         assert re.match(patterns.PROVIDER_STR_REGEX, str(net))
 
+    def test_auxiliary_providers_are_created_lazily(self):
+        net = Internet(seed=0xFF)
+        assert not {"_file", "_code", "_text", "_datetime"} & set(vars(net))
+        assert net._text.random is net.random
+        assert net._datetime.random is net.random
+
     @pytest.mark.parametrize(
         "dsn_type",
         [
@@ -1,5 +1,7 @@
 import decimal
+import pickle
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -28,6 +30,23 @@ class TestNumbers:
             for key in ("a", "b", "c"):
                 assert numeric.increment(accumulator=key) == i
 
+    def test_incremental_in_threads(self):
+        numeric = Numeric()
+
+        def increment(_):
+            return [numeric.increment() for _ in range(1000)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = [i for chunk in executor.map(increment, range(8)) for i in chunk]
+        assert sorted(results) == list(range(1, 8000 + 1))
+
+    def test_incremental_pickle(self):
+        numeric = Numeric()
+        numeric.increment()
+        clone = pickle.loads(pickle.dumps(numeric))
+        assert clone.increment() == 2
+        assert numeric.increment() == 2
+
     @pytest.mark.parametrize(
         "start, end",
         [
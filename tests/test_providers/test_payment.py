@@ -18,6 +18,11 @@ class TestPayment:
     def test_str(self, payment):
         assert re.match(patterns.PROVIDER_STR_REGEX, str(payment))
 
+    def test_person_is_created_lazily(self):
+        payment = Payment(seed=0xFF)
+        assert "_person" not in vars(payment)
+        assert payment._person.random is payment.random
+
     def test_bitcoin(self, payment):
         result = payment.bitcoin_address()
         assert result[0] in ["1", "3"]
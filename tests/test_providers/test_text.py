@@ -120,6 +120,34 @@ class TestText:
         result = _text.emoji(category=category)
         assert isinstance(result, str)
 
+    @pytest.fixture
+    def decoded_emojis(self):
+        emojis = Text()._read_global_file("emojis.json")
+        return {
+            category: {
+                "".join(chr(int(s, 16)) for s in symbol)
+                if isinstance(symbol, list)
+                else chr(int(symbol, 16))
+                for symbol in symbols
+            }
+            for category, symbols in emojis.items()
+        }
+
+    @pytest.mark.parametrize("category", EmojyCategory)
+    def test_emoji_is_decoded(self, _text, decoded_emojis, category):
+        result = {_text.emoji(category=category) for _ in range(100)}
+        assert result <= decoded_emojis[category.value]
+
+    @pytest.mark.parametrize("category", [None, *EmojyCategory])
+    def test_emoji_batch(self, _text, decoded_emojis, category):
+        result = _text.emoji.batch(100, category=category)
+        assert len(result) == 100
+
+        if category is None:
+            assert set(result) <= set().union(*decoded_emojis.values())
+        else:
+            assert set(result) <= decoded_emojis[category.value]
+
 
 class TestSeededText:
     @pytest.fixture
@@ -173,3 +201,7 @@ class TestSeededText:
 
     def test_emoji(self, t1, t2):
         assert t1.emoji() == t2.emoji()
+
+    @pytest.mark.parametrize("category", [None, EmojyCategory.FLAGS])
+    def test_emoji_batch(self, t1, t2, category):
+        assert t1.emoji.batch(10, category) == t2.emoji.batch(10, category)
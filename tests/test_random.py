@@ -1,6 +1,7 @@
 import pytest
 
 from mimesis.enums import Gender
+from mimesis.random import Random, WeightedSampler, derive_seed
 from mimesis.random import random as _random
 
 
@@ -91,6 +92,12 @@ def test_generate_string_by_mask_with_seed(random, seed, expected):
     assert random.generate_string_by_mask() == expected
 
 
+def test_generate_string_by_mask_placeholders_are_compiled_separately(random):
+    assert random.generate_string_by_mask("#@", char="@", digit="#")[0].isdigit()
+    assert random.generate_string_by_mask("#@", char="#", digit="@")[0].isalpha()
+    assert random.generate_string_by_mask("#@", char="*", digit="$") == "#@"
+
+
 def test_get_random_item(random):
     result = random.choice_enum_item(Gender)
     assert result in Gender
@@ -119,3 +126,143 @@ def test_weighted_choice(random):
 def test_weighted_choice_with_empty_dict(random):
     with pytest.raises(ValueError):
         random.weighted_choice(choices={})
+
+
+def test_weighted_sampler(random):
+    choices = {"a": 1, "b": 2.5, "c": 0, "d": 7}
+    sampler = WeightedSampler(choices)
+    assert len(sampler) == 4
+
+    random.seed(0xF)
+    weights = list(choices.values())
+    expected = [random.choices(list(choices), weights)[0] for _ in range(100)]
+    random.seed(0xF)
+    assert [sampler.sample(random) for _ in range(100)] == expected
+    random.seed(0xF)
+    assert [random.weighted_choice(sampler) for _ in range(100)] == expected
+    random.seed(0xF)
+    assert [random.weighted_choice(choices) for _ in range(100)] == expected
+    assert "c" not in expected
+
+
+@pytest.mark.parametrize(
+    "choices",
+    [{}, {"a": 0}, {"a": -1, "b": 0.5}, {"a": float("inf")}],
+)
+def test_weighted_sampler_invalid(choices):
+    with pytest.raises(ValueError):
+        WeightedSampler(choices)
+
+
+@pytest.fixture(params=["python", "numpy"])
+def batch_size(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        return 2000
+    monkeypatch.setattr("mimesis.compat.numpy", None)
+    return 100
+
+
+def _seeded_pair(seed=0xFF):
+    return Random(seed), Random(seed)
+
+
+def test_randint_batch(batch_size):
+    r1, r2 = _seeded_pair()
+    result = r1.randint_batch(-5, 5, batch_size)
+    assert len(result) == batch_size
+    assert all(isinstance(x, int) and -5 <= x <= 5 for x in result)
+    assert set(result) == set(range(-5, 6))
+    assert result == r2.randint_batch(-5, 5, batch_size)
+
+
+def test_randint_batch_huge_range(batch_size):
+    result = Random(1).randint_batch(0, 2**100, batch_size)
+    assert all(0 <= x <= 2**100 for x in result)
+
+
+def test_randint_array():
+    numpy = pytest.importorskip("numpy")
+    r1, r2 = _seeded_pair()
+    result = r1._randint_array(-5, 2**40, 2000)
+    assert result.dtype == numpy.int64
+    assert result.tolist() == r2.randint_batch(-5, 2**40, 2000)
+
+
+@pytest.mark.parametrize("a, b, n", [(2, 1, 10), (1, 2, -1)])
+def test_randint_batch_value_error(random, a, b, n):
+    with pytest.raises(ValueError):
+        random.randint_batch(a, b, n)
+
+
+def test_uniform_batch(batch_size):
+    r1, r2 = _seeded_pair()
+    result = r1.uniform_batch(2.5, 3.5, batch_size, precision=2)
+    assert len(result) == batch_size
+    assert all(2.5 <= x <= 3.5 and round(x, 2) == x for x in result)
+    assert result == r2.uniform_batch(2.5, 3.5, batch_size, precision=2)
+
+
+def test_index_and_choice_batch(batch_size):
+    r1, r2 = _seeded_pair()
+    population = ["a", "b", "c"]
+    indices = r1.index_batch(len(population), batch_size)
+    assert set(indices) == {0, 1, 2}
+
+    result = r1.choice_batch(population, batch_size)
+    assert set(result) == set(population)
+
+    assert indices == r2.index_batch(len(population), batch_size)
+    assert result == r2.choice_batch(population, batch_size)
+
+    with pytest.raises(ValueError):
+        r1.choice_batch([], batch_size)
+
+
+def test_weighted_choice_batch(batch_size):
+    r1, r2 = _seeded_pair()
+    choices = {Gender.MALE: 0.1, Gender.FEMALE: 0.9, None: 0}
+    result = r1.weighted_choice_batch(choices, batch_size)
+    assert len(result) == batch_size
+    assert None not in result
+    assert result.count(Gender.FEMALE) > result.count(Gender.MALE)
+    assert result == r2.weighted_choice_batch(choices, batch_size)
+
+    r1, r2 = _seeded_pair()
+    sampler = WeightedSampler(choices)
+    assert sampler.sample_batch(r1, batch_size) == result
+    assert r2.weighted_choice_batch(sampler, batch_size) == result
+
+    with pytest.raises(ValueError):
+        r1.weighted_choice_batch({}, batch_size)
+
+
+def test_generate_string_by_mask_batch(batch_size):
+    r1, r2 = _seeded_pair()
+    result = r1.generate_string_by_mask_batch("@@-š好-##", batch_size)
+    assert len(result) == batch_size
+    for code in result:
+        chars, middle, digits = code.split("-")
+        assert chars.isalpha() and chars.isupper()
+        assert middle == "š好"
+        assert digits.isdigit()
+    assert result == r2.generate_string_by_mask_batch("@@-š好-##", batch_size)
+
+    with pytest.raises(ValueError):
+        r1.generate_string_by_mask_batch("@@", batch_size, char="@", digit="@")
+
+
+def test_batch_with_zero_size(random):
+    assert random.randint_batch(1, 2, 0) == []
+    assert random.choice_batch("ab", 0) == []
+    assert random.generate_string_by_mask_batch("@###", 0) == []
+
+
+def test_derive_seed():
+    seed = derive_seed(42, "shard", 1)
+    # Derived seeds must not change between processes and versions.
+    assert seed == 640631634921068449
+    assert seed == derive_seed(42, "shard", 1)
+    assert seed != derive_seed(42, "shard", 2)
+    assert seed != derive_seed("42", "shard", 1)
+    assert derive_seed(b"bytes") == derive_seed(b"bytes")
@@ -1,9 +1,12 @@
+import asyncio
 import csv
 import json
 import pickle
 import re
+import threading
 import unicodedata
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
@@ -11,6 +14,7 @@ import pytest
 from mimesis.enums import Gender
 from mimesis.exceptions import (
     AliasesTypeError,
+    FieldAmbiguityWarning,
     FieldArityError,
     FieldError,
     FieldNameError,
@@ -19,9 +23,10 @@ from mimesis.exceptions import (
 )
 from mimesis.keys import maybe, romanize
 from mimesis.locales import Locale
+from mimesis.providers import BaseProvider
 from mimesis.random import Random
 from mimesis.schema import Field, Fieldset, Schema
-from mimesis.types import MissingSeed
+from mimesis.types import Categorical, MissingSeed
 from tests.test_providers.patterns import DATA_PROVIDER_STR_REGEX
 
 if TYPE_CHECKING:
@@ -253,6 +258,57 @@ def test_fuzzy_lookup(localized_field):
     assert isinstance(result(), str)
 
 
+def test_fuzzy_lookup_does_not_create_providers():
+    field = Field()
+    field._fuzzy_lookup("surname")
+    assert "person" in vars(field._generic)
+    assert "address" not in vars(field._generic)
+
+
+def test_fuzzy_lookup_ambiguous_field():
+    field = Field(seed=0xFF)
+    with pytest.warns(FieldAmbiguityWarning, match="person.title, text.title"):
+        result = field._fuzzy_lookup("title")
+    assert result == field._generic.person.title
+
+
+def test_fuzzy_lookup_custom_provider():
+    class CustomProvider(BaseProvider):
+        class Meta:
+            name = "custom"
+
+        def surname(self) -> str:
+            return "custom"
+
+        def unique(self) -> str:
+            return "unique"
+
+    field = Field()
+    field._generic.add_provider(CustomProvider)
+    assert field("unique") == "unique"
+    with pytest.warns(FieldAmbiguityWarning, match="custom.surname, person.surname"):
+        assert field("surname") == "custom"
+
+    # The index of the other instances is not affected.
+    with pytest.raises(FieldError):
+        Field()("unique")
+
+
+def test_fuzzy_lookup_replaced_provider():
+    class Person(BaseProvider):
+        class Meta:
+            name = "person"
+
+        def nickname(self) -> str:
+            return "nickname"
+
+    field = Field()
+    field._generic.add_provider(Person)
+    assert field("nickname") == "nickname"
+    with pytest.raises(FieldError):
+        field("surname")
+
+
 @pytest.mark.parametrize(
     "field_name",
     [
@@ -260,6 +316,7 @@ def test_fuzzy_lookup(localized_field):
         "foo",
         "foo.bar",
         "person.surname.male",
+        "reseed",
     ],
 )
 def test_lookup_method_field_error(localized_field, field_name):
@@ -344,6 +401,63 @@ def test_schema_to_pickle(tmp_path: "Path", schema: Schema):
     assert len(data) == schema.iterations
 
 
+def test_schema_to_jsonl(tmp_path: "Path", schema: Schema):
+    file = tmp_path / "test.jsonl"
+    schema.to_jsonl(str(file), ensure_ascii=False)
+
+    lines = file.read_text("UTF-8").splitlines()
+    assert len(lines) == schema.iterations
+    assert all("id" in json.loads(line) for line in lines)
+
+    with pytest.raises(ValueError):
+        schema.to_jsonl(str(file), indent=4)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"indent": 4},
+        {"indent": "\t", "sort_keys": True},
+        {"separators": (",", ":"), "ensure_ascii": False},
+    ],
+)
+def test_schema_to_json_is_same_as_json_dump(tmp_path: "Path", kwargs):
+    field = Field(Locale.DE, seed=42)
+    schema = Schema(
+        schema=lambda: {"name": field("full_name"), "tags": {"w": field("words")}},
+        iterations=25,
+    )
+    file = tmp_path / "test.json"
+    schema.to_json(str(file), **kwargs)
+
+    field.reseed(42)
+    assert file.read_text("UTF-8") == json.dumps(schema.create(), **kwargs)
+
+
+@pytest.mark.parametrize("export", ["to_csv", "to_json", "to_jsonl"])
+def test_schema_exports_are_streamed(tmp_path: "Path", mocker, export):
+    field = Field()
+    schema = Schema(
+        schema=lambda: {"pk": field("increment"), "word": field("word")},
+        iterations=2500,
+    )
+    # Nothing should be materialized.
+    mocker.patch.object(Schema, "create", side_effect=AssertionError)
+
+    file = tmp_path / "data"
+    getattr(schema, export)(str(file))
+
+    if export == "to_csv":
+        rows = list(csv.DictReader(file.read_text("UTF-8").splitlines()))
+    elif export == "to_json":
+        rows = json.loads(file.read_text("UTF-8"))
+    else:
+        rows = [json.loads(line) for line in file.read_text("UTF-8").splitlines()]
+
+    assert [int(row["pk"]) for row in rows] == list(range(1, 2501))
+
+
 @pytest.mark.parametrize(
     "seed",
     [
@@ -554,3 +668,457 @@ def test_field_invalid_aliases(default_field, aliases):
 
     with pytest.raises(AliasesTypeError):
         default_field._validate_aliases()
+
+
+@pytest.fixture
+def schema_definition():
+    return {
+        "pk": "increment",
+        "name": ("person.name", {"gender": Gender.FEMALE}),
+        "email": ("email", {}, str.upper),
+        "choice": ("choice", {"items": ["a", "b", "c"]}),
+        "owner": {
+            "username": "username",
+            "number": ("word", None, lambda value, random: random.randint(1, 9)),
+        },
+    }
+
+
+def test_compiled_schema_is_equivalent_to_field(schema_definition):
+    field = Field(seed=0xFF)
+    schema = Field(seed=0xFF).compile(schema_definition)
+
+    def create():
+        return {
+            "pk": field("increment"),
+            "name": field("person.name", gender=Gender.FEMALE),
+            "email": field("email", key=str.upper),
+            "choice": field("choice", items=["a", "b", "c"]),
+            "owner": {
+                "username": field("username"),
+                "number": field("word", key=lambda value, random: random.randint(1, 9)),
+            },
+        }
+
+    assert schema.create(20) == [create() for _ in range(20)]
+
+
+def test_compiled_schema_columns(schema_definition):
+    schema = Field().compile(schema_definition)
+    columns = schema.columns(50)
+
+    assert list(columns) == list(schema_definition)
+    assert all(len(column) == 50 for column in columns.values())
+    assert columns["pk"] == list(range(1, 51))
+    assert all(email.isupper() for email in columns["email"])
+    assert set(columns["choice"]) <= {"a", "b", "c"}
+    assert all(1 <= owner["number"] <= 9 for owner in columns["owner"])
+
+
+def test_compiled_schema_categorical_columns():
+    definition = {
+        "gender": "person.gender",
+        "name": ("person.name", {"gender": Gender.MALE}),
+        "upper": ("person.gender", {}, str.upper),
+        "word": "word",
+    }
+    columns = Field(seed=1).compile(definition).columns(100, categorical=True)
+    expected = Field(seed=1).compile(definition).columns(100)
+
+    assert isinstance(columns["gender"], Categorical)
+    assert isinstance(columns["name"], Categorical)
+    assert isinstance(columns["upper"], list)
+    assert isinstance(columns["word"], list)
+    assert columns["gender"].decode() == expected["gender"]
+    assert columns["name"].decode() == expected["name"]
+
+
+def test_compiled_schema_to_arrow_is_same_as_columns():
+    pytest.importorskip("pyarrow")
+    definition = {"gender": "person.gender", "os": "os", "flag": "boolean"}
+    batch = Field(seed=1).compile(definition).to_arrow(50)
+    assert batch.to_pydict() == Field(seed=1).compile(definition).columns(50)
+
+
+def test_compiled_schema_reseed(schema_definition):
+    schema = Field().compile(schema_definition)
+    schema.reseed(42)
+    result = schema.create(5)
+    schema.reseed(42)
+    for a, b in zip(schema.create(5), result):
+        assert a["pk"] != b["pk"]
+        assert a["name"] == b["name"]
+        assert a["owner"] == b["owner"]
+
+
+def test_compiled_schema_with_handler():
+    field = Field()
+    field.register_handler("my_field", my_field_handler)
+    schema = field.compile({"value": ("my_field", {"a": "x", "c": "x"})})
+    assert schema() == {"value": "x"}
+    assert schema.columns(2) == {"value": ["x", "x"]}
+
+
+def test_compiled_schema_with_aliases():
+    field = Field()
+    field.aliases = {"🇺🇸": "country_code"}
+    schema = field.compile({"code": "🇺🇸"})
+    assert len(schema()["code"]) == 2
+
+
+def test_compiled_schema_in_schema(schema_definition):
+    schema = Schema(Field().compile(schema_definition), iterations=5)
+    assert len(schema.create()) == 5
+
+
+def _generate_in_threads(field, names, field_name="email"):
+    results = {}
+
+    def generate():
+        name = threading.current_thread().name
+        results[name] = [field(field_name) for _ in range(100)]
+
+    threads = [threading.Thread(target=generate, name=name) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_thread_safe_field():
+    field = Field(seed=0xFF, thread_safe=True)
+    assert field.thread_safe
+    assert not Field().thread_safe
+    # The thread which created the field uses the seed itself.
+    regular = Field(seed=0xFF)
+    assert [field("name") for _ in range(10)] == [regular("name") for _ in range(10)]
+
+
+def test_thread_safe_field_threads():
+    names = ["worker-1", "worker-2", "worker-3"]
+    results = _generate_in_threads(Field(seed=0xFF, thread_safe=True), names)
+    assert results == _generate_in_threads(Field(seed=0xFF, thread_safe=True), names)
+    assert len({tuple(values) for values in results.values()}) == len(names)
+
+    other = _generate_in_threads(Field(seed=0xAA, thread_safe=True), names)
+    assert results != other
+
+
+def test_thread_safe_field_increment():
+    field = Field(seed=3, thread_safe=True)
+    names = [f"worker-{i}" for i in range(4)]
+    results = _generate_in_threads(field, names, "increment")
+    ids = [value for values in results.values() for value in values]
+    assert sorted(ids) == list(range(1, 401))
+    assert field("increment") == 401
+
+    clone = pickle.loads(pickle.dumps(field))
+    results = _generate_in_threads(clone, names, "increment")
+    ids = [value for values in results.values() for value in values]
+    assert sorted(ids) == list(range(402, 802))
+
+
+def test_thread_safe_field_reseed():
+    field = Field(seed=0xFF, thread_safe=True)
+    before = _generate_in_threads(field, ["worker"])
+    field.reseed(0xAA)
+    assert field("name") == Field(seed=0xAA)("name")
+    field.reseed(0xFF)
+    assert _generate_in_threads(field, ["worker"]) == before
+
+
+def test_thread_safe_field_pickle():
+    field = Field(seed=0xFF, thread_safe=True)
+    clone = pickle.loads(pickle.dumps(field))
+    assert clone.thread_safe
+    assert clone("name") == field("name")
+
+
+def test_thread_safe_fieldset():
+    fieldset = Fieldset(seed=0xFF, thread_safe=True, i=3)
+    assert fieldset("name") == Fieldset(seed=0xFF, i=3)("name")
+
+
+def test_compiled_schema_pickle(schema_definition):
+    del schema_definition["owner"]
+    schema = Field(seed=1).compile(schema_definition)
+    clone = pickle.loads(pickle.dumps(schema))
+    assert clone.create(5) == schema.create(5)
+
+
+@pytest.mark.parametrize(
+    "definition, error",
+    [
+        ({"a": "nil"}, FieldError),
+        ({"a": None}, FieldError),
+        ({"a": ("email", {}, None, None)}, TypeError),
+        ({"a": ["email"]}, TypeError),
+        (["email"], TypeError),
+    ],
+)
+def test_compiled_schema_raises(definition, error):
+    with pytest.raises(error):
+        Field().compile(definition)
+
+
+@pytest.fixture
+def parallel_schema(monkeypatch):
+    monkeypatch.setattr(Schema, "shard_size", 7)
+    compiled = Field(seed=0xFF).compile(
+        {"name": "person.name", "email": ("email", {}, str.upper), "word": "word"}
+    )
+    return Schema(schema=compiled, iterations=30)
+
+
+def test_schema_create_parallel_is_reproducible(parallel_schema):
+    result = parallel_schema.create_parallel(workers=1)
+    assert len(result) == 30
+    assert parallel_schema.create_parallel(workers=1) == result
+    assert parallel_schema.create_parallel(workers=2) == result
+    assert parallel_schema.create_parallel(workers=3, ordered=False) != []
+
+
+def test_schema_create_parallel_unordered(parallel_schema):
+    result = parallel_schema.create_parallel(workers=2, ordered=False)
+    expected = parallel_schema.create_parallel(workers=1)
+    assert sorted(map(str, result)) == sorted(map(str, expected))
+
+
+def test_schema_create_parallel_seed(parallel_schema):
+    result = parallel_schema.create_parallel(workers=1, seed=1)
+    assert parallel_schema.create_parallel(workers=1, seed=1) == result
+    assert parallel_schema.create_parallel(workers=1, seed=2) != result
+    assert parallel_schema.create_parallel(workers=1) != result
+
+
+def test_schema_iterator_parallel_close(parallel_schema):
+    iterator = parallel_schema.iterator_parallel(workers=2)
+    assert len([next(iterator) for _ in range(3)]) == 3
+    iterator.close()
+
+
+def test_schema_create_parallel_requires_compiled_schema(schema):
+    with pytest.raises(TypeError):
+        schema.create_parallel(workers=1)
+
+
+@pytest.fixture
+def seeded_field():
+    return Field(seed=0xFF)
+
+
+def test_field_seek(seeded_field):
+    field = seeded_field
+    field.seek(40_000_000)
+    values = [field("name"), field("email"), field("word")]
+    field("city")
+    field.seek(40_000_000)
+    assert [field("name"), field("email"), field("word")] == values
+
+    other = Field(seed=0xFF)
+    other("address.city")
+    other.seek(40_000_000)
+    assert [other("name"), other("email"), other("word")] == values
+
+    field.seek(40_000_001)
+    assert [field("name"), field("email"), field("word")] != values
+
+
+def test_field_seek_requires_seed(monkeypatch):
+    # The pytest-randomly hook of mimesis sets the global seed.
+    monkeypatch.setattr("mimesis.random.global_seed", MissingSeed)
+    with pytest.raises(ValueError):
+        Field().seek(1)
+
+
+def test_compiled_schema_row(seeded_field):
+    compiled = seeded_field.compile({"name": "name", "word": "word"})
+    row = compiled.row(1000)
+    compiled.create(5)
+    assert compiled.row(1000) == row
+    assert compiled.row(1001) != row
+
+
+@pytest.fixture
+def counter_schema(monkeypatch, seeded_field):
+    monkeypatch.setattr(Schema, "shard_size", 7)
+    compiled = seeded_field.compile(
+        {"name": "person.name", "email": ("email", {}, str.upper), "word": "word"}
+    )
+    return Schema(schema=compiled, iterations=30, counter_based=True)
+
+
+def test_schema_counter_based(counter_schema):
+    rows = counter_schema.create()
+    assert len(rows) == 30
+    assert counter_schema.create() == rows
+    assert list(counter_schema) == rows
+    assert [counter_schema.row(i) for i in (29, 3, 17)] == [
+        rows[29],
+        rows[3],
+        rows[17],
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_schema_counter_based_parallel(counter_schema, workers):
+    rows = counter_schema.create()
+    assert counter_schema.create_parallel(workers=workers) == rows
+    assert counter_schema.create_parallel(workers=workers, seed=1) != rows
+
+
+def test_schema_counter_based_aiter(counter_schema):
+    rows = asyncio.run(_collect(counter_schema.aiter(batch_size=4)))
+    assert rows == counter_schema.create()
+
+
+@pytest.mark.parametrize("index", [-1, 30])
+def test_schema_row_out_of_range(counter_schema, index):
+    with pytest.raises(IndexError):
+        counter_schema.row(index)
+
+
+def test_schema_row_requires_counter_based(schema):
+    with pytest.raises(TypeError):
+        schema.row(0)
+    with pytest.raises(TypeError):
+        Schema(schema=schema.create, counter_based=True)
+
+
+async def _collect(rows, limit=None):
+    result = []
+    async for row in rows:
+        result.append(row)
+        if len(result) == limit:
+            break
+    return result
+
+
+def _async_schema(iterations=25):
+    field = Field(seed=0xFF)
+    return Schema(
+        schema=lambda: {"name": field("name"), "pk": field("increment")},
+        iterations=iterations,
+    )
+
+
+@pytest.mark.parametrize("batch_size, maxsize", [(1, 1), (7, 2), (100, 3)])
+def test_schema_aiter(batch_size, maxsize):
+    rows = asyncio.run(_collect(_async_schema().aiter(batch_size, maxsize)))
+    assert rows == _async_schema().create()
+
+
+def test_schema_aiter_executor():
+    with ThreadPoolExecutor(2) as executor:
+        rows = asyncio.run(_collect(_async_schema().aiter(3, executor=executor)))
+    assert rows == _async_schema().create()
+
+
+def test_schema_aiter_close():
+    rows = asyncio.run(_collect(_async_schema(iterations=1000).aiter(10), limit=15))
+    assert rows == _async_schema().create()[:15]
+
+
+def test_schema_aiter_backpressure():
+    calls = []
+
+    def row():
+        calls.append(threading.current_thread().name)
+        return len(calls)
+
+    async def consume():
+        rows = Schema(schema=row, iterations=100).aiter(batch_size=5, maxsize=2)
+        assert await rows.__anext__() == 1
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        await rows.aclose()
+
+    asyncio.run(consume())
+    # One batch is consumed, two are queued and one more waits for the queue.
+    assert len(calls) <= 20
+    assert all(name.startswith("mimesis-aiter") for name in calls)
+
+
+def test_schema_aiter_raises():
+    def row():
+        raise KeyError("boom")
+
+    with pytest.raises(KeyError, match="boom"):
+        asyncio.run(_collect(Schema(schema=row, iterations=10).aiter()))
+
+
+@pytest.mark.parametrize("batch_size, maxsize", [(0, 1), (1, 0)])
+def test_schema_aiter_invalid(batch_size, maxsize):
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(_async_schema().aiter(batch_size, maxsize)))
+
+
+@pytest.fixture
+def typed_schema():
+    return Field(seed=42).compile(
+        {
+            "pk": "increment",
+            "number": "numeric.integer_number",
+            "float": "numeric.float_number",
+            "created": "datetime.datetime",
+            "gender": "person.gender",
+            "name": "person.full_name",
+            "owner": {"email": "email"},
+        }
+    )
+
+
+def test_compiled_schema_to_arrow(typed_schema):
+    pa = pytest.importorskip("pyarrow")
+    batch = typed_schema.to_arrow(20)
+
+    assert batch.num_rows == 20
+    assert batch.schema.field("pk").type == pa.int64()
+    assert batch.schema.field("number").type == pa.int64()
+    assert batch.schema.field("float").type == pa.float64()
+    assert batch.schema.field("created").type == pa.timestamp("us")
+    assert batch.schema.field("gender").type == pa.dictionary(pa.int32(), pa.string())
+    assert batch.schema.field("name").type == pa.string()
+    assert pa.types.is_struct(batch.schema.field("owner").type)
+
+
+def test_compiled_schema_to_numpy(typed_schema):
+    np = pytest.importorskip("numpy")
+    array = typed_schema.to_numpy(20)
+
+    assert array.shape == (20,)
+    assert array["pk"].dtype == np.int64
+    assert array["float"].dtype == np.float64
+    assert array["created"].dtype == np.dtype("datetime64[us]")
+    assert array["gender"].dtype.kind == "U"
+    assert array["owner"].dtype == object
+    assert "email" in array["owner"][0]
+
+
+def test_schema_to_parquet(tmp_path: "Path", typed_schema, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(Schema, "batch_size", 7)
+    file = tmp_path / "data.parquet"
+    Schema(schema=typed_schema, iterations=30).to_parquet(str(file))
+
+    table = pq.read_table(file)
+    assert table.num_rows == 30
+    assert table.column("pk").to_pylist() == list(range(1, 31))
+    assert table.schema.field("gender").type.value_type == "string"
+
+
+def test_columnar_output_requires_dependencies(typed_schema, monkeypatch):
+    monkeypatch.setattr("mimesis.compat.pyarrow", None)
+    monkeypatch.setattr("mimesis.compat.numpy", None)
+
+    with pytest.raises(ImportError):
+        typed_schema.to_arrow()
+
+    with pytest.raises(ImportError):
+        typed_schema.to_numpy()
+
+
+def test_schema_to_parquet_requires_compiled_schema(tmp_path: "Path", schema):
+    with pytest.raises(TypeError):
+        schema.to_parquet(str(tmp_path / "data.parquet"))